@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+SEN Trading System - Headless GUI benchmark.
+
+Drives the real Tk widgets in a mapped window of fixed size (under Xvfb
+when no display is available) with N strategies and M profit points, and
+reports per-refresh latency percentiles, widget and figure counts and RSS
+over a sustained run. With the threaded chart, the time until the worker
+has rendered each refresh's frame is reported as chart_frame, and one
+pass of the 20 Hz sparkline timer, with an open trade on every strategy
+and every symbol quoted, as sparklines. Results are
+compared against a stored baseline; any p95 latency above baseline *
+(1 + tolerance), or widgets/figures growing over the run, fails with exit
+code 1, and so does a sparklines p95 longer than SPARKLINE_INTERVAL or a
+missing baseline or one recorded with different N/M.
+
+    python benchmarks/gui_benchmark.py --strategies 500 --points 100000
+    python benchmarks/gui_benchmark.py --save-baseline
+"""
+
+import argparse
+import gc
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import numpy as np
+import config
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+STATUSES = ['ACTIVE', 'INACTIVE', 'PAUSED']
+WINDOW_GEOMETRY = '1400x900+0+0'
+SCENARIOS = ('main_update_display', 'chart_frame', 'sparklines', 'strategy_list_update',
+             'strategy_screen_load', 'screen_switch')
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--strategies', type=int, default=500, help="number of strategies (N)")
+    parser.add_argument('--points', type=int, default=10000, help="number of profit points (M)")
+    parser.add_argument('--iterations', type=int, default=200, help="refreshes per scenario per round")
+    parser.add_argument('--duration', type=float, default=30.0, help="sustained run length in seconds")
+    parser.add_argument('--tick-rate', type=int, default=config.SIM_TICKS_PER_SECOND,
+                        help="simulated feed ticks per second during the run")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true', help="store this run as the baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed p95 slowdown relative to the baseline")
+    parser.add_argument('--json', help="also write the results to this file")
+    return parser.parse_args()
+
+def ensure_display():
+    """Start a private Xvfb server when there is no display; returns the process."""
+    if os.environ.get('DISPLAY'):
+        return None
+    xvfb = shutil.which('Xvfb')
+    if not xvfb:
+        sys.exit("No $DISPLAY and Xvfb is not installed; install xvfb or run under xvfb-run")
+    display = ':%d' % (90 + os.getpid() % 100)
+    process = subprocess.Popen([xvfb, display, '-screen', '0', '1600x1200x24', '-nolisten', 'tcp'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ['DISPLAY'] = display
+    return process
+
+def rss_mb():
+    """Current resident set size in MB."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def count_widgets(widget):
+    """Count a widget and all of its descendants."""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+def count_figures():
+    """Count live matplotlib figures, whether or not pyplot tracks them."""
+    from matplotlib.figure import Figure
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, Figure))
+
+def percentiles(samples):
+    """Latency summary in milliseconds."""
+    values = np.asarray(samples) * 1000
+    return {
+        'count': len(values),
+        'p50': float(np.percentile(values, 50)),
+        'p95': float(np.percentile(values, 95)),
+        'p99': float(np.percentile(values, 99)),
+        'max': float(values.max()),
+    }
+
+def timed(samples, func, *args):
+    """Call func and record its duration; Tk idle work is flushed inside the timing."""
+    start = time.perf_counter()
+    func(*args)
+    root.update_idletasks()
+    samples.append(time.perf_counter() - start)
+
+def make_strategies(count):
+    """Generate benchmark strategies."""
+    from src.models.trading_data import Strategy
+    symbols = config.FEED_SYMBOLS
+    timeframes = ['M1', 'M5', 'M15', 'M30', 'H1', 'H4', 'D1']
+    rng = np.random.default_rng(42)
+    return [Strategy(id=f"B{i}", name=f"L_CHANNEL_{symbols[i % len(symbols)]}_{timeframes[i % 7]}_{i}",
+                     symbol=symbols[i % len(symbols)], timeframe=timeframes[i % 7],
+                     status=STATUSES[i % 3], profit=float(rng.normal(0, 50)),
+                     trades_count=int(rng.integers(0, 100)))
+            for i in range(count)]
+
+def make_trades(strategies):
+    """Generate one open trade per strategy so every P&L sparkline has floating profit."""
+    from src.models.trading_data import Trade
+    now = datetime.now()
+    return [Trade(id=f"BT{i}", symbol=strategy.symbol, direction='BUY' if i % 2 else 'SELL', volume=0.01,
+                  open_price=100.0, current_price=100.0, profit=0.0, open_time=now, strategy_id=strategy.id)
+            for i, strategy in enumerate(strategies)]
+
+def make_quotes(rng):
+    """Generate one quote per feed symbol around the benchmark trades' open price."""
+    from src.models.trading_data import Tick
+    now = time.time()
+    return {symbol: Tick(symbol, bid, bid + 0.02, now)
+            for symbol, bid in zip(config.FEED_SYMBOLS, 100.0 + rng.normal(0, 0.5, len(config.FEED_SYMBOLS)))}
+
+def build_app(args):
+    """Create the application in a fixed-size window with generated data."""
+    global root
+    import tkinter as tk
+    from src.app import TradingApp
+    
+    config.DB_PATH = None  # keep the benchmark in memory
+    config.SIM_TICKS_PER_SECOND = args.tick_rate
+    root = tk.Tk()
+    app = TradingApp(root)
+    root.geometry(WINDOW_GEOMETRY)
+    
+    dm = app.data_manager
+    strategies = make_strategies(args.strategies)
+    dm.add_strategies(strategies)
+    for trade in make_trades(strategies):
+        dm.open_trade(trade)
+    now = datetime.now().timestamp()
+    dm.get_profit_history().extend(now - args.points * 60 + np.arange(args.points) * 60.0,
+                                   np.random.default_rng(7).normal(0, 5, args.points))
+    root.update()
+    return app
+
+def prepare_screen(screen):
+    """Let a newly shown screen map and lay out so its lazily built chart and table rows exist."""
+    root.geometry(WINDOW_GEOMETRY)
+    root.update()
+    root.update()  # the chart builds its figure from an idle callback queued on <Map>
+
+def wait_for_frame(samples, chart):
+    """Record how long the chart's render thread takes to finish the frame just submitted."""
+    renderer = chart.renderer
+    if renderer is None:
+        return  # drawn on the Tk thread, inside the refresh's own timing
+    start = time.perf_counter()
+    while renderer.busy:
+        time.sleep(0.0002)
+    samples.append(time.perf_counter() - start)
+
+def run_round(app, args, results):
+    """Run every scenario once, appending latency samples to results."""
+    dm = app.data_manager
+    strategies = dm.get_strategies()
+    rng = np.random.default_rng()
+    
+    # MainScreen.update_display with fresh data each refresh
+    main = app.screens.show('main')
+    prepare_screen(main)
+    main.cancel_scheduled()
+    for i in range(args.iterations):
+        for index in rng.choice(len(strategies), size=min(10, len(strategies)), replace=False):
+            dm.update_strategy_status(strategies[index].id, STATUSES[rng.integers(0, 3)])
+        dm.append_profit(float(rng.normal(0, 5)))
+        app.apply_feed()
+        timed(results['main_update_display'], main.update_display)
+        wait_for_frame(results['chart_frame'], main.profit_chart)
+        main.cancel_scheduled()
+    
+    # MainScreen.update_sparklines, the 20 Hz pass, after every symbol was repriced
+    for i in range(args.iterations):
+        dm.apply_ticks(make_quotes(rng))
+        timed(results['sparklines'], main.update_sparklines)
+        main.cancel_scheduled()
+    
+    # StrategyList.update_strategies with the full list
+    for i in range(args.iterations):
+        strategies[i % len(strategies)].profit += 1.0
+        timed(results['strategy_list_update'], main.strategy_list.update_strategies, strategies)
+    
+    # StrategyScreen.load_strategies
+    strategy_screen = app.screens.show('strategy')
+    prepare_screen(strategy_screen)
+    for i in range(args.iterations):
+        strategies[i % len(strategies)].trades_count += 1
+        timed(results['strategy_screen_load'], strategy_screen.load_strategies)
+    
+    # TradingApp screen switches
+    for i in range(max(10, args.iterations // 10)):
+        for show in (app.show_main_screen, app.show_settings_screen, app.show_strategy_screen):
+            timed(results['screen_switch'], show)
+
+def compare(report, baseline, tolerance):
+    """List regressions of this run against a baseline report."""
+    failures = []
+    for name, stats in report['latency'].items():
+        reference = baseline.get('latency', {}).get(name)
+        if reference and stats['p95'] > reference['p95'] * (1 + tolerance):
+            failures.append(f"{name}: p95 {stats['p95']:.2f} ms > baseline "
+                            f"{reference['p95']:.2f} ms (+{tolerance:.0%})")
+    sparklines = report['latency'].get('sparklines')
+    if sparklines and sparklines['p95'] > config.SPARKLINE_INTERVAL:
+        failures.append(f"sparklines: p95 {sparklines['p95']:.2f} ms does not fit the "
+                        f"{config.SPARKLINE_INTERVAL} ms sparkline interval")
+    for name in ('widgets', 'figures'):
+        start, end = report['resources'][name]
+        if end > start:
+            failures.append(f"{name} grew during the run: {start} -> {end}")
+    return failures
+
+def load_baseline(args):
+    """Read the baseline to compare against, exiting when it is missing or recorded with other N/M."""
+    if not os.path.exists(args.baseline):
+        sys.exit(f"No baseline at {args.baseline}; record one with --save-baseline")
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    params = baseline.get('params', {})
+    if (params.get('strategies'), params.get('points')) != (args.strategies, args.points):
+        sys.exit(f"Baseline {args.baseline} was recorded with N={params.get('strategies')}, "
+                 f"M={params.get('points')}, not N={args.strategies}, M={args.points}; "
+                 f"pass the same --strategies/--points or record a new one with --save-baseline")
+    return baseline
+
+def main():
+    args = parse_args()
+    baseline = None if args.save_baseline else load_baseline(args)
+    xvfb = ensure_display()
+    try:
+        app = build_app(args)
+        results = {name: [] for name in SCENARIOS}
+        
+        # Warm-up round builds every screen and figure once
+        run_round(app, args, {name: [] for name in results})
+        gc.collect()
+        widgets_start, figures_start, rss_start = count_widgets(root), count_figures(), rss_mb()
+        
+        deadline = time.perf_counter() + args.duration
+        rounds = 0
+        while rounds == 0 or time.perf_counter() < deadline:
+            run_round(app, args, results)
+            rounds += 1
+        
+        gc.collect()
+        report = {
+            'params': {'strategies': args.strategies, 'points': args.points,
+                       'iterations': args.iterations, 'rounds': rounds},
+            'latency': {name: percentiles(samples) for name, samples in results.items() if samples},
+            'resources': {
+                'widgets': [widgets_start, count_widgets(root)],
+                'figures': [figures_start, count_figures()],
+                'rss_mb': [round(rss_start, 1), round(rss_mb(), 1)],
+            },
+        }
+        app.feed.stop()
+        app.data_manager.close()
+        root.destroy()
+    finally:
+        if xvfb:
+            xvfb.terminate()
+    
+    print(f"N={args.strategies} strategies, M={args.points} profit points, {rounds} rounds")
+    print(f"{'scenario':<24}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, stats in report['latency'].items():
+        print(f"{name:<24}{stats['count']:>7}{stats['p50']:>10.2f}{stats['p95']:>10.2f}"
+              f"{stats['p99']:>10.2f}{stats['max']:>10.2f}")
+    for name, (start, end) in report['resources'].items():
+        print(f"{name:<24}{start:>10} -> {end}")
+    
+    if args.json:
+        with open(args.json, 'w') as handle:
+            json.dump(report, handle, indent=2)
+    
+    if args.save_baseline:
+        with open(args.baseline, 'w') as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    
+    failures = compare(report, baseline, args.tolerance)
+    if failures:
+        print("\nREGRESSION")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print("\nOK: no regressions against baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
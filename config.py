@@ -1,5 +1,8 @@
 """Configuration settings for the trading GUI application."""
 
+import os
+import tempfile
+
 # Application settings
 APP_TITLE = "SEN TRADING SYSTEM"
 APP_VERSION = "1.0.0"
@@ -10,6 +13,7 @@ MIN_WINDOW_SIZE = (800, 600)
 COLORS = {
     'bg_primary': '#f0f0f0',
     'bg_secondary': '#e8e8e8', 
+    'bg_selected': '#cdeeec',
     'accent': '#20b2aa',
     'text_primary': '#333333',
     'text_secondary': '#666666',
@@ -23,7 +27,68 @@ DEFAULT_BALANCE = 1215
 DEFAULT_EQUITY = 345
 MAX_TRADES = 5
 MAX_LOSS_PERCENT = 3
+ACCOUNT_LEVERAGE = 100
+CONTRACT_SIZES = {"XAUUSD": 100, "BTCUSD": 1, "EURUSD": 100000, "GBPUSD": 100000, "USDJPY": 1000}
 
 # Chart settings
-CHART_UPDATE_INTERVAL = 1000  # milliseconds
-DEFAULT_TIMEFRAME = "M5"
\ No newline at end of file
+CHART_UPDATE_INTERVAL = 1000  # milliseconds, fastest dashboard refresh rate
+REFRESH_FRAME_BUDGET = 16  # milliseconds of refresh work before yielding to input
+REFRESH_UNFOCUSED_FACTOR = 4  # refresh this many times slower without focus
+STATUS_MESSAGE_TIMEOUT = 5000  # milliseconds an inline status message stays visible
+CHART_BAR_COUNT = 7  # histories up to this length are shown as bars
+CHART_LOD_CACHE_SIZE = 8  # downsampled zoom levels kept per chart
+FIGURE_POOL_SIZE = 4  # released chart figures and canvases kept for reuse
+CHART_RENDER_THREADED = True  # rasterize the profit chart on a worker thread
+CHART_RENDER_DPI = 100
+CHART_RENDER_POLL_INTERVAL = 15  # milliseconds between checks for a finished frame
+SPARKLINE_LENGTH = 120  # points per sparkline before the oldest scroll off
+SPARKLINE_INTERVAL = 50  # milliseconds between sparkline samples while quotes arrive (20 Hz)
+PROFIT_HISTORY_CAPACITY = 100000  # points kept in the profit ring buffer
+DEFAULT_TIMEFRAME = "M5"
+TIMEFRAMES = {"M1": 60, "M5": 300, "M15": 900, "M30": 1800, "H1": 3600, "H4": 14400, "D1": 86400}
+BAR_HISTORY_LENGTH = 5000  # completed live bars kept per symbol and timeframe
+
+# Persistence settings
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sen_trading.db")  # None keeps data in memory
+DB_WRITER_QUEUE_SIZE = 4096  # pending save calls before new rows are dropped
+DB_TICK_RETENTION = 24 * 3600  # seconds of raw ticks kept in the database; None keeps them all
+DB_TICK_PRUNE_INTERVAL = 60  # seconds between deletions of expired ticks
+CHART_HISTORY_DAYS = 30  # profit history window loaded at startup
+HISTORY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history")  # None disables
+HISTORY_CAPACITY = 65536  # initial bars per history file; files double as they fill
+
+# Market feed settings
+FEED_SYMBOLS = ["XAUUSD", "BTCUSD", "EURUSD", "GBPUSD", "USDJPY"]
+FEED_QUEUE_SIZE = 256  # tick batches buffered between feed thread and GUI
+FEED_DRAIN_INTERVAL = 50  # milliseconds between GUI drains
+SIM_TICKS_PER_SECOND = 50  # raise to load-test the GUI (thousands are fine)
+
+# Instrumentation settings (enable with run.py --profile or SEN_PROFILE=1)
+PROFILE_WINDOW = 512  # recent samples kept per section for percentiles
+PROFILE_TRACE_EVENTS = 200000  # events kept for Chrome trace export
+
+# Backtest settings (channel breakout defaults)
+BACKTEST_YEARS = 2
+BACKTEST_ENTRY_PERIOD = 20  # bars in the breakout channel
+BACKTEST_EXIT_PERIOD = 10  # bars in the exit channel
+BACKTEST_STOP_LOSS = 0.01  # fraction of the entry price
+BACKTEST_VOLUME = 0.01  # lots per trade
+
+# Parameter sweep settings
+SWEEP_ENTRY_PERIODS = (10, 20, 40, 55)
+SWEEP_EXIT_PERIODS = (5, 10, 20)
+SWEEP_STOP_LOSSES = (0.0, 0.005, 0.01, 0.02)
+SWEEP_TIMEFRAMES = ("M5", "M15", "H1", "H4")
+SWEEP_WORKERS = None  # None uses every CPU core
+SWEEP_CHUNK_SIZE = 4  # parameter sets per worker task
+SWEEP_DRAIN_INTERVAL = 100  # milliseconds
+
+# Export/import settings
+HISTORY_CHUNK_SIZE = 50000  # rows per streamed chunk and per import transaction
+HISTORY_JOB_POLL_INTERVAL = 100  # milliseconds
+
+# Engine settings (python engine.py, then run.py --engine)
+ENGINE_SOCKET = os.path.join(tempfile.gettempdir(), "sen_engine.sock")
+ENGINE_CLIENT_BUFFER = 8 * 1024 * 1024  # bytes a client may fall behind before it is dropped
+ENGINE_RECONNECT_INTERVAL = 1000  # milliseconds between client reconnect attempts
+ENGINE_CONNECT_TIMEOUT = 5.0  # seconds a client waits to connect and for the snapshot
\ No newline at end of file
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+SEN Trading System - Engine
+Runs the data layer and market feed without a GUI, serving trading GUIs
+started with ``run.py --engine`` over a Unix socket.
+
+Usage: python engine.py [--socket PATH]
+"""
+
+import argparse
+import logging
+import os
+import signal
+import sys
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, project_root)
+
+import config
+from src.utils.data_manager import DataManager
+from src.utils.engine_server import EngineServer
+from src.utils.market_feed import MarketFeed, SimulatedMT5Source
+
+def main():
+    """Serve the engine until interrupted."""
+    parser = argparse.ArgumentParser(description="Headless SEN trading engine")
+    parser.add_argument('--socket', default=config.ENGINE_SOCKET, help="Unix socket path to listen on")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    
+    data_manager = DataManager(config.DB_PATH)
+    feed = MarketFeed(SimulatedMT5Source(), on_batch=data_manager.record_ticks)
+    server = EngineServer(args.socket, data_manager, feed)
+    signal.signal(signal.SIGTERM, lambda signum, frame: server.stop())
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as exc:
+        sys.exit(str(exc))
+    finally:
+        data_manager.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -10,10 +10,12 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.app import TradingApp
 
-def main():
-    """Initialize and run the trading application."""
+def main(on_ready=None, engine_socket=None):
+    """Initialize and run the trading application, optionally as a client of an engine."""
     root = tk.Tk()
-    app = TradingApp(root)
+    app = TradingApp(root, engine_socket)
+    if on_ready:
+        on_ready(root)
     app.run()
 
 if __name__ == "__main__":
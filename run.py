@@ -2,8 +2,19 @@
 """
 SEN Trading System - Run Script
 Simple launcher for the trading GUI application.
+
+Pass --startup-report to print an import-time breakdown and the time to
+the first drawn frame instead of running the application, or --profile to
+enable hot-path instrumentation (overlay in the MT5 TERMINAL panel and
+File > Export Trace...).
+
+Pass --engine [SOCKET] to attach to a running engine (python engine.py)
+instead of running the data layer and market feed in this process.
 """
 
+import time
+START_TIME = time.perf_counter()
+
 import sys
 import os
 
@@ -14,7 +25,18 @@ sys.path.insert(0, project_root)
 try:
     from main import main
     if __name__ == "__main__":
-        main()
+        if '--startup-report' in sys.argv[1:]:
+            from src.utils.startup_profiler import startup_report
+            sys.exit(startup_report(os.path.abspath(__file__), START_TIME))
+        if '--profile' in sys.argv[1:]:
+            from src.utils.instrumentation import profiler
+            profiler.enable()
+        engine_socket = None
+        if '--engine' in sys.argv[1:]:
+            import config
+            following = sys.argv[sys.argv.index('--engine') + 1:]
+            engine_socket = following[0] if following and not following[0].startswith('--') else config.ENGINE_SOCKET
+        main(engine_socket=engine_socket)
 except ImportError as e:
     print(f"Import error: {e}")
     print("Please ensure all dependencies are installed: pip install -r requirements.txt")
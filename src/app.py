@@ -1,21 +1,36 @@
 """Main application class for the SEN Trading System."""
 
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, filedialog
 import config
-from src.screens.main_screen import MainScreen
-from src.screens.settings_screen import SettingsScreen
-from src.screens.strategy_screen import StrategyScreen
+from src.screens.screen_manager import ScreenManager
+from src.utils.data_manager import DataManager
+from src.utils.figure_pool import figure_pool
+from src.utils.instrumentation import profiler
+from src.utils.market_feed import MarketFeed, SimulatedMT5Source
+from src.utils.refresh_scheduler import RefreshScheduler
+
+# Tables offered in the File > Export and File > Import menus
+HISTORY_DATASETS = [('trades', "Trades"), ('strategies', "Strategies"),
+                    ('profit_history', "Profit History"), ('ticks', "Ticks")]
+HISTORY_FILETYPES = [("CSV", "*.csv"), ("Parquet", "*.parquet")]
 
 class TradingApp:
     """Main trading application controller."""
     
-    def __init__(self, root):
+    def __init__(self, root, engine_socket: str = None):
         self.root = root
-        self.current_screen = None
+        if engine_socket:
+            from src.utils.engine_client import EngineClient, RemoteDataManager
+            self.data_manager = RemoteDataManager(EngineClient(engine_socket))
+        else:
+            self.data_manager = DataManager(config.DB_PATH)
+        self.scheduler = RefreshScheduler(root)
         self.setup_window()
         self.create_menu()
+        self.create_screens()
         self.show_main_screen()
+        self.start_feed()
     
     def setup_window(self):
         """Configure the main window."""
@@ -38,6 +53,22 @@ class TradingApp:
         # File menu
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
+        if self.data_manager.store:
+            export_menu = tk.Menu(file_menu, tearoff=0)
+            import_menu = tk.Menu(file_menu, tearoff=0)
+            for name, label in HISTORY_DATASETS:
+                export_menu.add_command(label=f"{label}...", command=lambda name=name, label=label:
+                                        self.export_history(name, label))
+                import_menu.add_command(label=f"{label}...", command=lambda name=name, label=label:
+                                        self.import_history(name, label))
+            if config.HISTORY_DIR:
+                import_menu.add_separator()
+                import_menu.add_command(label="MT5 Bars...", command=self.import_mt5_bars)
+            file_menu.add_cascade(label="Export", menu=export_menu)
+            file_menu.add_cascade(label="Import", menu=import_menu)
+            file_menu.add_separator()
+        if profiler.enabled:
+            file_menu.add_command(label="Export Trace...", command=self.export_trace)
         file_menu.add_command(label="Exit", command=self.root.quit)
         
         # View menu
@@ -47,26 +78,116 @@ class TradingApp:
         view_menu.add_command(label="Strategy Manager", command=self.show_strategy_screen)
         view_menu.add_command(label="Settings", command=self.show_settings_screen)
     
-    def clear_screen(self):
-        """Clear the current screen."""
-        if self.current_screen:
-            self.current_screen.destroy()
+    def export_trace(self):
+        """Save the collected instrumentation as a Chrome trace file."""
+        path = filedialog.asksaveasfilename(title="Export Trace", defaultextension=".json",
+                                            filetypes=[("Chrome trace", "*.json")])
+        if path:
+            profiler.export_chrome_trace(path)
+    
+    def export_history(self, name, label):
+        """Stream a history table to a CSV or Parquet file in the background."""
+        from src.components.widgets import JobProgressDialog
+        from src.utils.history_io import HistoryJob, export_dataset
+        path = filedialog.asksaveasfilename(title=f"Export {label}", defaultextension=".csv",
+                                            initialfile=f"{name}.csv", filetypes=HISTORY_FILETYPES)
+        if path:
+            job = HistoryJob(export_dataset, self.data_manager.store.path, name, path)
+            job.start()
+            JobProgressDialog(self.root, f"Export {label}", job)
+    
+    def import_history(self, name, label):
+        """Load a CSV or Parquet file into a history table in the background."""
+        from src.components.widgets import JobProgressDialog
+        from src.utils.history_io import HistoryJob, import_dataset
+        path = filedialog.askopenfilename(title=f"Import {label}", filetypes=HISTORY_FILETYPES)
+        if path:
+            job = HistoryJob(import_dataset, self.data_manager.store.path, name, path)
+            job.start()
+            JobProgressDialog(self.root, f"Import {label}", job,
+                              on_done=lambda job: self.data_manager.reload_history())
+    
+    def import_mt5_bars(self):
+        """Append an MT5 bar export to the price history store in the background."""
+        from src.components.widgets import JobProgressDialog
+        from src.utils.history_io import HistoryJob, import_mt5_bars
+        from src.utils.history_store import default_store
+        path = filedialog.askopenfilename(title="Import MT5 Bars",
+                                          filetypes=[("MT5 bar export", "*.csv"), ("All files", "*")])
+        if path:
+            job = HistoryJob(import_mt5_bars, default_store(), path)
+            job.start()
+            JobProgressDialog(self.root, "Import MT5 Bars", job)
+    
+    def create_screens(self):
+        """Register the application screens; each is built on first use."""
+        self.screens = ScreenManager(self.root)
+        self.screens.register('main', self.build_main_screen)
+        self.screens.register('strategy', self.build_strategy_screen)
+        self.screens.register('settings', self.build_settings_screen)
+    
+    # Screen modules are imported on first use so startup only pays for the visible one
+    def build_main_screen(self):
+        """Build the main trading dashboard."""
+        from src.screens.main_screen import MainScreen
+        return MainScreen(self.root, self.data_manager, self.scheduler)
+    
+    def build_strategy_screen(self):
+        """Build the strategy management screen."""
+        from src.screens.strategy_screen import StrategyScreen
+        return StrategyScreen(self.root, self.data_manager, self.scheduler)
+    
+    def build_settings_screen(self):
+        """Build the settings screen."""
+        from src.screens.settings_screen import SettingsScreen
+        return SettingsScreen(self.root, self.scheduler)
     
     def show_main_screen(self):
         """Display the main trading dashboard."""
-        self.clear_screen()
-        self.current_screen = MainScreen(self.root)
+        self.screens.show('main')
     
     def show_strategy_screen(self):
         """Display the strategy management screen."""
-        self.clear_screen()
-        self.current_screen = StrategyScreen(self.root)
+        self.screens.show('strategy')
     
     def show_settings_screen(self):
         """Display the settings screen."""
-        self.clear_screen()
-        self.current_screen = SettingsScreen(self.root)
+        self.screens.show('settings')
+    
+    def start_feed(self):
+        """Start the market data feed and the periodic drain into the data manager.
+        
+        With an engine the feed runs there, and only its deltas are drained here.
+        """
+        if hasattr(self.data_manager, 'sync'):
+            self.feed = None
+            self.drain_engine()
+            return
+        self.feed = MarketFeed(SimulatedMT5Source(), on_batch=self.data_manager.record_ticks)
+        self.feed.start()
+        self.drain_feed()
+    
+    def drain_feed(self):
+        """Apply the feed's pending ticks, then drain again after FEED_DRAIN_INTERVAL."""
+        self.apply_feed()
+        self.root.after(config.FEED_DRAIN_INTERVAL, self.drain_feed)
+    
+    def apply_feed(self):
+        """Hand coalesced ticks from the feed thread to the data manager once."""
+        ticks = self.feed.drain()
+        if ticks:
+            self.data_manager.apply_ticks(ticks)
+    
+    def drain_engine(self):
+        """Apply the engine's snapshots and deltas received since the last drain."""
+        self.data_manager.sync()
+        self.root.after(config.FEED_DRAIN_INTERVAL, self.drain_engine)
     
     def run(self):
         """Start the application main loop."""
-        self.root.mainloop()
\ No newline at end of file
+        self.root.mainloop()
+        if self.feed:
+            self.feed.stop()
+        self.screens.destroy_all()
+        figure_pool.clear()
+        self.data_manager.close()
\ No newline at end of file
@@ -1,10 +1,20 @@
 """Custom widgets for the trading application."""
 
+import logging
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+import numpy as np
 import config
+from src.models.time_series import PointRing
+from src.utils.downsample import minmax
+from src.utils.figure_pool import figure_pool
+from src.utils.instrumentation import profiler
+
+log = logging.getLogger(__name__)
 
 class StatCard(tk.Frame):
     """A card widget for displaying statistics."""
@@ -20,10 +30,10 @@ class StatCard(tk.Frame):
         title_label.pack(pady=(10, 0))
         
         # Value
-        value_label = tk.Label(self, text=str(value), font=('Arial', 16, 'bold'),
-                              bg=config.COLORS['bg_secondary'],
-                              fg=config.COLORS['text_primary'])
-        value_label.pack(pady=(5, 0))
+        self.value_label = tk.Label(self, text=str(value), font=('Arial', 16, 'bold'),
+                                   bg=config.COLORS['bg_secondary'],
+                                   fg=config.COLORS['text_primary'])
+        self.value_label.pack(pady=(5, 0))
         
         # Subtitle
         if subtitle:
@@ -31,44 +41,782 @@ class StatCard(tk.Frame):
                                     bg=config.COLORS['bg_secondary'],
                                     fg=config.COLORS['text_secondary'])
             subtitle_label.pack(pady=(0, 10))
+    
+    def set_value(self, value):
+        """Update the displayed value if it changed."""
+        text = str(value)
+        if self.value_label['text'] != text:
+            self.value_label.configure(text=text)
 
 class ProfitChart(tk.Frame):
-    """Chart widget for displaying profit data."""
+    """Chart widget for displaying profit data.
     
-    def __init__(self, parent, **kwargs):
+    Short histories are drawn as one bar per point. Longer histories are
+    drawn as a cumulative line, downsampled to the visible pixel width
+    with a min/max-per-column pass that is cached per zoom level; the
+    mouse wheel zooms, dragging pans and a double click resets the view.
+    The figure and canvas are borrowed from the shared figure pool and
+    returned when the chart is destroyed.
+    
+    With ``threaded`` set, matplotlib draws on a ChartRenderer worker
+    thread instead; the Tk thread only builds a description of the view and
+    pastes finished frames into a PhotoImage, so long histories never stall
+    input handling. If the worker fails to render, the chart switches to
+    drawing on the Tk thread.
+    """
+    
+    ZOOM_STEP = 1.25
+    
+    def __init__(self, parent, threaded=config.CHART_RENDER_THREADED, **kwargs):
         super().__init__(parent, **kwargs)
-        self.figure, self.ax = plt.subplots(figsize=(6, 3))
-        self.canvas = FigureCanvasTkAgg(self.figure, self)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.threaded = threaded
+        self.figure = None
+        self.connections = []
+        self.pending_series = None
+        self.series = None
+        self.mode = None
+        
+        # Persistent artists and blitting state
+        self.bar_container = None
+        self.bars = []
+        self.bar_timestamps = np.empty(0)
+        self.background = None
+        self.last_signature = None
+        
+        # Line mode: visible range in POSIX seconds (None follows the whole series)
+        self.line = None
+        self.view = None
+        self.drag_start = None
+        self.lod_cache = OrderedDict()
+        self.lod_signature = None
+        
+        # Threaded mode: worker, displayed frame and frame polling
+        self.renderer = None
+        self.photo = None
+        self.shown_generation = 0
+        self.poll_job = None
+        
+        # Placeholder until matplotlib is loaded after the first frame
+        self.placeholder = tk.Label(self, text="Loading chart...", font=('Arial', 10),
+                                   bg=config.COLORS['bg_secondary'],
+                                   fg=config.COLORS['text_secondary'])
+        self.placeholder.pack(fill=tk.BOTH, expand=True)
+        self.bind('<Map>', self._on_first_map)
+    
+    def _on_first_map(self, event):
+        """Defer building the figure until the window has been drawn once."""
+        self.unbind('<Map>')
+        self.after_idle(self._create_figure)
+    
+    def _create_figure(self):
+        """Borrow a figure from the pool and build the chart on it."""
+        if not self.winfo_exists():
+            return
+        self.placeholder.destroy()
+        if self.threaded:
+            self._create_image_canvas()
+            return
+        self.figure, self.canvas = figure_pool.acquire(self, figsize=(6, 3))
+        self.ax = self.figure.axes[0]
         
         # Style the chart
         self.figure.patch.set_facecolor(config.COLORS['bg_secondary'])
         self.ax.set_facecolor(config.COLORS['bg_secondary'])
-    
-    def update_data(self, data):
-        """Update chart with new data."""
-        self.ax.clear()
-        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        profits = [d.profit for d in data]
-        
-        bars = self.ax.bar(days, profits, color=config.COLORS['accent'])
         self.ax.set_ylabel('Profit')
         self.ax.set_title('Daily Profit/Loss')
+        self.connections = [
+            self.canvas.mpl_connect('draw_event', self._on_draw),
+            self.canvas.mpl_connect('scroll_event', self._on_scroll),
+            self.canvas.mpl_connect('button_press_event', self._on_press),
+            self.canvas.mpl_connect('motion_notify_event', self._on_motion),
+            self.canvas.mpl_connect('button_release_event', self._on_release),
+            self.canvas.mpl_connect('resize_event', self._on_resize),
+        ]
+        
+        if self.pending_series is not None:
+            self.update_data(self.pending_series)
+            self.pending_series = None
+    
+    def _create_image_canvas(self):
+        """Start the render thread and the Tk canvas that shows its frames."""
+        from src.utils.chart_renderer import ChartRenderer
+        self.renderer = ChartRenderer()
+        self.image_canvas = tk.Canvas(self, width=600, height=300, highlightthickness=0,
+                                      bg=config.COLORS['bg_secondary'])
+        self.image_canvas.pack(fill=tk.BOTH, expand=True)
+        self.image_item = self.image_canvas.create_image(0, 0, anchor='nw')
+        self.image_canvas.bind('<Configure>', self._request_render)
+        self.image_canvas.bind('<MouseWheel>', self._on_wheel)
+        self.image_canvas.bind('<Button-4>', self._on_wheel)
+        self.image_canvas.bind('<Button-5>', self._on_wheel)
+        self.image_canvas.bind('<ButtonPress-1>', self._on_image_press)
+        self.image_canvas.bind('<Double-Button-1>', self._on_image_double_click)
+        self.image_canvas.bind('<B1-Motion>', self._on_motion)
+        self.image_canvas.bind('<ButtonRelease-1>', self._on_release)
+        
+        if self.pending_series is not None:
+            self.update_data(self.pending_series)
+            self.pending_series = None
+    
+    def destroy(self):
+        """Return the figure and canvas to the pool before the widget goes away."""
+        if self.renderer is not None:
+            if self.poll_job:
+                self.after_cancel(self.poll_job)
+            self.renderer.close()
+            self.renderer = self.photo = None
+        if self.figure is not None:
+            for connection in self.connections:
+                self.canvas.mpl_disconnect(connection)
+            figure_pool.release(self.figure)
+            self.figure = self.canvas = self.ax = None
+            self.bar_container = self.line = self.background = None
+            self.bars = []
+        super().destroy()
+    
+    def update_data(self, series):
+        """Update chart with a ProfitSeries of any length."""
+        if self.figure is None and self.renderer is None:
+            self.pending_series = series
+            return
+        
+        signature = (id(series), series.version)
+        if signature == self.last_signature:
+            return
+        self.last_signature = signature
+        self.series = series
+        
+        if self.renderer is not None:
+            self.mode = 'line' if len(series) > config.CHART_BAR_COUNT else 'bars'
+            if self.mode == 'bars':
+                self.view = None
+            self._request_render()
+        elif len(series) > config.CHART_BAR_COUNT:
+            self._set_mode('line')
+            self._render_line()
+        else:
+            self._set_mode('bars')
+            self._update_bars(series)
+    
+    def _set_mode(self, mode):
+        """Switch between the bar and the downsampled line presentation."""
+        if mode == self.mode:
+            return
+        self.mode = mode
+        
+        if mode == 'line':
+            import matplotlib.dates as mdates
+            if self.bar_container is not None:
+                self.bar_container.remove()
+                self.bar_container = None
+            self.bars = []
+            self.bar_timestamps = np.empty(0)
+            if self.line is None:
+                self.line, = self.ax.plot([], [], color=config.COLORS['accent'], linewidth=1)
+            self.line.set_visible(True)
+            locator = mdates.AutoDateLocator()
+            self.ax.xaxis.set_major_locator(locator)
+            self.ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+            self.ax.set_title('Cumulative Profit/Loss')
+        else:
+            if self.line is not None:
+                self.line.set_visible(False)
+            self.view = None
+            self.ax.set_title('Daily Profit/Loss')
+    
+    def _update_bars(self, series):
+        """Update the bars in place, blitting when the axes are unchanged."""
+        timestamps, profits, _ = series.window(config.CHART_BAR_COUNT)
+        
+        if not np.array_equal(timestamps, self.bar_timestamps):
+            # Bar layout changed, rebuild the artists
+            self.bar_timestamps = timestamps.copy()
+            labels = [datetime.fromtimestamp(t).strftime('%a') for t in timestamps]
+            self._rebuild_bars(labels, profits)
+            self.canvas.draw_idle()
+            return
+        
+        for bar, profit in zip(self.bars, profits):
+            bar.set_height(profit)
+            bar.set_color(self._bar_color(profit))
+        
+        if self._limits_exceeded(profits) or self.background is None:
+            self._rescale(profits)
+            self.canvas.draw_idle()
+        else:
+            self._blit()
+    
+    def _render_line(self):
+        """Draw the visible range of the cumulative line from the LOD cache."""
+        if self.renderer is not None:
+            self._request_render()
+            return
+        x, y, low, high = self._visible_line()
+        self.line.set_data(x / 86400.0, y)
+        self.ax.set_xlim(low / 86400.0, max(high, low + 1) / 86400.0)
+        if len(y):
+            self._rescale(y, include_zero=False)
+        self.canvas.draw_idle()
+    
+    def _visible_line(self):
+        """Get the downsampled points and time range (POSIX seconds) of the current view."""
+        timestamps, _, cumulative = self.series.window()
+        first, last = timestamps[0], timestamps[-1]
+        low, high = self.view or (first, last)
+        
+        visible = max(2, int(np.searchsorted(timestamps, high, side='right')
+                             - np.searchsorted(timestamps, low)))
+        x, y = self._downsampled(timestamps, cumulative, visible)
         
-        # Color bars based on profit/loss
-        for i, bar in enumerate(bars):
-            if profits[i] < 0:
-                bar.set_color(config.COLORS['error'])
+        # Slice the cached level to the view, keeping one point beyond each edge
+        start = max(0, int(np.searchsorted(x, low)) - 1)
+        end = int(np.searchsorted(x, high, side='right')) + 1
+        return x[start:end], y[start:end], low, high
+    
+    def _request_render(self, event=None):
+        """Describe the current view and hand it to the render thread."""
+        if self.series is None or len(self.series) == 0:
+            return
+        width, height = self.image_canvas.winfo_width(), self.image_canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return  # not laid out yet; <Configure> asks again
+        
+        if self.mode == 'line':
+            x, y, low, high = self._visible_line()
+            spec = {'mode': 'line', 'x': x / 86400.0, 'y': y,
+                    'xlim': (low / 86400.0, max(high, low + 1) / 86400.0),
+                    'ylim': self._limits(y, include_zero=False) if len(y) else None,
+                    'title': 'Cumulative Profit/Loss'}
+        else:
+            timestamps, profits, _ = self.series.window(config.CHART_BAR_COUNT)
+            spec = {'mode': 'bars', 'labels': [datetime.fromtimestamp(t).strftime('%a') for t in timestamps],
+                    'heights': profits.copy(), 'colors': [self._bar_color(profit) for profit in profits],
+                    'ylim': self._limits(profits), 'title': 'Daily Profit/Loss'}
+        self.renderer.submit(spec, width, height)
+        if self.poll_job is None:
+            self.poll_job = self.after(config.CHART_RENDER_POLL_INTERVAL, self._poll_frame)
+    
+    def _poll_frame(self):
+        """Show the newest finished frame; keep polling while renders are in flight."""
+        self.poll_job = None
+        if self.renderer.error is not None:
+            self._fall_back_to_canvas()
+            return
+        busy = self.renderer.busy
+        with profiler.section('chart.photo_blit'):
+            photo, self.shown_generation = self.renderer.blit(self.photo, self.shown_generation)
+        if photo is not self.photo:
+            self.photo = photo
+            self.image_canvas.itemconfigure(self.image_item, image=photo)
+        if busy:
+            self.poll_job = self.after(config.CHART_RENDER_POLL_INTERVAL, self._poll_frame)
+    
+    def _fall_back_to_canvas(self):
+        """Replace a failed render thread with the figure drawn on the Tk thread."""
+        log.warning("Chart render thread failed (%s); drawing on the Tk thread", self.renderer.error)
+        self.renderer.close()
+        self.renderer = self.photo = None
+        self.image_canvas.destroy()
+        self.threaded = False
+        self.mode = self.last_signature = None
+        series = self.series
+        self._create_figure()
+        if series is not None:
+            self.update_data(series)
+    
+    def _downsampled(self, timestamps, values, visible):
+        """Get the series downsampled for the zoom level that shows ``visible`` points."""
+        signature = (id(self.series), self.series.version)
+        if signature != self.lod_signature:
+            self.lod_cache.clear()
+            self.lod_signature = signature
+        
+        # Each zoom level doubles the resolution over the whole series,
+        # so panning within a level only slices the cached arrays
+        width = max(int(self._plot_width()), 100)
+        level = max(0, int(np.ceil(np.log2(max(len(values) / visible, 1)))))
+        key = (width, level)
+        if key in self.lod_cache:
+            self.lod_cache.move_to_end(key)
+            return self.lod_cache[key]
+        
+        result = minmax(timestamps, values, width * 2 ** level)
+        self.lod_cache[key] = result
+        while len(self.lod_cache) > config.CHART_LOD_CACHE_SIZE:
+            self.lod_cache.popitem(last=False)
+        return result
+    
+    def _plot_width(self):
+        """Get the width of the axes in pixels."""
+        if self.renderer is None:
+            return self.ax.bbox.width
+        if self.renderer.frame_axes is None:
+            return self.image_canvas.winfo_width() * 0.8
+        left, _, right, _ = self.renderer.frame_axes
+        return right - left
+    
+    def _on_scroll(self, event):
+        """Zoom the line around the cursor."""
+        if self.mode != 'line' or event.xdata is None:
+            return
+        self._zoom(event.xdata * 86400.0, event.button == 'up')
+    
+    def _zoom(self, center, zoom_in):
+        """Zoom the line around a time in POSIX seconds."""
+        first, last = self.series.timestamps[0], self.series.timestamps[-1]
+        low, high = self.view or (first, last)
+        factor = 1 / self.ZOOM_STEP if zoom_in else self.ZOOM_STEP
+        low = center - (center - low) * factor
+        high = center + (high - center) * factor
+        self.view = None if high - low >= last - first else self._clamp_view(low, high)
+        self._render_line()
+    
+    def _on_press(self, event):
+        """Start a pan, or reset the view on double click."""
+        if self.mode != 'line' or event.inaxes is not self.ax:
+            return
+        if event.dblclick:
+            self.view = None
+            self._render_line()
+        elif event.button == 1 and self.view is not None:
+            self.drag_start = (event.x, self.view)
+    
+    def _on_motion(self, event):
+        """Pan the view while dragging."""
+        if self.drag_start is None or event.x is None:
+            return
+        start_x, (low, high) = self.drag_start
+        shift = (start_x - event.x) / self._plot_width() * (high - low)
+        self.view = self._clamp_view(low + shift, high + shift)
+        self._render_line()
+    
+    def _on_release(self, event):
+        """Finish a pan."""
+        self.drag_start = None
+    
+    def _image_xdata(self, x, y):
+        """Map a pixel on the rendered frame to an x value in days, or None outside the axes."""
+        axes, xlim = self.renderer.frame_axes, self.renderer.frame_xlim
+        if axes is None:
+            return None
+        left, top, right, bottom = axes
+        if not (left <= x <= right and top <= y <= bottom):
+            return None
+        return xlim[0] + (x - left) / (right - left) * (xlim[1] - xlim[0])
+    
+    def _on_wheel(self, event):
+        """Zoom the rendered line around the cursor (wheel on Windows/macOS, buttons 4/5 on X11)."""
+        xdata = self._image_xdata(event.x, event.y)
+        if self.mode == 'line' and xdata is not None:
+            self._zoom(xdata * 86400.0, event.num == 4 or event.delta > 0)
+    
+    def _on_image_press(self, event):
+        """Start a pan on the rendered line."""
+        if (self.mode == 'line' and self.view is not None
+                and self._image_xdata(event.x, event.y) is not None):
+            self.drag_start = (event.x, self.view)
+    
+    def _on_image_double_click(self, event):
+        """Reset the rendered line to the whole series."""
+        if self.mode == 'line' and self._image_xdata(event.x, event.y) is not None:
+            self.view = None
+            self._render_line()
+    
+    def _on_resize(self, event):
+        """Re-render the line at the new pixel width."""
+        if self.mode == 'line':
+            self._render_line()
+    
+    def _clamp_view(self, low, high):
+        """Keep a view of the same span inside the data range."""
+        first, last = self.series.timestamps[0], self.series.timestamps[-1]
+        span = high - low
+        low = min(max(low, first), last - span)
+        return (low, low + span)
+    
+    def _rebuild_bars(self, labels, profits):
+        """Recreate the bar artists for a new set of labels."""
+        if self.bar_container is not None:
+            self.bar_container.remove()
+        positions = range(len(labels))
+        self.bar_container = self.ax.bar(positions, profits, color=config.COLORS['accent'])
+        self.ax.set_xticks(list(positions))
+        self.ax.set_xticklabels(labels)
+        self.bars = list(self.bar_container)
+        for bar, profit in zip(self.bars, profits):
+            bar.set_color(self._bar_color(profit))
+            bar.set_animated(True)
+        self._rescale(profits)
+    
+    def _rescale(self, values, include_zero=True):
+        """Fit the y-axis to the given values with some headroom."""
+        self.ax.set_ylim(*self._limits(values, include_zero))
+    
+    def _limits(self, values, include_zero=True):
+        """Get y-axis limits that fit the given values with some headroom."""
+        low = float(min(values.min(), 0) if include_zero else values.min())
+        high = float(max(values.max(), 0) if include_zero else values.max())
+        margin = (high - low) * 0.1 or 1
+        return (low - margin, high + margin)
+    
+    def _limits_exceeded(self, profits):
+        """Check whether any bar falls outside the current y-axis range."""
+        low, high = self.ax.get_ylim()
+        return bool((profits < low).any() or (profits > high).any())
+    
+    def _bar_color(self, profit):
+        """Get the bar color for a profit value."""
+        return config.COLORS['error'] if profit < 0 else config.COLORS['success']
+    
+    def _on_draw(self, event):
+        """Cache the static background after a full draw and repaint the bars."""
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for bar in self.bars:
+            self.ax.draw_artist(bar)
+    
+    def _blit(self):
+        """Redraw only the data layer over the cached background."""
+        with profiler.section('chart.blit'):
+            self.canvas.restore_region(self.background)
+            for bar in self.bars:
+                self.ax.draw_artist(bar)
+            self.canvas.blit(self.ax.bbox)
+
+class Sparkline(tk.Canvas):
+    """Tiny line chart drawn straight onto a Tk canvas.
+    
+    Each line is one canvas item created up front; a redraw only moves its
+    coordinates, computed for every point in one NumPy pass. Points come
+    from a PointRing: the widget's own, fed by push(), or one bound with
+    show(), so recycled table rows can display whichever strategy they hold.
+    Points keep a fixed spacing, so new values scroll in from the right.
+    Redraws are skipped while the ring is unchanged.
+    """
+    
+    def __init__(self, parent, length=config.SPARKLINE_LENGTH, lines=1, colors=None,
+                 width=80, height=18, **kwargs):
+        kwargs.setdefault('bg', config.COLORS['bg_secondary'])
+        super().__init__(parent, width=width, height=height, highlightthickness=0, **kwargs)
+        colors = colors or [config.COLORS['accent']] * lines
+        self.items = [self.create_line(0, 0, 0, 0, fill=color) for color in colors]
+        self.ring = PointRing(length, lines)
+        self.size = (width, height)
+        self.signature = None
+        self.x = {}  # (ring length, width) -> x position of every ring slot
+        self.bind('<Configure>', self._on_resize)
+    
+    def push(self, *values):
+        """Append one value per line to the widget's ring; call draw() to show it."""
+        self.ring.append(*values)
+    
+    def show(self, ring):
+        """Display another ring (or nothing for None) and redraw if it differs."""
+        self.ring = ring
+        self.draw()
+    
+    def draw(self):
+        """Move the line items to the ring's current points."""
+        ring = self.ring
+        signature = None if ring is None else (id(ring), ring.version, self.size)
+        if signature == self.signature:
+            return
+        self.signature = signature
+        
+        values = ring.window() if ring is not None else None
+        if values is None or values.shape[1] < 2:
+            for item in self.items:
+                self.coords(item, 0, 0, 0, 0)
+            return
+        width, height = self.size
+        count = values.shape[1]
+        key = (ring.length, width)
+        if key not in self.x:
+            self.x[key] = np.linspace(0, width - 1, ring.length)
+        x = self.x[key][ring.length - count:]
+        low, high = float(values.min()), float(values.max())
+        scale = (height - 3) / (high - low) if high > low else 0.0
+        y = (height - 2) - (values - low) * scale if scale else np.full(values.shape, height / 2)
+        
+        points = np.empty(2 * count)
+        points[0::2] = x
+        for item, line in zip(self.items, y):
+            points[1::2] = line
+            self.coords(item, points.tolist())
+    
+    def _on_resize(self, event):
+        """Rescale the lines to the new widget size."""
+        self.size = (event.width, event.height)
+        self.draw()
+
+@dataclass
+class TableColumn:
+    """Column definition for a StrategyTable."""
+    header: str
+    width: int
+    text: Callable  # (strategy, index) -> str
+    color: Optional[Callable] = None  # (strategy) -> foreground color
+    anchor: str = 'center'
+    sparkline: Optional[Callable] = None  # (strategy) -> PointRing drawn instead of text
+    sort_key: Optional[Callable] = None  # (strategy) -> value, None last; makes the header clickable
+
+class StrategyTable(tk.Frame):
+    """Virtualized strategy table that recycles a fixed pool of row widgets.
+    
+    Clicking the header of a column with a sort_key orders the rows by it,
+    and clicking again reverses the order.
+    """
+    
+    ROW_HEIGHT = 24
+    CHAR_WIDTH = 7  # pixels per width unit of a sparkline column
+    
+    def __init__(self, parent, columns, show_header=True, on_select=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.columns = columns
+        self.show_header = show_header
+        self.on_select = on_select
+        self.selected_id = None
+        self.sort_column = None
+        self.sort_descending = False
+        self.header_labels = []
+        self.source = []
+        self.strategies = []
+        self.index_by_id = {}
+        self.first_row = 0
+        self.rows = []
+        self.row_cells = []
+        self.row_ids = []
+        self.row_selected = []
+        self.create_widgets()
+    
+    def create_widgets(self):
+        """Create the header, row viewport and scrollbar."""
+        if self.show_header:
+            header_frame = tk.Frame(self, bg=config.COLORS['bg_secondary'])
+            header_frame.pack(fill=tk.X, pady=(0, 5))
+            for i, column in enumerate(self.columns):
+                label = tk.Label(header_frame, text=column.header, font=('Arial', 10, 'bold'),
+                                bg=config.COLORS['bg_secondary'], width=column.width,
+                                anchor=column.anchor)
+                label.pack(side=tk.LEFT, padx=5)
+                if column.sort_key:
+                    label.configure(cursor='hand2')
+                    label.bind('<Button-1>', lambda event, i=i: self.sort_by(i))
+                self.header_labels.append(label)
+        
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.viewport = tk.Frame(self, bg=config.COLORS['bg_primary'])
+        self.viewport.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.viewport.bind('<Configure>', self._on_resize)
+        self._bind_scroll(self.viewport)
+    
+    def update_strategies(self, strategies):
+        """Show a new strategy sequence, repainting only the cells that changed."""
+        self.source = list(strategies)
+        strategies = self._sorted(self.source)
+        ids = [strategy.id for strategy in strategies]
+        if len(ids) != len(self.strategies) or any(
+                strategy.id != strategy_id for strategy, strategy_id in zip(self.strategies, ids)):
+            self.index_by_id = {strategy_id: i for i, strategy_id in enumerate(ids)}
+        self.strategies = list(strategies)
+        self._clamp_first_row()
+        self._render()
+    
+    def update_strategy(self, strategy):
+        """Repaint a single strategy if it is currently visible."""
+        index = self.index_by_id.get(strategy.id)
+        if index is None:
+            return
+        self.strategies[index] = strategy
+        row = index - self.first_row
+        if 0 <= row < len(self.rows):
+            self._render_row(row, index)
+    
+    def visible_strategies(self):
+        """Get the strategies shown in the pooled rows, top to bottom."""
+        return self.strategies[self.first_row:self.first_row + len(self.rows)]
+    
+    def redraw_sparklines(self):
+        """Redraw the sparkline cells of the visible rows whose rings changed."""
+        if not any(column.sparkline for column in self.columns):
+            return
+        for row, (_, labels) in enumerate(self.rows):
+            index = self.first_row + row
+            strategy = self.strategies[index] if index < len(self.strategies) else None
+            for i, column in enumerate(self.columns):
+                if column.sparkline:
+                    labels[i].show(None if strategy is None else column.sparkline(strategy))
+    
+    def sort_by(self, column_index):
+        """Order the rows by a column, reversing the order if it is already the sort column."""
+        if self.sort_column == column_index:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = column_index
+            self.sort_descending = False
+        for i, (label, column) in enumerate(zip(self.header_labels, self.columns)):
+            arrow = (' \u25bc' if self.sort_descending else ' \u25b2') if i == column_index else ''
+            label.configure(text=column.header + arrow)
+        self.update_strategies(self.source)
+    
+    def get_selected(self):
+        """Get the selected strategy, or None."""
+        index = self.index_by_id.get(self.selected_id)
+        return None if index is None else self.strategies[index]
+    
+    def select(self, strategy_id):
+        """Highlight a strategy row and notify the selection callback."""
+        self.selected_id = strategy_id
+        self._render()
+        if self.on_select:
+            self.on_select(self.get_selected())
+    
+    def yview(self, *args):
+        """Scroll the viewport in response to the scrollbar."""
+        visible = len(self.rows)
+        if args[0] == 'moveto':
+            self.first_row = int(float(args[1]) * len(self.strategies))
+        elif args[0] == 'scroll':
+            step = visible if args[2] == 'pages' else 1
+            self.first_row += int(args[1]) * step
+        self._clamp_first_row()
+        self._render()
+    
+    def _on_resize(self, event):
+        """Grow or shrink the row pool to fit the viewport height."""
+        wanted = max(1, event.height // self.ROW_HEIGHT)
+        while len(self.rows) < wanted:
+            self._create_row()
+        while len(self.rows) > wanted:
+            frame, _ = self.rows.pop()
+            self.row_cells.pop()
+            self.row_ids.pop()
+            self.row_selected.pop()
+            frame.destroy()
+        self._clamp_first_row()
+        self._render()
+    
+    def _create_row(self):
+        """Create one recyclable row of labels."""
+        frame = tk.Frame(self.viewport, bg=config.COLORS['bg_secondary'],
+                        height=self.ROW_HEIGHT - 2)
+        frame.pack(fill=tk.X, pady=1)
+        frame.pack_propagate(False)
+        self._bind_scroll(frame)
+        row = len(self.rows)
+        frame.bind('<Button-1>', lambda event: self._on_click(row))
+        
+        labels = []
+        for column in self.columns:
+            if column.sparkline:
+                label = Sparkline(frame, width=column.width * self.CHAR_WIDTH, height=self.ROW_HEIGHT - 6)
             else:
-                bar.set_color(config.COLORS['success'])
+                label = tk.Label(frame, text='', width=column.width, anchor=column.anchor,
+                               bg=config.COLORS['bg_secondary'])
+            label.pack(side=tk.LEFT, padx=5)
+            self._bind_scroll(label)
+            label.bind('<Button-1>', lambda event: self._on_click(row))
+            labels.append(label)
         
-        self.canvas.draw()
+        self.rows.append((frame, labels))
+        self.row_cells.append([None] * len(self.columns))
+        self.row_ids.append(None)
+        self.row_selected.append(False)
+    
+    def _render(self):
+        """Repaint every pooled row for the current scroll position."""
+        for row in range(len(self.rows)):
+            self._render_row(row, self.first_row + row)
+        self._update_scrollbar()
+    
+    def _render_row(self, row, index):
+        """Repaint the changed cells of one pooled row."""
+        frame, labels = self.rows[row]
+        cells = self.row_cells[row]
+        
+        if index < len(self.strategies):
+            strategy = self.strategies[index]
+            self.row_ids[row] = strategy.id
+            for i, column in enumerate(self.columns):
+                if column.sparkline:
+                    labels[i].show(column.sparkline(strategy))
+                    continue
+                text = column.text(strategy, index)
+                color = column.color(strategy) if column.color else config.COLORS['text_primary']
+                if cells[i] != (text, color):
+                    cells[i] = (text, color)
+                    labels[i].configure(text=text, fg=color)
+        else:
+            self.row_ids[row] = None
+            for i, label in enumerate(labels):
+                if self.columns[i].sparkline:
+                    label.show(None)
+                elif cells[i] != ('', None):
+                    cells[i] = ('', None)
+                    label.configure(text='')
+        
+        selected = self.row_ids[row] is not None and self.row_ids[row] == self.selected_id
+        if self.row_selected[row] != selected:
+            self.row_selected[row] = selected
+            bg = config.COLORS['bg_selected'] if selected else config.COLORS['bg_secondary']
+            frame.configure(bg=bg)
+            for label in labels:
+                label.configure(bg=bg)
+    
+    def _sorted(self, strategies):
+        """Order strategies by the sort column, keeping those without a value last."""
+        if self.sort_column is None:
+            return strategies
+        sort_key = self.columns[self.sort_column].sort_key
+        keyed = [(sort_key(strategy), strategy) for strategy in strategies]
+        present = [item for item in keyed if item[0] is not None]
+        present.sort(key=lambda item: item[0], reverse=self.sort_descending)
+        return [strategy for _, strategy in present] + [strategy for key, strategy in keyed if key is None]
+    
+    def _on_click(self, row):
+        """Select the strategy shown in a pooled row."""
+        if self.row_ids[row] is not None:
+            self.select(self.row_ids[row])
+    
+    def _clamp_first_row(self):
+        """Keep the scroll position inside the data range."""
+        last_start = max(0, len(self.strategies) - len(self.rows))
+        self.first_row = max(0, min(self.first_row, last_start))
+    
+    def _update_scrollbar(self):
+        """Sync the scrollbar thumb with the visible window."""
+        total = len(self.strategies)
+        if total == 0:
+            self.scrollbar.set(0, 1)
+            return
+        end = min(total, self.first_row + len(self.rows))
+        self.scrollbar.set(self.first_row / total, end / total)
+    
+    def _bind_scroll(self, widget):
+        """Route mouse wheel events on a widget to the table."""
+        widget.bind('<MouseWheel>', self._on_mousewheel)
+        widget.bind('<Button-4>', lambda event: self.yview('scroll', -1, 'units'))
+        widget.bind('<Button-5>', lambda event: self.yview('scroll', 1, 'units'))
+    
+    def _on_mousewheel(self, event):
+        """Scroll three rows per wheel notch."""
+        self.yview('scroll', -3 if event.delta > 0 else 3, 'units')
+
+def status_color(strategy):
+    """Get the foreground color for a strategy status."""
+    return config.COLORS['success'] if strategy.status == 'ACTIVE' else config.COLORS['warning']
+
+def profit_color(strategy):
+    """Get the foreground color for a strategy profit."""
+    return config.COLORS['success'] if strategy.profit >= 0 else config.COLORS['error']
 
 class StrategyList(tk.Frame):
-    """Widget for displaying strategy list."""
+    """Widget for displaying strategy list with a P&L sparkline per strategy."""
     
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
+        self.pnl_rings = {}
         self.create_widgets()
     
     def create_widgets(self):
@@ -81,36 +829,128 @@ class StrategyList(tk.Frame):
                 bg=config.COLORS['bg_secondary'], 
                 fg=config.COLORS['text_primary']).pack(side=tk.LEFT)
         
-        # Strategy list frame
-        self.list_frame = tk.Frame(self, bg=config.COLORS['bg_primary'])
-        self.list_frame.pack(fill=tk.BOTH, expand=True)
+        # Strategy table
+        columns = [
+            TableColumn('#', 3, lambda strategy, index: str(index + 1)),
+            TableColumn('Name', 16, lambda strategy, index: strategy.name, anchor='w'),
+            TableColumn('P&L', 8, lambda strategy, index: '',
+                        sparkline=lambda strategy: self.pnl_rings.get(strategy.id)),
+            TableColumn('Status', 10, lambda strategy, index: strategy.status, status_color),
+        ]
+        self.table = StrategyTable(self, columns, show_header=False,
+                                   bg=config.COLORS['bg_primary'])
+        self.table.pack(fill=tk.BOTH, expand=True)
     
     def update_strategies(self, strategies):
         """Update the strategy list."""
-        # Clear existing items
-        for widget in self.list_frame.winfo_children():
-            widget.destroy()
-        
-        # Add strategies
-        for i, strategy in enumerate(strategies):
-            self.add_strategy_item(strategy, i)
-    
-    def add_strategy_item(self, strategy, index):
-        """Add a single strategy item."""
-        item_frame = tk.Frame(self.list_frame, bg=config.COLORS['bg_secondary'], 
-                             relief='raised', bd=1)
-        item_frame.pack(fill=tk.X, padx=5, pady=2)
-        
-        # Strategy number
-        tk.Label(item_frame, text=str(index + 1), width=3,
-                bg=config.COLORS['bg_secondary']).pack(side=tk.LEFT, padx=5)
-        
-        # Strategy name
-        tk.Label(item_frame, text=strategy.name, width=25, anchor='w',
-                bg=config.COLORS['bg_secondary']).pack(side=tk.LEFT, padx=5)
-        
-        # Status
-        status_color = config.COLORS['success'] if strategy.status == 'ACTIVE' else config.COLORS['warning']
-        tk.Label(item_frame, text=strategy.status, width=10,
-                bg=config.COLORS['bg_secondary'], 
-                fg=status_color).pack(side=tk.RIGHT, padx=5)
\ No newline at end of file
+        self.table.update_strategies(strategies)
+    
+    def update_strategy(self, strategy):
+        """Update a single strategy in the list."""
+        self.table.update_strategy(strategy)
+    
+    def visible_strategies(self):
+        """Get the strategies currently shown in the list."""
+        return self.table.visible_strategies()
+    
+    def record_pnl(self, pnl):
+        """Append a P&L sample per strategy id and redraw the visible sparklines."""
+        for strategy_id, value in pnl.items():
+            ring = self.pnl_rings.get(strategy_id)
+            if ring is None:
+                ring = self.pnl_rings[strategy_id] = PointRing()
+            ring.append(value)
+        self.table.redraw_sparklines()
+
+class ProfilerOverlay(tk.Frame):
+    """Developer overlay listing the slowest instrumented sections and live chart figures."""
+    
+    def __init__(self, parent, profiler, rows=8, interval=1000, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.profiler = profiler
+        self.rows = rows
+        self.interval = interval
+        self.label = tk.Label(self, text="", font=('Courier', 8), justify=tk.LEFT, anchor='nw',
+                             bg=kwargs.get('bg', config.COLORS['bg_secondary']),
+                             fg=config.COLORS['text_secondary'])
+        self.label.pack(fill=tk.BOTH, expand=True)
+        self.job = self.after(self.interval, self.refresh)
+    
+    def refresh(self):
+        """Show the sections with the most total time; skipped while hidden."""
+        if self.winfo_viewable():
+            stats = sorted(self.profiler.stats().items(), key=lambda item: -item[1]['total_ms'])
+            lines = [f"{'section':<28}{'n':>6}{'p50':>8}{'p95':>8}{'max':>8}"]
+            for name, summary in stats[:self.rows]:
+                lines.append(f"{name[:28]:<28}{summary['count']:>6}{summary['p50_ms']:>8.2f}"
+                             f"{summary['p95_ms']:>8.2f}{summary['max_ms']:>8.2f}")
+            figures = figure_pool.stats()
+            lines.append(f"figures {figures['figures']} ({figures['in_use']} in use, {figures['idle']} idle), "
+                         f"renderers {figures['renderers']}")
+            self.label.configure(text="\n".join(lines))
+        self.job = self.after(self.interval, self.refresh)
+    
+    def destroy(self):
+        """Stop refreshing before the widget goes away."""
+        self.after_cancel(self.job)
+        super().destroy()
+
+class JobProgressDialog(tk.Toplevel):
+    """Non-modal window that follows a background job until it finishes.
+    
+    The job only needs ``progress`` (0..1), ``rows``, ``done``, ``error``,
+    ``cancelled`` and ``cancel()``, so exports, imports and other long
+    tasks share one dialog.
+    """
+    
+    def __init__(self, parent, title, job, on_done=None, interval=config.HISTORY_JOB_POLL_INTERVAL):
+        super().__init__(parent, bg=config.COLORS['bg_secondary'])
+        self.title(title)
+        self.resizable(False, False)
+        self.transient(parent)
+        self.job = job
+        self.on_done = on_done
+        self.interval = interval
+        
+        self.label = tk.Label(self, text="Starting...", font=('Arial', 10), anchor='w',
+                             bg=config.COLORS['bg_secondary'], fg=config.COLORS['text_primary'])
+        self.label.pack(fill=tk.X, padx=15, pady=(15, 5))
+        self.progress = ttk.Progressbar(self, mode='determinate', maximum=1.0, length=320)
+        self.progress.pack(padx=15, pady=5)
+        self.button = tk.Button(self, text="Cancel", command=self.cancel)
+        self.button.pack(pady=(5, 15))
+        self.protocol('WM_DELETE_WINDOW', self.cancel)
+        self.poll_job = self.after(self.interval, self.poll)
+    
+    def poll(self):
+        """Show the job's progress, and its outcome once it is done."""
+        job = self.job
+        self.progress.configure(value=job.progress)
+        if not job.done:
+            self.label.configure(text=f"{job.rows:,} rows ({job.progress:.0%})")
+            self.poll_job = self.after(self.interval, self.poll)
+            return
+        
+        self.poll_job = None
+        if job.error:
+            text = f"Failed: {job.error}"
+        elif job.cancelled.is_set():
+            text = f"Cancelled after {job.rows:,} rows"
+        else:
+            text = f"Done: {job.rows:,} rows"
+        self.label.configure(text=text)
+        self.button.configure(text="Close", state=tk.NORMAL, command=self.destroy)
+        self.protocol('WM_DELETE_WINDOW', self.destroy)
+        if self.on_done:
+            self.on_done(job)
+    
+    def cancel(self):
+        """Ask the job to stop; the dialog reports once it has."""
+        self.job.cancel()
+        self.button.configure(state=tk.DISABLED)
+    
+    def destroy(self):
+        """Stop polling before the window goes away."""
+        if self.poll_job:
+            self.after_cancel(self.poll_job)
+        super().destroy()
\ No newline at end of file
@@ -0,0 +1,252 @@
+"""Columnar ring buffer for profit time series."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, Tuple
+import numpy as np
+import config
+from src.models.trading_data import ProfitData
+
+class ProfitSeries:
+    """Fixed-capacity ring buffer of (timestamp, profit, cumulative) columns.
+
+    Each column is stored twice back to back, so every window of up to
+    ``capacity`` points is a contiguous slice and can be returned as a
+    zero-copy NumPy view. Timestamps are POSIX seconds.
+    """
+    
+    def __init__(self, capacity: int = config.PROFIT_HISTORY_CAPACITY):
+        self.capacity = capacity
+        self._timestamps = np.zeros(2 * capacity, dtype=np.float64)
+        self._profits = np.zeros(2 * capacity, dtype=np.float64)
+        self._cumulative = np.zeros(2 * capacity, dtype=np.float64)
+        self._start = 0
+        self._size = 0
+        self.version = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self) -> Iterator[ProfitData]:
+        timestamps, profits, cumulative = self.window()
+        for i in range(len(timestamps)):
+            yield self._record(timestamps[i], profits[i], cumulative[i])
+    
+    def __getitem__(self, index: int) -> ProfitData:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ProfitSeries index out of range")
+        pos = self._start + index
+        return self._record(self._timestamps[pos], self._profits[pos], self._cumulative[pos])
+    
+    def append(self, timestamp: float, profit: float):
+        """Append one point in O(1), evicting the oldest when full."""
+        cumulative = self.last_cumulative() + profit
+        pos = (self._start + self._size) % self.capacity
+        for column, value in ((self._timestamps, timestamp),
+                              (self._profits, profit),
+                              (self._cumulative, cumulative)):
+            column[pos] = value
+            column[pos + self.capacity] = value
+        
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+        self.version += 1
+    
+    def extend(self, timestamps, profits, start_cumulative: float = None):
+        """Append many points at once with vectorized cumulative sums.
+
+        ``start_cumulative`` seeds the running total, e.g. when loading a
+        window that does not begin at the start of the account history.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        profits = np.asarray(profits, dtype=np.float64)
+        if len(profits) == 0:
+            return
+        if start_cumulative is None:
+            start_cumulative = self.last_cumulative()
+        cumulative = start_cumulative + np.cumsum(profits)
+        
+        # Only the newest `capacity` points can survive
+        keep = min(len(profits), self.capacity)
+        timestamps, profits, cumulative = timestamps[-keep:], profits[-keep:], cumulative[-keep:]
+        
+        positions = (self._start + self._size + np.arange(keep)) % self.capacity
+        for column, values in ((self._timestamps, timestamps),
+                               (self._profits, profits),
+                               (self._cumulative, cumulative)):
+            column[positions] = values
+            column[positions + self.capacity] = values
+        
+        overflow = max(0, self._size + keep - self.capacity)
+        self._size = min(self.capacity, self._size + keep)
+        self._start = (self._start + overflow) % self.capacity
+        self.version += 1
+    
+    def window(self, count: int = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get read-only views of the newest ``count`` points (all by default)."""
+        count = self._size if count is None else min(count, self._size)
+        end = self._start + self._size
+        return (self._view(self._timestamps, end - count, end),
+                self._view(self._profits, end - count, end),
+                self._view(self._cumulative, end - count, end))
+    
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.window()[0]
+    
+    @property
+    def profits(self) -> np.ndarray:
+        return self.window()[1]
+    
+    @property
+    def cumulative(self) -> np.ndarray:
+        return self.window()[2]
+    
+    def last(self) -> ProfitData:
+        """Get the newest point."""
+        return self[-1]
+    
+    def last_cumulative(self) -> float:
+        """Get the newest cumulative profit, or zero when empty."""
+        if self._size == 0:
+            return 0.0
+        return float(self._cumulative[self._start + self._size - 1])
+    
+    def count_since(self, timestamp: float) -> int:
+        """Count the points at or after a timestamp."""
+        timestamps = self.timestamps
+        return len(timestamps) - int(np.searchsorted(timestamps, timestamp, side='left'))
+    
+    def sum_since(self, timestamp: float) -> float:
+        """Sum the profit of all points at or after a timestamp."""
+        count = self.count_since(timestamp)
+        return float(self.profits[len(self) - count:].sum()) if count else 0.0
+    
+    def rolling_sum(self, window: int) -> np.ndarray:
+        """Rolling profit sum over ``window`` points, derived from the cumulative column."""
+        cumulative = self.cumulative
+        result = cumulative.copy()
+        if len(cumulative) > window:
+            result[window:] = cumulative[window:] - cumulative[:-window]
+        if len(cumulative):
+            result[:window] -= cumulative[0] - self.profits[0]
+        return result
+    
+    def drawdown(self) -> np.ndarray:
+        """Distance of cumulative profit below its running peak."""
+        cumulative = self.cumulative
+        return cumulative - np.maximum.accumulate(cumulative)
+    
+    def _view(self, column: np.ndarray, start: int, end: int) -> np.ndarray:
+        """Slice a column into a read-only view."""
+        view = column[start:end]
+        view.flags.writeable = False
+        return view
+    
+    def _record(self, timestamp, profit, cumulative) -> ProfitData:
+        """Materialize one row as a ProfitData record."""
+        return ProfitData(
+            timestamp=datetime.fromtimestamp(float(timestamp)),
+            profit=float(profit),
+            cumulative_profit=float(cumulative)
+        )
+
+class PointRing:
+    """Fixed-length ring of recent values for one or more parallel lines.
+    
+    Stored twice back to back like ProfitSeries, so the points in time
+    order are always a contiguous (lines, n) view and appending is O(1).
+    """
+    
+    def __init__(self, length: int = config.SPARKLINE_LENGTH, lines: int = 1):
+        self.length = length
+        self._values = np.zeros((lines, 2 * length), dtype=np.float64)
+        self._start = 0
+        self._size = 0
+        self.version = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, *values: float):
+        """Append one value per line, evicting the oldest point when full."""
+        pos = (self._start + self._size) % self.length
+        self._values[:, pos] = values
+        self._values[:, pos + self.length] = values
+        if self._size < self.length:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self.length
+        self.version += 1
+    
+    def window(self) -> np.ndarray:
+        """Get the points oldest first as a zero-copy (lines, n) view."""
+        return self._values[:, self._start:self._start + self._size]
+
+@dataclass
+class PriceBars:
+    """OHLCV bars as parallel NumPy columns; ``time`` is the bar open in POSIX seconds."""
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.time)
+    
+    def __getitem__(self, index: slice) -> 'PriceBars':
+        return PriceBars(*(column[index] for column in self.columns))
+    
+    @property
+    def columns(self) -> Tuple[np.ndarray, ...]:
+        """Get the columns in storage order: time, open, high, low, close, volume."""
+        return self.time, self.open, self.high, self.low, self.close, self.volume
+    
+    def between(self, start: float, end: float) -> 'PriceBars':
+        """Get the bars opening in [start, end) as zero-copy views."""
+        first = int(np.searchsorted(self.time, start, side='left'))
+        last = int(np.searchsorted(self.time, end, side='left'))
+        return self[first:last]
+
+class BarRing:
+    """Fixed-capacity ring of recent OHLCV bars, oldest first.
+    
+    Stored twice back to back like PointRing, so bars() is always a set of
+    contiguous zero-copy PriceBars views and appending is O(1).
+    """
+    
+    def __init__(self, capacity: int = config.BAR_HISTORY_LENGTH):
+        self.capacity = capacity
+        self._values = np.zeros((6, 2 * capacity), dtype=np.float64)
+        self._start = 0
+        self._size = 0
+        self.version = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, time: float, open: float, high: float, low: float, close: float, volume: float):
+        """Append one bar, evicting the oldest when full."""
+        pos = (self._start + self._size) % self.capacity
+        row = (time, open, high, low, close, volume)
+        self._values[:, pos] = row
+        self._values[:, pos + self.capacity] = row
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+        self.version += 1
+    
+    def bars(self, count: int = None) -> PriceBars:
+        """Get the newest ``count`` bars (all by default) as read-only views."""
+        count = self._size if count is None else min(count, self._size)
+        end = self._start + self._size
+        window = self._values[:, end - count:end]
+        window.flags.writeable = False
+        return PriceBars(*window)
\ No newline at end of file
@@ -0,0 +1,194 @@
+"""Array-backed trade book indexed by id, symbol and strategy."""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import config
+from src.models.trading_data import Trade
+
+class TradeBook:
+    """Compact store of open and closed trades.
+
+    Numeric fields live in NumPy columns addressed by slot number; the id,
+    symbol and strategy indexes map to slots. Repricing every open trade
+    on a symbol is a single vectorized operation over that symbol's slots,
+    and the floating profit per symbol and in total is kept up to date so
+    aggregate queries are O(1).
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.size = 0
+        self.ids: List[str] = []
+        self.symbols: List[str] = []
+        self.strategy_ids: List[str] = []
+        self.sign = np.zeros(capacity, dtype=np.int8)  # +1 BUY, -1 SELL
+        self.volume = np.zeros(capacity)
+        self.open_price = np.zeros(capacity)
+        self.current_price = np.zeros(capacity)
+        self.profit = np.zeros(capacity)
+        self.open_time = np.zeros(capacity)
+        self.close_time = np.full(capacity, np.nan)
+        self.contract_size = np.ones(capacity)
+        self.is_open = np.zeros(capacity, dtype=bool)
+        
+        self.index_by_id: Dict[str, int] = {}
+        self.open_by_symbol: Dict[str, Dict[int, None]] = {}
+        self.slots_by_strategy: Dict[str, List[int]] = {}
+        self.slot_arrays: Dict[str, np.ndarray] = {}
+        self.symbol_profit: Dict[str, float] = {}
+        self.floating_profit = 0.0
+        self.realized_profit = 0.0
+        self.open_count = 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __contains__(self, trade_id: str) -> bool:
+        return trade_id in self.index_by_id
+    
+    def open_trade(self, trade: Trade) -> int:
+        """Add an open trade and return its slot."""
+        if trade.id in self.index_by_id:
+            raise ValueError(f"Duplicate trade id: {trade.id}")
+        if self.size == self.capacity:
+            self._grow()
+        
+        slot = self.size
+        self.size += 1
+        self.ids.append(trade.id)
+        self.symbols.append(trade.symbol)
+        self.strategy_ids.append(trade.strategy_id)
+        self.sign[slot] = 1 if trade.direction == 'BUY' else -1
+        self.volume[slot] = trade.volume
+        self.open_price[slot] = trade.open_price
+        self.current_price[slot] = trade.current_price
+        self.profit[slot] = trade.profit
+        self.open_time[slot] = trade.open_time.timestamp()
+        self.contract_size[slot] = config.CONTRACT_SIZES.get(trade.symbol, 1.0)
+        self.is_open[slot] = True
+        
+        self.index_by_id[trade.id] = slot
+        self.open_by_symbol.setdefault(trade.symbol, {})[slot] = None
+        self.slots_by_strategy.setdefault(trade.strategy_id, []).append(slot)
+        self.slot_arrays.pop(trade.symbol, None)
+        self.symbol_profit[trade.symbol] = self.symbol_profit.get(trade.symbol, 0.0) + trade.profit
+        self.floating_profit += trade.profit
+        self.open_count += 1
+        return slot
+    
+    def close_trade(self, trade_id: str, price: float, close_time: datetime = None) -> Trade:
+        """Close an open trade at a price and return its final state."""
+        slot = self.index_by_id[trade_id]
+        if not self.is_open[slot]:
+            raise ValueError(f"Trade already closed: {trade_id}")
+        symbol = self.symbols[slot]
+        
+        previous = float(self.profit[slot])
+        self.current_price[slot] = price
+        self.profit[slot] = ((price - self.open_price[slot]) * self.sign[slot]
+                             * self.volume[slot] * self.contract_size[slot])
+        self.close_time[slot] = (close_time or datetime.now()).timestamp()
+        self.is_open[slot] = False
+        
+        del self.open_by_symbol[symbol][slot]
+        self.slot_arrays.pop(symbol, None)
+        self.symbol_profit[symbol] -= previous
+        self.floating_profit -= previous
+        self.realized_profit += float(self.profit[slot])
+        self.open_count -= 1
+        return self._trade(slot)
+    
+    def reprice(self, symbol: str, bid: float, ask: float) -> float:
+        """Mark every open trade on a symbol to market; returns the change in floating profit."""
+        slots = self._open_slots(symbol)
+        if len(slots) == 0:
+            return 0.0
+        
+        sign = self.sign[slots]
+        price = np.where(sign > 0, bid, ask)  # longs close at bid, shorts at ask
+        profit = (price - self.open_price[slots]) * sign * self.volume[slots] * self.contract_size[slots]
+        self.current_price[slots] = price
+        self.profit[slots] = profit
+        
+        total = float(profit.sum())
+        delta = total - self.symbol_profit[symbol]
+        self.symbol_profit[symbol] = total
+        self.floating_profit += delta
+        return delta
+    
+    def get(self, trade_id: str) -> Optional[Trade]:
+        """Look up a trade by id."""
+        slot = self.index_by_id.get(trade_id)
+        return None if slot is None else self._trade(slot)
+    
+    def open_trades(self, symbol: str = None) -> List[Trade]:
+        """Get open trades, optionally only on one symbol."""
+        if symbol is None:
+            slots = np.flatnonzero(self.is_open[:self.size])
+        else:
+            slots = self._open_slots(symbol)
+        return [self._trade(int(slot)) for slot in slots]
+    
+    def trades_for_strategy(self, strategy_id: str) -> List[Trade]:
+        """Get every open and closed trade of a strategy."""
+        return [self._trade(slot) for slot in self.slots_by_strategy.get(strategy_id, [])]
+    
+    def floating_by_strategy(self) -> Dict[str, float]:
+        """Get the floating profit of each strategy that has open trades."""
+        slots = np.flatnonzero(self.is_open[:self.size])
+        totals = {}
+        for slot, profit in zip(slots.tolist(), self.profit[slots].tolist()):
+            strategy_id = self.strategy_ids[slot]
+            totals[strategy_id] = totals.get(strategy_id, 0.0) + profit
+        return totals
+    
+    def floating_for(self, strategy_ids: Iterable[str]) -> Dict[str, float]:
+        """Get the floating profit of a few strategies, e.g. the visible rows; 0.0 without open trades."""
+        totals = {}
+        for strategy_id in strategy_ids:
+            slots = self.slots_by_strategy.get(strategy_id)
+            if slots:
+                slots = np.asarray(slots)
+                totals[strategy_id] = float(self.profit[slots][self.is_open[slots]].sum())
+            else:
+                totals[strategy_id] = 0.0
+        return totals
+    
+    def open_symbols(self) -> List[str]:
+        """Get the symbols that have open trades."""
+        return [symbol for symbol, slots in self.open_by_symbol.items() if slots]
+    
+    def _open_slots(self, symbol: str) -> np.ndarray:
+        """Get the open slots of a symbol as a cached index array."""
+        slots = self.slot_arrays.get(symbol)
+        if slots is None:
+            slots = np.fromiter(self.open_by_symbol.get(symbol, {}), dtype=np.intp)
+            self.slot_arrays[symbol] = slots
+        return slots
+    
+    def _grow(self):
+        """Double the capacity of every column."""
+        self.capacity *= 2
+        for name in ('sign', 'volume', 'open_price', 'current_price', 'profit',
+                     'open_time', 'close_time', 'contract_size', 'is_open'):
+            column = getattr(self, name)
+            fill = np.nan if name == 'close_time' else 0
+            grown = np.full(self.capacity, fill, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+    
+    def _trade(self, slot: int) -> Trade:
+        """Materialize one slot as a Trade record."""
+        return Trade(
+            id=self.ids[slot],
+            symbol=self.symbols[slot],
+            direction='BUY' if self.sign[slot] > 0 else 'SELL',
+            volume=float(self.volume[slot]),
+            open_price=float(self.open_price[slot]),
+            current_price=float(self.current_price[slot]),
+            profit=float(self.profit[slot]),
+            open_time=datetime.fromtimestamp(float(self.open_time[slot])),
+            strategy_id=self.strategy_ids[slot],
+            close_time=None if self.is_open[slot] else datetime.fromtimestamp(float(self.close_time[slot]))
+        )
\ No newline at end of file
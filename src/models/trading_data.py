@@ -24,6 +24,8 @@ class Trade:
     current_price: float
     profit: float
     open_time: datetime
+    strategy_id: str = ""
+    close_time: Optional[datetime] = None  # set once the trade is closed
     
 @dataclass
 class Strategy:
@@ -41,4 +43,24 @@ class ProfitData:
     """Profit/loss data for charts."""
     timestamp: datetime
     profit: float
-    cumulative_profit: float
\ No newline at end of file
+    cumulative_profit: float
+    
+@dataclass
+class Tick:
+    """Market quote for a symbol."""
+    symbol: str
+    bid: float
+    ask: float
+    time: float  # POSIX seconds
+    
+@dataclass
+class Bar:
+    """OHLCV bar for one symbol and timeframe."""
+    symbol: str
+    timeframe: str
+    time: float  # bar open, POSIX seconds
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int  # ticks in the bar
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""Base class and lifecycle hooks for application screens."""
+
+import tkinter as tk
+import config
+
+class BaseScreen(tk.Frame):
+    """A screen that is built once and shown or hidden by the ScreenManager."""
+    
+    def __init__(self, parent):
+        super().__init__(parent, bg=config.COLORS['bg_primary'])
+        self.visible = False
+        self.scheduled = {}
+    
+    def on_show(self):
+        """Called each time the screen becomes visible."""
+        self.visible = True
+    
+    def on_hide(self):
+        """Called each time the screen is hidden; pauses periodic work."""
+        self.visible = False
+        self.cancel_scheduled()
+    
+    def on_destroy(self):
+        """Called once before the screen is destroyed."""
+        if self.visible:
+            self.on_hide()
+    
+    def schedule(self, name, delay, callback):
+        """Run a callback after a delay, replacing any pending job with the same name."""
+        self.cancel_scheduled(name)
+        
+        def run():
+            self.scheduled.pop(name, None)
+            callback()
+        run.__qualname__ = f"{type(self).__name__}.{name}"
+        
+        self.scheduled[name] = self.after(delay, run)
+    
+    def cancel_scheduled(self, name=None):
+        """Cancel one named job, or every pending job when no name is given."""
+        names = [name] if name else list(self.scheduled)
+        for job_name in names:
+            after_id = self.scheduled.pop(job_name, None)
+            if after_id:
+                self.after_cancel(after_id)
+    
+    def destroy(self):
+        """Run the destroy hook before tearing down the widgets."""
+        self.on_destroy()
+        super().destroy()
\ No newline at end of file
@@ -2,19 +2,82 @@
 
 import tkinter as tk
 from tkinter import ttk
+from datetime import date, datetime
 import config
-from src.components.widgets import StatCard, ProfitChart, StrategyList
-from src.utils.data_manager import DataManager
+from src.components.widgets import StatCard, ProfitChart, StrategyList, ProfilerOverlay, Sparkline
+from src.screens.base_screen import BaseScreen
+from src.utils.instrumentation import profiler
+from src.utils.data_manager import (ACCOUNT_CHANGED, STRATEGY_CHANGED, STRATEGIES_CHANGED,
+                                    PROFIT_APPENDED, QUOTE_CHANGED)
 
-class MainScreen(tk.Frame):
+class MainScreen(BaseScreen):
     """Main trading dashboard screen."""
     
-    def __init__(self, parent):
-        super().__init__(parent, bg=config.COLORS['bg_primary'])
-        self.pack(fill=tk.BOTH, expand=True)
-        self.data_manager = DataManager()
+    def __init__(self, parent, data_manager, scheduler):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.scheduler = scheduler
+        self.dirty = set()
+        self.changed_strategies = {}
+        self.quote_rows = {}  # symbol -> (label, bid/ask sparkline)
         self.create_widgets()
+    
+    def on_show(self):
+        """Subscribe to data events and repaint everything once."""
+        super().on_show()
+        self.data_manager.subscribe(ACCOUNT_CHANGED, self.on_account_changed)
+        self.data_manager.subscribe(STRATEGY_CHANGED, self.on_strategy_changed)
+        self.data_manager.subscribe(STRATEGIES_CHANGED, self.on_strategies_changed)
+        self.data_manager.subscribe(PROFIT_APPENDED, self.on_profit_appended)
+        self.data_manager.subscribe(QUOTE_CHANGED, self.on_quote_changed)
+        
+        # Anything may have changed while hidden
+        self.dirty = {'account', 'profit', 'strategies', 'quotes'}
         self.update_display()
+        self.schedule('sparklines', config.SPARKLINE_INTERVAL, self.update_sparklines)
+    
+    def on_hide(self):
+        """Unsubscribe from data events and drop any pending refresh."""
+        super().on_hide()
+        self.scheduler.cancel(self.update_display)
+        self.data_manager.unsubscribe(ACCOUNT_CHANGED, self.on_account_changed)
+        self.data_manager.unsubscribe(STRATEGY_CHANGED, self.on_strategy_changed)
+        self.data_manager.unsubscribe(STRATEGIES_CHANGED, self.on_strategies_changed)
+        self.data_manager.unsubscribe(PROFIT_APPENDED, self.on_profit_appended)
+        self.data_manager.unsubscribe(QUOTE_CHANGED, self.on_quote_changed)
+        self.changed_strategies.clear()
+    
+    def on_account_changed(self, account):
+        """Mark the account cards for refresh."""
+        self.mark_dirty('account')
+    
+    def on_strategy_changed(self, strategy):
+        """Queue a single strategy row for refresh."""
+        self.changed_strategies[strategy.id] = strategy
+        self.scheduler.request(self.update_display)
+    
+    def on_strategies_changed(self, strategies):
+        """Mark the whole strategy list for refresh."""
+        self.mark_dirty('strategies')
+    
+    def on_profit_appended(self, point):
+        """Mark the profit chart for refresh."""
+        self.mark_dirty('profit')
+    
+    def on_quote_changed(self, tick):
+        """Record the tick in its symbol's sparkline and mark the quote board for refresh."""
+        row = self.quote_rows.get(tick.symbol)
+        if row is None:
+            row = self.quote_rows[tick.symbol] = self.create_quote_row(tick.symbol)
+        row[1].push(tick.bid, tick.ask)
+        self.mark_dirty('quotes')
+        if 'sparklines' not in self.scheduled:
+            self.schedule('sparklines', config.SPARKLINE_INTERVAL, self.update_sparklines)
+    
+    def mark_dirty(self, part):
+        """Flag a part of the dashboard and request a refresh pass."""
+        self.dirty.add(part)
+        self.scheduler.request(self.update_display)
     
     def create_widgets(self):
         """Create the main screen widgets."""
@@ -89,17 +152,19 @@ class MainScreen(tk.Frame):
         profit_frame = tk.Frame(chart_frame, bg=config.COLORS['bg_secondary'])
         profit_frame.pack(fill=tk.X, padx=10)
         
-        tk.Label(profit_frame, text="58%", font=('Arial', 24, 'bold'),
-                bg=config.COLORS['bg_secondary'], 
-                fg=config.COLORS['success']).pack(side=tk.LEFT)
+        self.total_profit_label = tk.Label(profit_frame, text="0%", font=('Arial', 24, 'bold'),
+                                          bg=config.COLORS['bg_secondary'], 
+                                          fg=config.COLORS['success'])
+        self.total_profit_label.pack(side=tk.LEFT)
         tk.Label(profit_frame, text="Total profit/loss", font=('Arial', 10),
                 bg=config.COLORS['bg_secondary'],
                 fg=config.COLORS['text_secondary']).pack(side=tk.LEFT, padx=(10, 0))
         
         # Today's profit
-        tk.Label(profit_frame, text="6%", font=('Arial', 14, 'bold'),
-                bg=config.COLORS['bg_secondary'],
-                fg=config.COLORS['success']).pack(side=tk.LEFT, padx=(20, 0))
+        self.today_profit_label = tk.Label(profit_frame, text="0%", font=('Arial', 14, 'bold'),
+                                          bg=config.COLORS['bg_secondary'],
+                                          fg=config.COLORS['success'])
+        self.today_profit_label.pack(side=tk.LEFT, padx=(20, 0))
         tk.Label(profit_frame, text="Today profit/loss", font=('Arial', 8),
                 bg=config.COLORS['bg_secondary'],
                 fg=config.COLORS['text_secondary']).pack(side=tk.LEFT, padx=(5, 0))
@@ -128,6 +193,33 @@ class MainScreen(tk.Frame):
         
         tk.Label(terminal_frame, text="MT5 TERMINAL", font=('Arial', 10, 'bold'),
                 bg=config.COLORS['bg_secondary']).pack(pady=10)
+        
+        self.quotes_frame = tk.Frame(terminal_frame, bg=config.COLORS['bg_secondary'])
+        self.quotes_frame.pack(padx=10, pady=(0, 10), anchor='w')
+        self.quotes_label = tk.Label(self.quotes_frame, text="Waiting for quotes...",
+                                    font=('Courier', 9), justify=tk.LEFT,
+                                    bg=config.COLORS['bg_secondary'],
+                                    fg=config.COLORS['text_secondary'])
+        self.quotes_label.grid(row=0, column=0, sticky='w')
+        
+        # Frame-time statistics when instrumentation is enabled
+        if profiler.enabled:
+            self.profiler_overlay = ProfilerOverlay(terminal_frame, profiler,
+                                                    bg=config.COLORS['bg_secondary'])
+            self.profiler_overlay.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+    
+    def create_quote_row(self, symbol):
+        """Add a quote line and a bid/ask sparkline for a newly quoted symbol."""
+        if not self.quote_rows:
+            self.quotes_label.destroy()
+        row = len(self.quote_rows)
+        label = tk.Label(self.quotes_frame, text=symbol, font=('Courier', 9),
+                        bg=config.COLORS['bg_secondary'], fg=config.COLORS['text_secondary'])
+        label.grid(row=row, column=0, sticky='w')
+        sparkline = Sparkline(self.quotes_frame, lines=2, width=100, height=14,
+                              colors=(config.COLORS['success'], config.COLORS['error']))
+        sparkline.grid(row=row, column=1, padx=(10, 0))
+        return label, sparkline
     
     def create_control_section(self, parent):
         """Create the control section."""
@@ -137,10 +229,12 @@ class MainScreen(tk.Frame):
         control_frame.pack_propagate(False)
         
         # Drawdown display
-        tk.Label(control_frame, text="Drawdown: 0.00%", font=('Arial', 10),
-                bg=config.COLORS['bg_secondary']).pack(pady=5)
-        tk.Label(control_frame, text="Trades: 0", font=('Arial', 10),
-                bg=config.COLORS['bg_secondary']).pack(pady=5)
+        self.drawdown_label = tk.Label(control_frame, text="Drawdown: 0.00%", font=('Arial', 10),
+                                      bg=config.COLORS['bg_secondary'])
+        self.drawdown_label.pack(pady=5)
+        self.trades_label = tk.Label(control_frame, text="Trades: 0", font=('Arial', 10),
+                                    bg=config.COLORS['bg_secondary'])
+        self.trades_label.pack(pady=5)
         
         # Start/Stop button
         self.start_button = tk.Button(control_frame, text="START", 
@@ -167,20 +261,79 @@ class MainScreen(tk.Frame):
         self.strategy_list.pack_propagate(False)
     
     def update_display(self):
-        """Update the display with current data."""
+        """Refresh only the widgets whose data changed since the last update."""
         # Update stats
-        account = self.data_manager.get_account_info()
+        if 'account' in self.dirty:
+            with profiler.section('update_display.account'):
+                account = self.data_manager.get_account_info()
+                self.balance_card.set_value(f"{account.balance:.2f}")
+                self.equity_card.set_value(f"{account.equity:.2f}")
+                self.drawdown_label.configure(text=f"Drawdown: {account.drawdown:.2f}%")
+                self.trades_label.configure(
+                    text=f"Trades: {self.data_manager.get_metrics().open_trades}")
         
         # Update chart
-        profit_data = self.data_manager.get_profit_history()
-        self.profit_chart.update_data(profit_data)
+        if 'profit' in self.dirty:
+            with profiler.section('update_display.chart'):
+                profit_data = self.data_manager.get_profit_history()
+                self.profit_chart.update_data(profit_data)
+        
+        if self.dirty & {'account', 'profit'}:
+            with profiler.section('update_display.summary'):
+                self.update_profit_summary()
         
         # Update strategies
-        strategies = self.data_manager.get_strategies()
-        self.strategy_list.update_strategies(strategies)
+        with profiler.section('update_display.strategies'):
+            if 'strategies' in self.dirty:
+                strategies = self.data_manager.get_strategies()
+                self.strategy_list.update_strategies(strategies)
+            else:
+                for strategy in self.changed_strategies.values():
+                    self.strategy_list.update_strategy(strategy)
+        
+        # Update quotes
+        if 'quotes' in self.dirty:
+            with profiler.section('update_display.quotes'):
+                self.update_quotes()
         
-        # Schedule next update
-        self.after(config.CHART_UPDATE_INTERVAL, self.update_display)
+        self.dirty.clear()
+        self.changed_strategies.clear()
+    
+    def update_profit_summary(self):
+        """Show total and today's profit as a percentage of the balance."""
+        account = self.data_manager.get_account_info()
+        series = self.data_manager.get_profit_history()
+        midnight = datetime.combine(date.today(), datetime.min.time()).timestamp()
+        
+        for label, profit in ((self.total_profit_label, series.last_cumulative()),
+                              (self.today_profit_label, series.sum_since(midnight))):
+            percent = profit / account.balance * 100 if account.balance else 0.0
+            color = config.COLORS['success'] if percent >= 0 else config.COLORS['error']
+            label.configure(text=f"{percent:.0f}%", fg=color)
+    
+    def update_quotes(self):
+        """Show the latest bid/ask of every quoted symbol."""
+        for symbol, tick in self.data_manager.get_quotes().items():
+            row = self.quote_rows.get(symbol)
+            if row is None:
+                row = self.quote_rows[symbol] = self.create_quote_row(symbol)
+                row[1].push(tick.bid, tick.ask)
+            row[0].configure(text=f"{symbol:<8}{tick.bid:>12.5g}{tick.ask:>12.5g}")
+    
+    def update_sparklines(self):
+        """Redraw the quote sparklines and sample the visible strategies' P&L into theirs.
+
+        Runs on its own SPARKLINE_INTERVAL timer, armed by incoming quotes,
+        rather than in the rate-capped refresh pass. Only the rows on screen
+        are sampled; a strategy's sparkline fills in while it is visible.
+        """
+        with profiler.section('sparklines'):
+            for _, sparkline in self.quote_rows.values():
+                sparkline.draw()
+            visible = self.strategy_list.visible_strategies()
+            floating = self.data_manager.get_trade_book().floating_for(strategy.id for strategy in visible)
+            self.strategy_list.record_pnl({strategy.id: strategy.profit + floating[strategy.id]
+                                           for strategy in visible})
     
     def toggle_trading(self):
         """Toggle trading start/stop."""
@@ -0,0 +1,50 @@
+"""Screen manager that keeps screens alive across navigation."""
+
+import tkinter as tk
+from src.utils.instrumentation import profiler
+
+class ScreenManager:
+    """Builds each screen once and switches between them by hiding and showing."""
+    
+    def __init__(self, container):
+        self.container = container
+        self.factories = {}
+        self.screens = {}
+        self.current = None
+    
+    def register(self, name, factory):
+        """Register a factory that builds the named screen on first use."""
+        self.factories[name] = factory
+    
+    def show(self, name):
+        """Show the named screen, building it if needed, and hide the current one."""
+        if self.current == name:
+            return self.screens[name]
+        
+        screen = self.screens.get(name)
+        if screen is None:
+            with profiler.section(f'screen.build:{name}'):
+                screen = self.factories[name]()
+            self.screens[name] = screen
+        
+        with profiler.section(f'screen.switch:{name}'):
+            if self.current:
+                previous = self.screens[self.current]
+                previous.on_hide()
+                previous.pack_forget()
+            
+            screen.pack(fill=tk.BOTH, expand=True)
+            screen.on_show()
+        self.current = name
+        return screen
+    
+    def get_current(self):
+        """Get the currently visible screen, if any."""
+        return self.screens.get(self.current)
+    
+    def destroy_all(self):
+        """Destroy every built screen."""
+        for screen in self.screens.values():
+            screen.destroy()
+        self.screens.clear()
+        self.current = None
\ No newline at end of file
@@ -3,13 +3,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import config
+from src.screens.base_screen import BaseScreen
 
-class SettingsScreen(tk.Frame):
+class SettingsScreen(BaseScreen):
     """Settings and configuration screen."""
     
-    def __init__(self, parent):
-        super().__init__(parent, bg=config.COLORS['bg_primary'])
-        self.pack(fill=tk.BOTH, expand=True)
+    def __init__(self, parent, scheduler):
+        super().__init__(parent)
+        self.scheduler = scheduler
         self.create_widgets()
     
     def create_widgets(self):
@@ -100,7 +101,7 @@ class SettingsScreen(tk.Frame):
                 bg=config.COLORS['bg_secondary']).grid(row=1, column=0, sticky='w', padx=10, pady=5)
         self.timeframe_var = tk.StringVar(value=config.DEFAULT_TIMEFRAME)
         timeframe_combo = ttk.Combobox(section_frame, textvariable=self.timeframe_var, 
-                                      values=['M1', 'M5', 'M15', 'M30', 'H1', 'H4', 'D1'], width=8)
+                                      values=list(config.TIMEFRAMES), width=8)
         timeframe_combo.grid(row=1, column=1, padx=10, pady=5)
         
         # Save and Reset buttons
@@ -123,8 +124,11 @@ class SettingsScreen(tk.Frame):
             max_loss = float(self.max_loss_var.get())
             balance = float(self.balance_var.get())
             update_interval = int(self.update_interval_var.get())
+            if update_interval <= 0:
+                raise ValueError("update interval must be positive")
             
-            # Save settings (in a real app, this would persist to file)
+            # Apply the refresh rate live (in a real app, this would also persist to file)
+            self.scheduler.set_interval(update_interval)
             messagebox.showinfo("Success", "Settings saved successfully!")
             
         except ValueError:
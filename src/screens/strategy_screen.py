@@ -3,17 +3,82 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import config
-from src.utils.data_manager import DataManager
+from src.components.widgets import StrategyTable, TableColumn, status_color, profit_color
+from src.screens.base_screen import BaseScreen
+from src.utils.backtest import ChannelParams, backtest_strategy
+from src.utils.history_io import HistoryJob
+from src.utils.parameter_sweep import ParameterSweep
+from src.utils.data_manager import STRATEGY_CHANGED, STRATEGIES_CHANGED, TRADE_CLOSED, BAR_CLOSED
 
-class StrategyScreen(tk.Frame):
+class StrategyScreen(BaseScreen):
     """Strategy management screen."""
     
-    def __init__(self, parent):
-        super().__init__(parent, bg=config.COLORS['bg_primary'])
-        self.pack(fill=tk.BOTH, expand=True)
-        self.data_manager = DataManager()
+    def __init__(self, parent, data_manager, scheduler):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.scheduler = scheduler
+        self.changed_strategies = {}
+        self.sweep = None
+        self.best_result = None
+        self.backtest = None  # (HistoryJob, strategy) while a backtest runs
         self.create_widgets()
+    
+    def on_show(self):
+        """Reload the table and listen for strategy changes."""
+        super().on_show()
         self.load_strategies()
+        self.data_manager.subscribe(STRATEGY_CHANGED, self.on_strategy_changed)
+        self.data_manager.subscribe(STRATEGIES_CHANGED, self.on_strategies_changed)
+        self.data_manager.subscribe(TRADE_CLOSED, self.on_trade_closed)
+        self.data_manager.subscribe(BAR_CLOSED, self.on_bar_closed)
+        if self.sweep:
+            self.poll_sweep()
+        if self.backtest:
+            self.poll_backtest()
+    
+    def on_hide(self):
+        """Stop listening for strategy changes while hidden."""
+        super().on_hide()
+        self.data_manager.unsubscribe(STRATEGY_CHANGED, self.on_strategy_changed)
+        self.data_manager.unsubscribe(STRATEGIES_CHANGED, self.on_strategies_changed)
+        self.data_manager.unsubscribe(TRADE_CLOSED, self.on_trade_closed)
+        self.data_manager.unsubscribe(BAR_CLOSED, self.on_bar_closed)
+        self.scheduler.cancel(self.update_changed_rows)
+        self.scheduler.cancel(self.load_strategies)
+        self.changed_strategies.clear()
+    
+    def on_destroy(self):
+        """Cancel a running sweep before the screen goes away."""
+        if self.sweep:
+            self.sweep.cancel()
+        super().on_destroy()
+    
+    def on_strategy_changed(self, strategy):
+        """Queue the row of a changed strategy for the next refresh pass."""
+        self.changed_strategies[strategy.id] = strategy
+        self.scheduler.request(self.update_changed_rows)
+    
+    def on_strategies_changed(self, strategies):
+        """Reload the table when strategies are added or removed."""
+        self.scheduler.request(self.load_strategies)
+    
+    def on_trade_closed(self, trade):
+        """Reload the table so the analytics columns and their sort order catch up."""
+        self.scheduler.request(self.load_strategies)
+    
+    def on_bar_closed(self, bar):
+        """Queue the rows of strategies trading the closed bar's symbol and timeframe."""
+        for strategy in self.data_manager.get_strategies():
+            if strategy.symbol == bar.symbol and strategy.timeframe == bar.timeframe:
+                self.changed_strategies[strategy.id] = strategy
+        if self.changed_strategies:
+            self.scheduler.request(self.update_changed_rows)
+    
+    def update_changed_rows(self):
+        """Repaint the rows of strategies changed since the last pass."""
+        for strategy in self.changed_strategies.values():
+            self.strategy_table.update_strategy(strategy)
+        self.changed_strategies.clear()
     
     def create_widgets(self):
         """Create the strategy screen widgets."""
@@ -41,18 +106,77 @@ class StrategyScreen(tk.Frame):
         list_frame = tk.Frame(parent, bg=config.COLORS['bg_secondary'], relief='raised', bd=1)
         list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
         
-        # Headers
-        headers = ['ID', 'Name', 'Symbol', 'Timeframe', 'Status', 'Profit', 'Trades']
-        header_frame = tk.Frame(list_frame, bg=config.COLORS['bg_secondary'])
-        header_frame.pack(fill=tk.X, padx=10, pady=5)
+        # Strategy table
+        columns = [
+            TableColumn('ID', 8, lambda strategy, index: strategy.id, sort_key=lambda strategy: strategy.id),
+            TableColumn('Name', 12, lambda strategy, index: strategy.name, sort_key=lambda strategy: strategy.name),
+            TableColumn('Symbol', 8, lambda strategy, index: strategy.symbol,
+                        sort_key=lambda strategy: strategy.symbol),
+            TableColumn('Timeframe', 9, lambda strategy, index: strategy.timeframe,
+                        sort_key=lambda strategy: config.TIMEFRAMES.get(strategy.timeframe)),
+            TableColumn('Status', 8, lambda strategy, index: strategy.status, status_color,
+                        sort_key=lambda strategy: strategy.status),
+            TableColumn('Profit', 9, lambda strategy, index: f"{strategy.profit:.1f}", profit_color,
+                        sort_key=lambda strategy: strategy.profit),
+            TableColumn('Trades', 7, lambda strategy, index: str(strategy.trades_count),
+                        sort_key=lambda strategy: strategy.trades_count),
+            self.metric_column('Sharpe', 'sharpe', '{:.2f}'),
+            self.metric_column('Sortino', 'sortino', '{:.2f}'),
+            self.metric_column('Win %', 'win_rate', '{:.1f}'),
+            self.metric_column('PF', 'profit_factor', '{:.2f}'),
+            self.metric_column('Max DD', 'max_drawdown', '{:.1f}'),
+            self.metric_column('Expect.', 'expectancy', '{:.2f}'),
+            TableColumn('Last Bar', 9, lambda strategy, index: self.last_bar_text(strategy),
+                        sort_key=self.last_close),
+        ]
+        self.strategy_table = StrategyTable(list_frame, columns, bg=config.COLORS['bg_secondary'])
+        self.strategy_table.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        for header in headers:
-            tk.Label(header_frame, text=header, font=('Arial', 10, 'bold'),
-                    bg=config.COLORS['bg_secondary'], width=12).pack(side=tk.LEFT, padx=5)
+        # Backtest results for the selected strategy
+        self.backtest_label = tk.Label(parent, text="Select a strategy and press Backtest",
+                                      font=('Courier', 10), anchor='w', justify=tk.LEFT,
+                                      bg=config.COLORS['bg_primary'],
+                                      fg=config.COLORS['text_secondary'])
+        self.backtest_label.pack(fill=tk.X, pady=(0, 10))
         
-        # Strategy list
-        self.strategy_frame = tk.Frame(list_frame, bg=config.COLORS['bg_primary'])
-        self.strategy_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        # Parameter sweep progress
+        sweep_frame = tk.Frame(parent, bg=config.COLORS['bg_primary'])
+        sweep_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        self.sweep_progress = ttk.Progressbar(sweep_frame, mode='determinate', length=300)
+        self.sweep_progress.pack(side=tk.LEFT)
+        
+        self.cancel_sweep_button = tk.Button(sweep_frame, text="Cancel", state=tk.DISABLED,
+                                            command=self.cancel_sweep)
+        self.cancel_sweep_button.pack(side=tk.LEFT, padx=5)
+        
+        self.sweep_label = tk.Label(sweep_frame, text="", font=('Courier', 10), anchor='w',
+                                   bg=config.COLORS['bg_primary'],
+                                   fg=config.COLORS['text_secondary'])
+        self.sweep_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+    
+    def metric_column(self, header, metric, spec):
+        """Build a sortable column showing one performance metric of the closed trades."""
+        def value(strategy):
+            return self.data_manager.get_analytics().value(strategy.id, metric)
+        
+        def text(strategy, index):
+            number = value(strategy)
+            if number is None:
+                return "-"
+            return "\u221e" if number == float('inf') else spec.format(number)
+        
+        return TableColumn(header, 7, text, sort_key=value)
+    
+    def last_close(self, strategy):
+        """Get the close of the strategy's last completed live bar, or None before one closes."""
+        bars = self.data_manager.get_bars(strategy.symbol, strategy.timeframe, 1)
+        return float(bars.close[-1]) if len(bars) else None
+    
+    def last_bar_text(self, strategy):
+        """Format the last bar's close for the table."""
+        close = self.last_close(strategy)
+        return "-" if close is None else f"{close:.5g}"
     
     def create_control_buttons(self, parent):
         """Create control buttons."""
@@ -74,40 +198,118 @@ class StrategyScreen(tk.Frame):
         tk.Button(button_frame, text="Stop All",
                  bg=config.COLORS['warning'], fg='white',
                  command=self.stop_all).pack(side=tk.LEFT, padx=5)
+        
+        self.backtest_button = tk.Button(button_frame, text="Backtest",
+                                        bg=config.COLORS['text_secondary'], fg='white',
+                                        command=self.run_backtest)
+        self.backtest_button.pack(side=tk.LEFT, padx=5)
+        
+        self.optimize_button = tk.Button(button_frame, text="Optimize",
+                                        bg=config.COLORS['text_secondary'], fg='white',
+                                        command=self.start_sweep)
+        self.optimize_button.pack(side=tk.LEFT, padx=5)
+        
+        self.status_label = tk.Label(button_frame, text="", font=('Arial', 10),
+                                    bg=config.COLORS['bg_primary'],
+                                    fg=config.COLORS['text_secondary'])
+        self.status_label.pack(side=tk.RIGHT, padx=5)
     
     def load_strategies(self):
         """Load and display strategies."""
-        # Clear existing
-        for widget in self.strategy_frame.winfo_children():
-            widget.destroy()
-        
         strategies = self.data_manager.get_strategies()
-        for strategy in strategies:
-            self.add_strategy_row(strategy)
-    
-    def add_strategy_row(self, strategy):
-        """Add a strategy row to the list."""
-        row_frame = tk.Frame(self.strategy_frame, bg=config.COLORS['bg_secondary'])
-        row_frame.pack(fill=tk.X, pady=2)
-        
-        # Strategy data
-        data = [strategy.id, strategy.name, strategy.symbol, 
-                strategy.timeframe, strategy.status, 
-                f"{strategy.profit:.1f}", str(strategy.trades_count)]
-        
-        for i, value in enumerate(data):
-            if i == 4:  # Status column
-                color = config.COLORS['success'] if value == 'ACTIVE' else config.COLORS['warning']
-                label = tk.Label(row_frame, text=value, width=12, fg=color,
-                               bg=config.COLORS['bg_secondary'])
-            elif i == 5:  # Profit column
-                color = config.COLORS['success'] if float(value) >= 0 else config.COLORS['error']
-                label = tk.Label(row_frame, text=value, width=12, fg=color,
-                               bg=config.COLORS['bg_secondary'])
-            else:
-                label = tk.Label(row_frame, text=value, width=12,
-                               bg=config.COLORS['bg_secondary'])
-            label.pack(side=tk.LEFT, padx=5)
+        self.strategy_table.update_strategies(strategies)
+    
+    def run_backtest(self):
+        """Backtest the selected strategy on a worker thread."""
+        strategy = self.strategy_table.get_selected()
+        if strategy is None:
+            messagebox.showwarning("Backtest", "Select a strategy first")
+            return
+        
+        job = HistoryJob(lambda job, strategy: backtest_strategy(strategy), strategy)
+        self.backtest = (job, strategy)
+        self.backtest_button.config(state=tk.DISABLED)
+        self.backtest_label.config(text=f"Backtesting {strategy.name}...", fg=config.COLORS['text_secondary'])
+        job.start()
+        self.poll_backtest()
+    
+    def poll_backtest(self):
+        """Show the backtest summary once its worker has finished."""
+        job, strategy = self.backtest
+        if not job.done:
+            self.schedule('poll_backtest', config.HISTORY_JOB_POLL_INTERVAL, self.poll_backtest)
+            return
+        
+        self.backtest = None
+        self.backtest_button.config(state=tk.NORMAL)
+        if job.error:
+            self.backtest_label.config(text=f"Backtest of {strategy.name} failed: {job.error}",
+                                       fg=config.COLORS['error'])
+            return
+        result = job.result
+        stats = result.stats
+        self.backtest_label.config(
+            text=(f"{strategy.name}: {stats['trades']} trades over {result.bars:,} bars "
+                  f"in {result.elapsed * 1000:.0f} ms\n"
+                  f"Net {stats['net_profit']:.2f} ({stats['return_pct']:+.1f}%)  "
+                  f"Win {stats['win_rate']:.1f}%  PF {stats['profit_factor']:.2f}  "
+                  f"Max DD {stats['max_drawdown']:.1f}%"),
+            fg=config.COLORS['success'] if stats['net_profit'] >= 0 else config.COLORS['error'])
+    
+    def start_sweep(self):
+        """Sweep the channel parameter grid for the selected strategy's symbol."""
+        strategy = self.strategy_table.get_selected()
+        if strategy is None:
+            messagebox.showwarning("Optimize", "Select a strategy first")
+            return
+        
+        direction = ChannelParams.for_strategy(strategy).direction
+        self.sweep = ParameterSweep([strategy.symbol], config.SWEEP_TIMEFRAMES,
+                                    config.SWEEP_ENTRY_PERIODS, config.SWEEP_EXIT_PERIODS,
+                                    config.SWEEP_STOP_LOSSES, direction=direction)
+        self.best_result = None
+        self.sweep_progress.configure(maximum=self.sweep.total, value=0)
+        self.sweep_label.config(text=f"Optimizing {strategy.symbol} on {self.sweep.workers} cores...")
+        self.optimize_button.config(state=tk.DISABLED)
+        self.cancel_sweep_button.config(state=tk.NORMAL)
+        self.sweep.start()
+        self.poll_sweep()
+    
+    def cancel_sweep(self):
+        """Stop the running sweep; results received so far are kept."""
+        if self.sweep:
+            self.sweep.cancel()
+            self.cancel_sweep_button.config(state=tk.DISABLED)
+    
+    def poll_sweep(self):
+        """Drain streamed sweep results and update the progress display."""
+        sweep = self.sweep
+        for result in sweep.drain():
+            if self.best_result is None or result.stats['net_profit'] > self.best_result.stats['net_profit']:
+                self.best_result = result
+        self.sweep_progress.configure(value=sweep.completed)
+        
+        best = self.best_result
+        status = f"{sweep.completed}/{sweep.total}"
+        if best:
+            params = best.params
+            status += (f"  best {best.timeframe} entry {params.entry_period} exit {params.exit_period} "
+                       f"stop {params.stop_loss * 100:.1f}%: net {best.stats['net_profit']:.2f} "
+                       f"PF {best.stats['profit_factor']:.2f}")
+        
+        if not sweep.done:
+            self.sweep_label.config(text=status)
+            self.schedule('poll_sweep', config.SWEEP_DRAIN_INTERVAL, self.poll_sweep)
+            return
+        
+        if sweep.error:
+            status = f"Sweep failed: {sweep.error}"
+        elif sweep.cancelled.is_set():
+            status = "Cancelled " + status
+        self.sweep_label.config(text=status)
+        self.optimize_button.config(state=tk.NORMAL)
+        self.cancel_sweep_button.config(state=tk.DISABLED)
+        self.sweep = None
     
     def add_strategy(self):
         """Add new strategy dialog."""
@@ -119,14 +321,20 @@ class StrategyScreen(tk.Frame):
     
     def start_all(self):
         """Start all strategies."""
-        for strategy in self.data_manager.get_strategies():
-            self.data_manager.update_strategy_status(strategy.id, "ACTIVE")
-        self.load_strategies()
-        messagebox.showinfo("Success", "All strategies started")
+        self.set_all_status("ACTIVE", "Started")
     
     def stop_all(self):
         """Stop all strategies."""
-        for strategy in self.data_manager.get_strategies():
-            self.data_manager.update_strategy_status(strategy.id, "INACTIVE")
-        self.load_strategies()
-        messagebox.showinfo("Success", "All strategies stopped")
\ No newline at end of file
+        self.set_all_status("INACTIVE", "Stopped")
+    
+    def set_all_status(self, status, verb):
+        """Apply a status to every strategy in one batch and report it inline."""
+        ids = [strategy.id for strategy in self.data_manager.get_strategies()]
+        changed = self.data_manager.set_strategies_status(ids, status)
+        self.show_status(f"{verb} {len(changed)} of {len(ids)} strategies")
+    
+    def show_status(self, message):
+        """Show a transient status message next to the control buttons."""
+        self.status_label.config(text=message)
+        self.schedule('clear_status', config.STATUS_MESSAGE_TIMEOUT,
+                      lambda: self.status_label.config(text=""))
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""Incremental account metrics: equity, margin and drawdown."""
+
+import config
+from src.models.trading_data import Account, Trade
+from src.models.trade_book import TradeBook
+
+class AccountMetrics:
+    """Keeps an Account's derived fields current from fills and repricing.
+
+    Equity comes from the trade book's running floating profit, margin is
+    adjusted only when a trade opens or closes, and drawdown is measured
+    against the running peak equity, so each update is O(1) regardless of
+    how many positions are open.
+    """
+    
+    def __init__(self, account: Account, trade_book: TradeBook, leverage: float = None):
+        self.account = account
+        self.trade_book = trade_book
+        self.leverage = leverage or config.ACCOUNT_LEVERAGE
+        
+        # One full pass at start-up; everything after is incremental
+        size = trade_book.size
+        is_open = trade_book.is_open[:size]
+        notional = (trade_book.volume[:size] * trade_book.contract_size[:size]
+                    * trade_book.open_price[:size])
+        self.margin_used = float(notional[is_open].sum()) / self.leverage
+        self.peak_equity = account.balance + trade_book.floating_profit
+        self.refresh()
+    
+    @property
+    def open_trades(self) -> int:
+        return self.trade_book.open_count
+    
+    def margin_for(self, trade: Trade) -> float:
+        """Margin required to hold a trade."""
+        contract_size = config.CONTRACT_SIZES.get(trade.symbol, 1.0)
+        return trade.volume * contract_size * trade.open_price / self.leverage
+    
+    def on_trade_opened(self, trade: Trade):
+        """Reserve margin for a newly opened trade."""
+        self.margin_used += self.margin_for(trade)
+    
+    def on_trade_closed(self, trade: Trade):
+        """Release margin and realize the trade's profit into the balance."""
+        self.margin_used = max(0.0, self.margin_used - self.margin_for(trade))
+        self.account.balance += trade.profit
+    
+    def refresh(self) -> bool:
+        """Recompute the derived account fields; returns True if any changed."""
+        equity = self.account.balance + self.trade_book.floating_profit
+        self.peak_equity = max(self.peak_equity, equity)
+        drawdown = (self.peak_equity - equity) / self.peak_equity * 100 if self.peak_equity > 0 else 0.0
+        
+        values = (equity, self.margin_used, equity - self.margin_used, drawdown)
+        current = (self.account.equity, self.account.margin_used,
+                   self.account.margin_free, self.account.drawdown)
+        if values == current:
+            return False
+        (self.account.equity, self.account.margin_used,
+         self.account.margin_free, self.account.drawdown) = values
+        return True
\ No newline at end of file
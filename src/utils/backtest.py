@@ -0,0 +1,199 @@
+"""Vectorized channel-breakout backtester over NumPy OHLC arrays."""
+
+from dataclasses import dataclass
+import time
+from typing import Dict, Optional
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+import config
+from src.models.time_series import PriceBars
+from src.utils.history_store import default_store
+from src.utils.market_feed import SIM_PRICES
+
+YEAR_SECONDS = 365 * 86400
+SIM_VOLATILITY = 0.20  # annualized, for generated history
+
+# One record per closed trade; times are POSIX seconds
+TRADE_DTYPE = np.dtype([
+    ('entry_time', 'f8'), ('exit_time', 'f8'),
+    ('entry_price', 'f8'), ('exit_price', 'f8'),
+    ('profit', 'f8'), ('stopped', '?'),
+])
+
+@dataclass
+class ChannelParams:
+    """Parameters of a channel-breakout strategy."""
+    entry_period: int = config.BACKTEST_ENTRY_PERIOD
+    exit_period: int = config.BACKTEST_EXIT_PERIOD
+    stop_loss: float = config.BACKTEST_STOP_LOSS  # fraction of the entry price, 0 disables
+    volume: float = config.BACKTEST_VOLUME
+    direction: int = 1  # 1 for long, -1 for short
+    
+    @classmethod
+    def for_strategy(cls, strategy, **overrides) -> 'ChannelParams':
+        """Build parameters for a strategy; S_ names trade the short side."""
+        overrides.setdefault('direction', -1 if strategy.name.startswith('S_') else 1)
+        return cls(**overrides)
+
+@dataclass
+class BacktestResult:
+    """Trades, per-bar equity curve and summary statistics of one run."""
+    trades: np.ndarray  # TRADE_DTYPE records
+    equity: np.ndarray  # account equity at each bar close
+    stats: Dict[str, float]
+    bars: int
+    elapsed: float  # seconds
+
+def generate_ohlc(symbol: str, timeframe: str, count: int, seed: Optional[int] = None,
+                  end: Optional[float] = None) -> PriceBars:
+    """Generate a random-walk OHLC history ending at ``end`` (default now)."""
+    step = config.TIMEFRAMES[timeframe]
+    rng = np.random.default_rng(seed)
+    end = time.time() if end is None else end
+    times = (end // step * step) - step * np.arange(count - 1, -1, -1, dtype=np.float64)
+    
+    start = SIM_PRICES.get(symbol, (100.0, 0.01))[0]
+    sigma = SIM_VOLATILITY * np.sqrt(step / YEAR_SECONDS)
+    close = start * np.exp(np.cumsum(rng.normal(0.0, sigma, count)))
+    opens = np.empty(count)
+    opens[0] = start
+    opens[1:] = close[:-1]
+    wicks = np.abs(rng.normal(0.0, sigma / 2, (2, count)))
+    high = np.maximum(opens, close) * (1.0 + wicks[0])
+    low = np.minimum(opens, close) * (1.0 - wicks[1])
+    volume = rng.integers(10, 1000, count).astype(np.float64)
+    return PriceBars(times, opens, high, low, close, volume)
+
+def run_backtest(bars: PriceBars, params: ChannelParams, contract_size: float = 1.0,
+                 balance: float = config.DEFAULT_BALANCE) -> BacktestResult:
+    """Backtest a channel breakout over ``bars`` without a per-bar Python loop.
+
+    Signals are evaluated on bar closes and filled at the next bar's open.
+    Once stopped out, a trade is re-entered only after a fresh exit/entry
+    signal pair, so the regime never flips on a stop alone.
+    """
+    started = time.perf_counter()
+    n = len(bars)
+    opens, high, low, close = bars.open, bars.high, bars.low, bars.close
+    d = params.direction
+    
+    if d > 0:
+        entry = close > _channel(high, params.entry_period, np.max)
+        exit_ = close < _channel(low, params.exit_period, np.min)
+    else:
+        entry = close < _channel(low, params.entry_period, np.min)
+        exit_ = close > _channel(high, params.exit_period, np.max)
+    
+    # Forward-fill the most recent signal into a regime, then act on the next bar
+    signal = np.full(n, -1, dtype=np.int8)
+    signal[exit_] = 0
+    signal[entry] = 1
+    last = np.where(signal >= 0, np.arange(n), 0)
+    np.maximum.accumulate(last, out=last)
+    held = np.zeros(n, dtype=bool)
+    held[1:] = signal[last[:-1]] == 1
+    
+    change = np.diff(held.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(change == 1)
+    ends = np.flatnonzero(change == -1)  # first bar flat again, n if still open
+    if len(starts) == 0:
+        equity = np.full(n, float(balance))
+        return BacktestResult(np.empty(0, TRADE_DTYPE), equity, _stats(np.empty(0), equity, balance),
+                              n, time.perf_counter() - started)
+    
+    entry_prices = opens[starts]
+    exit_bars = ends.copy()
+    exit_prices = np.where(ends < n, opens[np.minimum(ends, n - 1)], close[-1])
+    segment = np.cumsum(change[:-1] == 1) - 1
+    stopped = np.zeros(len(starts), dtype=bool)
+    
+    if params.stop_loss > 0:
+        # First bar of each segment whose adverse extreme touches the stop
+        stop_prices = entry_prices * (1.0 - d * params.stop_loss)
+        adverse = low if d > 0 else high
+        hit_bars = np.flatnonzero(held & ((adverse - stop_prices[np.maximum(segment, 0)]) * d <= 0))
+        hit_segments, first = np.unique(segment[hit_bars], return_index=True)
+        stop_bars = hit_bars[first]
+        stops = stop_prices[hit_segments]
+        # A gap through the stop fills at the open
+        gap_fill = np.minimum if d > 0 else np.maximum
+        stopped[hit_segments] = True
+        exit_bars[hit_segments] = stop_bars
+        exit_prices[hit_segments] = gap_fill(opens[stop_bars], stops)
+    
+    scale = d * params.volume * contract_size
+    profit = (exit_prices - entry_prices) * scale
+    
+    # Equity = balance + realized P&L so far + open trade marked at the close
+    marks = np.zeros(n + 1, dtype=np.int32)
+    np.add.at(marks, starts, 1)
+    np.add.at(marks, exit_bars, -1)
+    position = np.cumsum(marks[:-1]) > 0
+    realized = np.zeros(n + 1)
+    np.add.at(realized, exit_bars, profit)
+    unrealized = np.where(position, (close - entry_prices[np.maximum(segment, 0)]) * scale, 0.0)
+    equity = balance + np.cumsum(realized[:-1]) + unrealized
+    
+    trades = np.empty(len(starts), TRADE_DTYPE)
+    trades['entry_time'] = bars.time[starts]
+    trades['exit_time'] = bars.time[np.minimum(exit_bars, n - 1)]
+    trades['entry_price'] = entry_prices
+    trades['exit_price'] = exit_prices
+    trades['profit'] = profit
+    trades['stopped'] = stopped
+    return BacktestResult(trades, equity, _stats(profit, equity, balance),
+                          n, time.perf_counter() - started)
+
+def history_bars(symbol: str, timeframe: str) -> PriceBars:
+    """Get the last BACKTEST_YEARS of bars for a symbol and timeframe.
+
+    Bars come from the memory-mapped history store as zero-copy views.
+    Without an imported history, generated bars are used instead; they are
+    cached in the store's separate sample file, which never mixes with
+    imported data. With HISTORY_DIR unset the bars are generated in memory
+    every time.
+    """
+    span = config.BACKTEST_YEARS * YEAR_SECONDS
+    step = config.TIMEFRAMES[timeframe]
+    if config.HISTORY_DIR is None:
+        return generate_ohlc(symbol, timeframe, span // step)
+    
+    store = default_store()
+    sample = not store.exists(symbol, timeframe)
+    if sample and not store.exists(symbol, timeframe, sample=True):
+        store.append(symbol, timeframe, generate_ohlc(symbol, timeframe, span // step), sample=True)
+    history = store.open(symbol, timeframe, sample=sample)
+    if len(history) == 0:
+        return history.bars()
+    end = float(history.columns[0][len(history) - 1]) + step
+    return history.between(end - span, None)
+
+def backtest_strategy(strategy, bars: Optional[PriceBars] = None,
+                      params: Optional[ChannelParams] = None) -> BacktestResult:
+    """Backtest a Strategy over ``bars``, or over its default history."""
+    if bars is None:
+        bars = history_bars(strategy.symbol, strategy.timeframe)
+    params = params or ChannelParams.for_strategy(strategy)
+    return run_backtest(bars, params, config.CONTRACT_SIZES.get(strategy.symbol, 1))
+
+def _channel(values: np.ndarray, period: int, reducer) -> np.ndarray:
+    """Get the extreme of the previous ``period`` values at each bar (NaN while warming up)."""
+    channel = np.full(len(values), np.nan)
+    if len(values) > period:
+        channel[period:] = reducer(sliding_window_view(values, period)[:-1], axis=1)
+    return channel
+
+def _stats(profit: np.ndarray, equity: np.ndarray, balance: float) -> Dict[str, float]:
+    """Summarize closed-trade profits and the equity curve."""
+    wins = profit > 0
+    gross_win = float(profit[wins].sum())
+    gross_loss = float(-profit[~wins].sum())
+    peak = np.maximum.accumulate(equity)
+    return {
+        'trades': len(profit),
+        'net_profit': float(profit.sum()),
+        'win_rate': float(wins.mean() * 100) if len(profit) else 0.0,
+        'profit_factor': gross_win / gross_loss if gross_loss else float('inf'),
+        'max_drawdown': float(((peak - equity) / peak).max() * 100) if len(equity) else 0.0,
+        'return_pct': float((equity[-1] - balance) / balance * 100) if len(equity) else 0.0,
+    }
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""Streaming OHLCV bars for every configured timeframe from one pass over the ticks."""
+
+import threading
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import config
+from src.models.time_series import BarRing, PriceBars
+from src.models.trading_data import Bar, Tick
+
+# Fields of an open bar, kept as a list so ticks update it in place
+TIME, OPEN, HIGH, LOW, CLOSE, VOLUME = range(6)
+
+class BarAggregator:
+    """Maintains the open and completed bars of every timeframe and symbol as ticks arrive.
+
+    Only the smallest timeframe's bar sees individual ticks, so a tick costs
+    a few comparisons however many timeframes there are. When a tick opens a
+    new base bar, the finished one is folded into the open bar of each
+    larger timeframe and any of those whose period has ended are closed too.
+    Bars open on multiples of their length in UTC, so every timeframe must
+    be a multiple of the smallest (M1 through D1 are). Bars are built from
+    bid prices with the tick count as volume, and a period without ticks
+    produces no bar.
+
+    update() runs on the feed thread; current(), bars() and drain_closed()
+    may be called from the GUI thread and all take ``lock``.
+    """
+    
+    def __init__(self, timeframes: Dict[str, int] = config.TIMEFRAMES,
+                 capacity: int = config.BAR_HISTORY_LENGTH):
+        self.timeframes = sorted(timeframes.items(), key=lambda item: item[1])
+        self.base = self.timeframes[0][1]
+        uneven = [name for name, seconds in self.timeframes if seconds % self.base]
+        if uneven:
+            raise ValueError(f"Timeframes {', '.join(uneven)} are not multiples of {self.timeframes[0][0]}")
+        self.index = {name: i for i, (name, _) in enumerate(self.timeframes)}
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        # symbol -> open bar per timeframe, smallest first; larger ones hold the finished base bars only
+        self.open_bars: Dict[str, list] = {}
+        self.history: Dict[tuple, BarRing] = {}  # (symbol, timeframe) -> completed bars
+        self.closed: List[Bar] = []  # completed since the last drain_closed()
+        self.ticks = 0
+    
+    def update(self, ticks: Iterable[Tick]):
+        """Fold a batch of ticks into the bars; late ticks join the open bar."""
+        base = self.base
+        with self.lock:
+            for tick in ticks:
+                bars = self.open_bars.get(tick.symbol)
+                if bars is None:
+                    bars = self.open_bars[tick.symbol] = [None] * len(self.timeframes)
+                bar = bars[0]
+                price = tick.bid
+                if bar is not None and tick.time < bar[TIME] + base:
+                    if price > bar[HIGH]:
+                        bar[HIGH] = price
+                    if price < bar[LOW]:
+                        bar[LOW] = price
+                    bar[CLOSE] = price
+                    bar[VOLUME] += 1
+                else:
+                    self._roll(tick.symbol, bars, tick.time, price)
+                self.ticks += 1
+    
+    def current(self, symbol: str, timeframe: str) -> Optional[Bar]:
+        """Get the bar still forming for a symbol and timeframe, or None before its first tick."""
+        index = self.index[timeframe]
+        seconds = self.timeframes[index][1]
+        with self.lock:
+            bars = self.open_bars.get(symbol)
+            if bars is None:
+                return None
+            live = bars[0]
+            folded = bars[index]
+            if index == 0 or folded is None:
+                return Bar(symbol, timeframe, live[TIME] - live[TIME] % seconds, *live[OPEN:])
+            return Bar(symbol, timeframe, folded[TIME], folded[OPEN],
+                       max(folded[HIGH], live[HIGH]), min(folded[LOW], live[LOW]),
+                       live[CLOSE], folded[VOLUME] + live[VOLUME])
+    
+    def bars(self, symbol: str, timeframe: str, count: int = None) -> PriceBars:
+        """Get a copy of the newest ``count`` completed bars (all kept by default)."""
+        with self.lock:
+            ring = self.history.get((symbol, timeframe))
+            if ring is None:
+                return PriceBars(*np.empty((6, 0)))
+            return PriceBars(*(column.copy() for column in ring.bars(count).columns))
+    
+    def drain_closed(self) -> List[Bar]:
+        """Take the bars completed since the previous drain, oldest first."""
+        with self.lock:
+            closed, self.closed = self.closed, []
+            return closed
+    
+    def record_closed(self, bar: Bar):
+        """Store a bar completed elsewhere, e.g. by the engine."""
+        with self.lock:
+            self._store(bar.symbol, bar.timeframe, [bar.time, bar.open, bar.high, bar.low, bar.close, bar.volume])
+    
+    def _roll(self, symbol: str, bars: list, time: float, price: float):
+        """Start a new base bar and close every timeframe whose period ended."""
+        finished = bars[0]
+        bars[0] = [time - time % self.base, price, price, price, price, 1]
+        if finished is None:
+            return
+        self._close(symbol, 0, finished)
+        for i in range(1, len(self.timeframes)):
+            seconds = self.timeframes[i][1]
+            bar = bars[i]
+            if bar is None:
+                bar = bars[i] = [finished[TIME] - finished[TIME] % seconds] + finished[OPEN:]
+            else:
+                bar[HIGH] = max(bar[HIGH], finished[HIGH])
+                bar[LOW] = min(bar[LOW], finished[LOW])
+                bar[CLOSE] = finished[CLOSE]
+                bar[VOLUME] += finished[VOLUME]
+            if time >= bar[TIME] + seconds:
+                self._close(symbol, i, bar)
+                bars[i] = None
+    
+    def _close(self, symbol: str, index: int, bar: list):
+        """Keep a completed bar and queue it for drain_closed()."""
+        timeframe = self.timeframes[index][0]
+        self._store(symbol, timeframe, bar)
+        self.closed.append(Bar(symbol, timeframe, *bar))
+    
+    def _store(self, symbol: str, timeframe: str, bar: list):
+        """Append a completed bar to its symbol and timeframe's ring."""
+        ring = self.history.get((symbol, timeframe))
+        if ring is None:
+            ring = self.history[(symbol, timeframe)] = BarRing(self.capacity)
+        ring.append(*bar)
\ No newline at end of file
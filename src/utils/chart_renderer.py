@@ -0,0 +1,183 @@
+"""Off-thread Agg rasterization for chart widgets."""
+
+import logging
+import threading
+import numpy as np
+import config
+from src.utils.figure_pool import figure_pool
+from src.utils.instrumentation import profiler
+
+log = logging.getLogger(__name__)
+
+class ChartRenderer:
+    """Rasterizes chart specs with Agg on a worker thread into one reused RGBA frame.
+
+    The widget describes what to draw as a plain dict of arrays and limits
+    (see ProfitChart._request_render) and submit() returns its generation.
+    The worker borrows an offscreen Figure from the figure pool for as long
+    as it runs and the Tk thread never touches it; only the finished pixels
+    are shared, through ``frame`` under ``lock``.
+    A submission made while an older one is still waiting replaces it, and a
+    render that finishes after a newer submission is discarded, so stale
+    frames are never shown and the worker never falls behind the data.
+    A render that raises is logged and its exception kept in ``error`` for
+    the widget to react to.
+    """
+    
+    def __init__(self, dpi: int = config.CHART_RENDER_DPI):
+        self.dpi = dpi
+        self.lock = threading.Lock()
+        self.wakeup = threading.Condition(self.lock)
+        self.pending = None  # (generation, spec, width, height)
+        self.generation = 0
+        self.drawing = False
+        self.closed = False
+        self.error = None
+        
+        # Newest finished frame and the geometry needed to map mouse positions onto it
+        self.frame = None
+        self.frame_generation = 0
+        self.frame_axes = None  # (left, top, right, bottom) of the axes in pixels
+        self.frame_xlim = None
+        self.rendered = 0
+        self.dropped = 0
+        
+        self.thread = threading.Thread(target=self._run, name='ChartRenderer', daemon=True)
+        self.thread.start()
+    
+    def submit(self, spec: dict, width: int, height: int) -> int:
+        """Queue a spec for rendering at a pixel size; returns its generation."""
+        with self.wakeup:
+            if self.pending is not None:
+                self.dropped += 1
+            self.generation += 1
+            self.pending = (self.generation, spec, max(1, width), max(1, height))
+            self.wakeup.notify()
+            return self.generation
+    
+    @property
+    def busy(self) -> bool:
+        """True while a submitted spec is waiting or being drawn."""
+        return self.pending is not None or self.drawing
+    
+    def blit(self, photo, shown: int):
+        """Paste the newest frame into a PhotoImage if it is newer than generation ``shown``.
+
+        Returns the PhotoImage to display (a new one when the frame size
+        changed or ``photo`` is None) and the generation it now shows.
+        """
+        from PIL import Image, ImageTk
+        with self.lock:
+            if self.frame is None or self.frame_generation <= shown:
+                return photo, shown
+            height, width = self.frame.shape[:2]
+            image = Image.frombuffer('RGBA', (width, height), self.frame, 'raw', 'RGBA', 0, 1)
+            if photo is None or (photo.width(), photo.height()) != (width, height):
+                photo = ImageTk.PhotoImage(image)
+            else:
+                photo.paste(image)
+            return photo, self.frame_generation
+    
+    def close(self):
+        """Stop the worker thread after the render in progress."""
+        with self.wakeup:
+            self.closed = True
+            self.pending = None
+            self.wakeup.notify()
+    
+    def _run(self):
+        """Render with a pooled figure until closed, then give it back."""
+        self.figure, self.canvas = figure_pool.acquire_offscreen(self.dpi)
+        try:
+            self._render_loop()
+        finally:
+            figure_pool.release(self.figure)
+    
+    def _render_loop(self):
+        """Render the newest pending spec until closed."""
+        self.ax = self.figure.axes[0]
+        self.figure.patch.set_facecolor(config.COLORS['bg_secondary'])
+        self.ax.set_facecolor(config.COLORS['bg_secondary'])
+        self.ax.set_ylabel('Profit')
+        self.mode = None
+        self.line = None
+        self.bar_container = None
+        self.bar_labels = None
+        
+        while True:
+            with self.wakeup:
+                while self.pending is None and not self.closed:
+                    self.wakeup.wait()
+                if self.closed:
+                    return
+                generation, spec, width, height = self.pending
+                self.pending = None
+                self.drawing = True
+            try:
+                with profiler.section('chart.render'):
+                    self.figure.set_size_inches(width / self.dpi, height / self.dpi)
+                    self._apply(spec)
+                    self.canvas.draw()
+                pixels = np.asarray(self.canvas.buffer_rgba())
+            except Exception as exc:
+                log.exception("Chart render failed")
+                with self.lock:
+                    self.drawing = False
+                    self.error = exc
+                continue
+            
+            with self.lock:
+                self.drawing = False
+                if self.pending is not None:
+                    self.dropped += 1  # newer data arrived while drawing
+                    continue
+                if self.frame is None or self.frame.shape != pixels.shape:
+                    self.frame = np.empty_like(pixels)
+                np.copyto(self.frame, pixels)
+                self.frame_generation = generation
+                bbox = self.ax.bbox
+                self.frame_axes = (bbox.x0, height - bbox.y1, bbox.x1, height - bbox.y0)
+                self.frame_xlim = self.ax.get_xlim()
+                self.rendered += 1
+    
+    def _apply(self, spec: dict):
+        """Bring the worker's artists up to date with a spec."""
+        if spec['mode'] != self.mode:
+            self._set_mode(spec['mode'])
+        if spec['mode'] == 'line':
+            self.line.set_data(spec['x'], spec['y'])
+            self.ax.set_xlim(*spec['xlim'])
+        else:
+            if spec['labels'] != self.bar_labels:
+                if self.bar_container is not None:
+                    self.bar_container.remove()
+                positions = range(len(spec['labels']))
+                self.bar_container = self.ax.bar(positions, spec['heights'])
+                self.ax.set_xticks(list(positions))
+                self.ax.set_xticklabels(spec['labels'])
+                self.ax.set_xlim(-0.5, len(spec['labels']) - 0.5)
+                self.bar_labels = spec['labels']
+            for bar, height, color in zip(self.bar_container, spec['heights'], spec['colors']):
+                bar.set_height(height)
+                bar.set_color(color)
+        if spec['ylim'] is not None:
+            self.ax.set_ylim(*spec['ylim'])
+        self.ax.set_title(spec['title'])
+    
+    def _set_mode(self, mode: str):
+        """Switch the worker's axes between bars and a date-scaled line."""
+        self.mode = mode
+        if mode == 'line':
+            import matplotlib.dates as mdates
+            if self.bar_container is not None:
+                self.bar_container.remove()
+                self.bar_container = None
+                self.bar_labels = None
+            if self.line is None:
+                self.line, = self.ax.plot([], [], color=config.COLORS['accent'], linewidth=1)
+            self.line.set_visible(True)
+            locator = mdates.AutoDateLocator()
+            self.ax.xaxis.set_major_locator(locator)
+            self.ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        elif self.line is not None:
+            self.line.set_visible(False)
\ No newline at end of file
@@ -2,16 +2,66 @@
 
 from datetime import datetime, timedelta
 import random
-from typing import List
-from src.models.trading_data import Account, Trade, Strategy, ProfitData
+from typing import Callable, Dict, Iterable, List, Optional
+import numpy as np
+import config
+from src.models.trading_data import Account, Trade, Strategy, ProfitData, Tick, Bar
+from src.models.time_series import ProfitSeries, PriceBars
+from src.models.trade_book import TradeBook
+from src.utils.account_metrics import AccountMetrics
+from src.utils.bar_aggregator import BarAggregator
+from src.utils.strategy_analytics import StrategyAnalytics
+from src.utils.sqlite_store import SQLiteStore, SQLiteWriter
+
+# Change events published by DataManager
+ACCOUNT_CHANGED = 'account_changed'      # payload: Account
+STRATEGY_CHANGED = 'strategy_changed'    # payload: Strategy
+STRATEGIES_CHANGED = 'strategies_changed'  # payload: list of strategies (added or removed)
+PROFIT_APPENDED = 'profit_appended'      # payload: ProfitData
+QUOTE_CHANGED = 'quote_changed'          # payload: Tick
+POSITIONS_CHANGED = 'positions_changed'  # payload: symbol whose open trades were repriced
+TRADE_OPENED = 'trade_opened'            # payload: Trade
+TRADE_CLOSED = 'trade_closed'            # payload: Trade
+BAR_CLOSED = 'bar_closed'                # payload: Bar
 
 class DataManager:
     """Manages sample trading data for the application."""
     
-    def __init__(self):
+    def __init__(self, db_path: str = None):
         self.account = Account(balance=1215, equity=345, drawdown=0.0)
-        self.strategies = self._create_sample_strategies()
-        self.profit_history = self._generate_profit_history()
+        self.store = SQLiteStore(db_path) if db_path else None
+        self.writer = SQLiteWriter(db_path) if db_path else None
+        self.strategies = self._load_strategies()
+        self.strategy_index = {strategy.id: strategy for strategy in self.strategies}
+        self.profit_history = self._load_profit_history()
+        self.trade_book = self._load_trades()
+        self.metrics = AccountMetrics(self.account, self.trade_book)
+        self.analytics = StrategyAnalytics(self.trade_book)
+        self.quotes = {}
+        self.bars = BarAggregator()
+        self.subscribers = {}
+    
+    def close(self):
+        """Flush pending writes and close the database."""
+        if self.writer:
+            self.writer.close()
+        if self.store:
+            self.store.close()
+    
+    def subscribe(self, event: str, callback: Callable):
+        """Register a callback for a change event."""
+        self.subscribers.setdefault(event, []).append(callback)
+    
+    def unsubscribe(self, event: str, callback: Callable):
+        """Remove a previously registered callback."""
+        callbacks = self.subscribers.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+    
+    def publish(self, event: str, payload=None):
+        """Notify all subscribers of a change event."""
+        for callback in list(self.subscribers.get(event, [])):
+            callback(payload)
     
     def get_account_info(self) -> Account:
         """Get current account information."""
@@ -21,10 +71,133 @@ class DataManager:
         """Get list of trading strategies."""
         return self.strategies
     
-    def get_profit_history(self) -> List[ProfitData]:
+    def get_strategy(self, strategy_id: str) -> Optional[Strategy]:
+        """Look up a strategy by id."""
+        return self.strategy_index.get(strategy_id)
+    
+    def get_metrics(self) -> AccountMetrics:
+        """Get the account metrics engine."""
+        return self.metrics
+    
+    def get_analytics(self) -> StrategyAnalytics:
+        """Get the per-strategy performance analytics."""
+        return self.analytics
+    
+    def get_trade_book(self) -> TradeBook:
+        """Get the book of open and closed trades."""
+        return self.trade_book
+    
+    def get_profit_history(self) -> ProfitSeries:
         """Get profit history for charts."""
         return self.profit_history
     
+    def get_quotes(self) -> Dict[str, Tick]:
+        """Get the latest quote per symbol."""
+        return self.quotes
+    
+    def get_bars(self, symbol: str, timeframe: str, count: int = None) -> PriceBars:
+        """Get the newest completed live bars for a symbol and timeframe."""
+        return self.bars.bars(symbol, timeframe, count)
+    
+    def get_current_bar(self, symbol: str, timeframe: str) -> Optional[Bar]:
+        """Get the bar still forming for a symbol and timeframe."""
+        return self.bars.current(symbol, timeframe)
+    
+    def record_ticks(self, ticks: List[Tick]):
+        """Aggregate and persist raw ticks; safe to call from the feed thread."""
+        self.bars.update(ticks)
+        if self.writer:
+            self.writer.save_ticks(ticks)
+    
+    def record_trades(self, trades: List[Trade]):
+        """Persist new or updated trades."""
+        if self.writer:
+            self.writer.save_trades(trades)
+    
+    def apply_ticks(self, ticks: Dict[str, Tick]):
+        """Store the latest tick per symbol, reprice open trades and notify subscribers."""
+        repriced = False
+        for symbol, tick in ticks.items():
+            self.quotes[symbol] = tick
+            self.publish(QUOTE_CHANGED, tick)
+            if self.trade_book.open_by_symbol.get(symbol):
+                self.trade_book.reprice(symbol, tick.bid, tick.ask)
+                self.publish(POSITIONS_CHANGED, symbol)
+                repriced = True
+        if repriced:
+            self.refresh_account()
+        for bar in self.bars.drain_closed():
+            self.publish(BAR_CLOSED, bar)
+    
+    def refresh_account(self):
+        """Publish the account if its derived metrics changed."""
+        if self.metrics.refresh():
+            self.publish(ACCOUNT_CHANGED, self.account)
+    
+    def open_trade(self, trade: Trade):
+        """Add an open trade to the book, persist it and notify subscribers."""
+        self.trade_book.open_trade(trade)
+        self.metrics.on_trade_opened(trade)
+        self.record_trades([trade])
+        self.publish(TRADE_OPENED, trade)
+        self.refresh_account()
+    
+    def close_trade(self, trade_id: str, price: float) -> Trade:
+        """Close an open trade, persist it and notify subscribers."""
+        trade = self.trade_book.close_trade(trade_id, price)
+        self.metrics.on_trade_closed(trade)
+        self.analytics.on_trade_closed(trade)
+        self.record_trades([trade])
+        self.publish(TRADE_CLOSED, trade)
+        self.refresh_account()
+        return trade
+    
+    def _load_strategies(self) -> List[Strategy]:
+        """Load strategies from the database, seeding it with samples when empty."""
+        strategies = self.store.load_strategies() if self.store else []
+        if not strategies:
+            strategies = self._create_sample_strategies()
+            if self.writer:
+                self.writer.save_strategies(strategies)
+        return strategies
+    
+    def _load_trades(self) -> TradeBook:
+        """Rebuild the trade book from the database, seeding it with sample trades when empty."""
+        trades = self.store.load_trades() if self.store else []
+        if not trades:
+            trades = self._create_sample_trades()
+            if self.writer:
+                self.writer.save_trades(trades)
+        book = TradeBook()
+        for trade in trades:
+            book.open_trade(trade)
+            if trade.close_time is not None:
+                book.close_trade(trade.id, trade.current_price, trade.close_time)
+        return book
+    
+    def _load_profit_history(self) -> ProfitSeries:
+        """Load the chart window of profit history, seeding the database only when it has none.
+
+        When every stored point is older than the window, the series starts
+        from the newest one so new points continue its cumulative profit.
+        """
+        if self.store:
+            start = (datetime.now() - timedelta(days=config.CHART_HISTORY_DAYS)).timestamp()
+            timestamps, profits, cumulative = self.store.load_profit_window(start)
+            if not len(timestamps):
+                last = self.store.last_profit_point()
+                if last is not None:
+                    timestamps, profits, cumulative = ([value] for value in last)
+            if len(timestamps):
+                series = ProfitSeries()
+                series.extend(timestamps, profits, start_cumulative=cumulative[0] - profits[0])
+                return series
+        
+        series = self._generate_profit_history()
+        if self.writer:
+            self.writer.save_profit_points(list(series))
+        return series
+    
     def _create_sample_strategies(self) -> List[Strategy]:
         """Create sample trading strategies."""
         return [
@@ -48,26 +221,97 @@ class DataManager:
             )
         ]
     
-    def _generate_profit_history(self) -> List[ProfitData]:
+    def _create_sample_trades(self) -> List[Trade]:
+        """Create sample open trades for the sample strategies."""
+        now = datetime.now()
+        return [
+            Trade(id="T1", symbol="XAUUSD", direction="BUY", volume=0.10,
+                  open_price=2348.50, current_price=2348.50, profit=0.0,
+                  open_time=now - timedelta(hours=3), strategy_id="1"),
+            Trade(id="T2", symbol="XAUUSD", direction="SELL", volume=0.05,
+                  open_price=2352.20, current_price=2352.20, profit=0.0,
+                  open_time=now - timedelta(hours=1), strategy_id="1"),
+            Trade(id="T3", symbol="BTCUSD", direction="BUY", volume=0.01,
+                  open_price=64850.00, current_price=64850.00, profit=0.0,
+                  open_time=now - timedelta(hours=5), strategy_id="2"),
+        ]
+    
+    def _generate_profit_history(self) -> ProfitSeries:
         """Generate sample profit history data."""
-        data = []
         base_time = datetime.now() - timedelta(days=7)
-        cumulative = 0
+        timestamps = base_time.timestamp() + np.arange(7) * 86400.0
+        profits = np.random.uniform(-20, 30, 7)
+        
+        series = ProfitSeries()
+        series.extend(timestamps, profits)
+        return series
+    
+    def reload_history(self):
+        """Pick up strategies and profit points written to the database by an import."""
+        if not self.store:
+            return
+        added = [strategy for strategy in self.store.load_strategies()
+                 if strategy.id not in self.strategy_index]
+        if added:
+            self.strategies.extend(added)
+            self.strategy_index.update((strategy.id, strategy) for strategy in added)
+            self.publish(STRATEGIES_CHANGED, self.strategies)
+        self.profit_history = self._load_profit_history()
+        self.publish(PROFIT_APPENDED, self.profit_history.last())
+    
+    def update_account(self, **changes):
+        """Update account fields and notify subscribers."""
+        for field, value in changes.items():
+            setattr(self.account, field, value)
+        self.publish(ACCOUNT_CHANGED, self.account)
+    
+    def append_profit(self, profit: float, timestamp: datetime = None) -> ProfitData:
+        """Append a profit point to the history and notify subscribers."""
+        timestamp = timestamp or datetime.now()
+        self.profit_history.append(timestamp.timestamp(), profit)
+        point = self.profit_history.last()
+        if self.writer:
+            self.writer.save_profit_points([point])
+        self.publish(PROFIT_APPENDED, point)
+        return point
+    
+    def add_strategies(self, strategies: List[Strategy]):
+        """Add strategies, persist them and notify subscribers."""
+        for strategy in strategies:
+            if strategy.id in self.strategy_index:
+                raise ValueError(f"Duplicate strategy id: {strategy.id}")
+        self.strategies.extend(strategies)
+        self.strategy_index.update((strategy.id, strategy) for strategy in strategies)
+        if self.writer:
+            self.writer.save_strategies(strategies)
+        self.publish(STRATEGIES_CHANGED, self.strategies)
+    
+    def set_strategies_status(self, strategy_ids: Iterable[str], status: str) -> List[Strategy]:
+        """Set the status of many strategies at once and return the ones that changed.
         
-        for i in range(7):
-            profit = random.uniform(-20, 30)
-            cumulative += profit
-            data.append(ProfitData(
-                timestamp=base_time + timedelta(days=i),
-                profit=profit,
-                cumulative_profit=cumulative
-            ))
+        Every id is checked before anything is modified, so an unknown id leaves
+        all strategies untouched. Changes are saved in one batch and published
+        as one STRATEGY_CHANGED event per changed strategy.
+        """
+        ids = list(dict.fromkeys(strategy_ids))
+        missing = [strategy_id for strategy_id in ids if strategy_id not in self.strategy_index]
+        if missing:
+            raise ValueError(f"Unknown strategy ids: {', '.join(missing)}")
         
-        return data
+        changed = [strategy for strategy in map(self.strategy_index.get, ids) if strategy.status != status]
+        for strategy in changed:
+            strategy.status = status
+        if changed and self.writer:
+            self.writer.save_strategies(changed)
+        for strategy in changed:
+            self.publish(STRATEGY_CHANGED, strategy)
+        return changed
     
     def update_strategy_status(self, strategy_id: str, status: str):
         """Update strategy status."""
-        for strategy in self.strategies:
-            if strategy.id == strategy_id:
-                strategy.status = status
-                break
\ No newline at end of file
+        strategy = self.strategy_index.get(strategy_id)
+        if strategy and strategy.status != status:
+            strategy.status = status
+            if self.writer:
+                self.writer.save_strategies([strategy])
+            self.publish(STRATEGY_CHANGED, strategy)
\ No newline at end of file
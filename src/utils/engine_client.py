@@ -0,0 +1,296 @@
+"""GUI-side connection to the engine daemon and a DataManager that mirrors it."""
+
+import logging
+import queue
+import socket
+import threading
+from typing import Iterable, List
+import config
+from src.models.time_series import ProfitSeries
+from src.models.trade_book import TradeBook
+from src.models.trading_data import Account, Strategy
+from src.utils import engine_protocol as wire
+from src.utils.account_metrics import AccountMetrics
+from src.utils.bar_aggregator import BarAggregator
+from src.utils.strategy_analytics import StrategyAnalytics
+from src.utils.data_manager import (DataManager, ACCOUNT_CHANGED, STRATEGY_CHANGED, STRATEGIES_CHANGED,
+                                    PROFIT_APPENDED, POSITIONS_CHANGED, QUOTE_CHANGED, BAR_CLOSED)
+
+log = logging.getLogger(__name__)
+
+class EngineClient:
+    """Socket connection to an EngineServer.
+
+    connect() blocks until the first snapshot has arrived. After that a
+    reader thread queues incoming messages for the GUI thread to drain, and
+    reconnects every ENGINE_RECONNECT_INTERVAL ms if the engine goes away;
+    each reconnect starts with a fresh snapshot.
+    """
+    
+    def __init__(self, path: str = config.ENGINE_SOCKET):
+        self.path = path
+        self.sock = None
+        self.lock = threading.Lock()
+        self.messages = queue.Queue()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.connected = False
+    
+    def connect(self) -> dict:
+        """Connect, wait for the snapshot, start the reader thread and return the snapshot.
+
+        Raises ConnectionError if the engine sends no snapshot within
+        ENGINE_CONNECT_TIMEOUT seconds.
+        """
+        sock, decoder = self._open()
+        snapshot = None
+        sock.settimeout(config.ENGINE_CONNECT_TIMEOUT)
+        try:
+            while snapshot is None:
+                try:
+                    data = sock.recv(65536)
+                except socket.timeout:
+                    raise ConnectionError(f"Engine at {self.path} sent no snapshot within "
+                                          f"{config.ENGINE_CONNECT_TIMEOUT:g} s") from None
+                if not data:
+                    raise ConnectionError(f"Engine at {self.path} closed the connection before sending a snapshot")
+                for kind, payload in decoder.feed(data):
+                    if snapshot is None and kind == wire.SNAPSHOT:
+                        snapshot = payload
+                    else:
+                        self.messages.put((kind, payload))
+        except ConnectionError:
+            with self.lock:
+                self.connected = False
+            sock.close()
+            raise
+        sock.settimeout(None)  # the reader thread blocks until the engine sends something
+        self.thread = threading.Thread(target=self._run, args=(sock, decoder), name='EngineClient', daemon=True)
+        self.thread.start()
+        return snapshot
+    
+    def call(self, method: str, *args, **kwargs):
+        """Ask the engine to run a DataManager method; its effects come back as deltas."""
+        frame = wire.encode(wire.CALL, {'method': method, 'args': wire.encode_args(method, args),
+                                        'kwargs': kwargs})
+        with self.lock:
+            if not self.connected:
+                log.warning("Engine offline; dropped %s", method)
+                return
+            try:
+                self.sock.sendall(frame)
+            except OSError as exc:
+                log.warning("Engine send failed; dropped %s: %s", method, exc)
+    
+    def drain(self) -> List[list]:
+        """Take every message received since the previous drain."""
+        messages = []
+        while True:
+            try:
+                messages.append(self.messages.get_nowait())
+            except queue.Empty:
+                return messages
+    
+    def close(self):
+        """Stop the reader thread and close the connection."""
+        self.stop_event.set()
+        with self.lock:
+            self.connected = False
+            if self.sock:
+                try:
+                    self.sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                self.sock.close()
+        if self.thread:
+            self.thread.join(1.0)
+            self.thread = None
+    
+    def _open(self):
+        """Open a blocking connection to the engine socket."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(config.ENGINE_CONNECT_TIMEOUT)
+        try:
+            sock.connect(self.path)
+            sock.settimeout(None)
+        except OSError as exc:
+            sock.close()
+            raise ConnectionError(f"No engine is listening on {self.path} "
+                                  f"(start one with python engine.py): {exc}") from None
+        with self.lock:
+            self.sock = sock
+            self.connected = True
+        return sock, wire.FrameDecoder()
+    
+    def _run(self, sock, decoder):
+        """Read frames until closed, reconnecting whenever the engine drops."""
+        while not self.stop_event.is_set():
+            try:
+                data = sock.recv(65536)
+            except OSError:
+                data = b''
+            messages = None
+            if data:
+                try:
+                    messages = list(decoder.feed(data))
+                except Exception as exc:
+                    # The stream can't be resynchronized; start over from a fresh snapshot
+                    log.warning("Undecodable frame from the engine at %s: %s", self.path, exc)
+            if messages is not None:
+                for message in messages:
+                    self.messages.put(message)
+                continue
+            
+            with self.lock:
+                self.connected = False
+            sock.close()
+            if not self.stop_event.is_set():
+                log.warning("Lost the engine at %s; reconnecting", self.path)
+            while not self.stop_event.wait(config.ENGINE_RECONNECT_INTERVAL / 1000):
+                try:
+                    sock, decoder = self._open()
+                    break
+                except ConnectionError:
+                    continue
+
+class RemoteDataManager(DataManager):
+    """A DataManager whose state is a mirror of the engine's.
+
+    Reads and subscriptions work exactly as with a local DataManager.
+    Changes requested by the screens are sent to the engine instead of being
+    applied here; they take effect when the engine's deltas come back
+    through sync(), so every attached GUI sees the same order of events.
+    """
+    
+    def __init__(self, client: EngineClient):
+        self.client = client
+        self.store = None
+        self.writer = None
+        self.account = Account(balance=0.0, equity=0.0)
+        self.strategies = []
+        self.strategy_index = {}
+        self.profit_history = ProfitSeries()
+        self.trade_book = TradeBook()
+        self.metrics = AccountMetrics(self.account, self.trade_book)
+        self.analytics = StrategyAnalytics()
+        self.quotes = {}
+        self.bars = BarAggregator()  # filled from the engine's closed bars
+        self.subscribers = {}
+        self.load_snapshot(client.connect())
+    
+    def close(self):
+        """Disconnect from the engine; the engine keeps running."""
+        self.client.close()
+    
+    def sync(self):
+        """Apply every message received from the engine since the last call."""
+        for kind, payload in self.client.drain():
+            if kind == wire.SNAPSHOT:
+                self.load_snapshot(payload)
+            elif kind == wire.DELTAS:
+                for delta_kind, delta in payload:
+                    self.apply_delta(delta_kind, delta)
+    
+    def load_snapshot(self, snapshot: dict):
+        """Replace the mirrored state and tell subscribers everything changed."""
+        self.strategies = [wire.strategy_from_wire(data) for data in snapshot['strategies']]
+        self.strategy_index = {strategy.id: strategy for strategy in self.strategies}
+        self.profit_history = wire.profit_from_wire(snapshot['profit'])
+        self.trade_book = TradeBook()
+        for data in snapshot['trades']:
+            self.trade_book.open_trade(wire.trade_from_wire(data))
+        self.metrics = AccountMetrics(self.account, self.trade_book)
+        self.analytics = wire.analytics_from_wire(snapshot['analytics'])
+        # The engine's account wins over what metrics derived from the open trades alone
+        for field, value in snapshot['account'].items():
+            setattr(self.account, field, value)
+        self.quotes = {}
+        
+        self.publish(ACCOUNT_CHANGED, self.account)
+        self.publish(STRATEGIES_CHANGED, self.strategies)
+        if len(self.profit_history):
+            self.publish(PROFIT_APPENDED, self.profit_history.last())
+        for data in snapshot['quotes']:
+            tick = wire.tick_from_wire(data)
+            self.quotes[tick.symbol] = tick
+            self.publish(QUOTE_CHANGED, tick)
+        for symbol in self.trade_book.open_symbols():
+            self.publish(POSITIONS_CHANGED, symbol)
+    
+    def apply_delta(self, kind: str, payload):
+        """Apply one engine change through the same code paths a local DataManager uses."""
+        if kind == wire.D_TICKS:
+            self.apply_ticks({symbol: wire.tick_from_wire(data) for symbol, data in payload.items()})
+        elif kind == wire.D_ACCOUNT:
+            DataManager.update_account(self, **payload)
+        elif kind == wire.D_STRATEGY:
+            strategy = self.strategy_index.get(payload['id'])
+            if strategy:
+                for field, value in payload.items():
+                    setattr(strategy, field, value)
+                self.publish(STRATEGY_CHANGED, strategy)
+        elif kind == wire.D_STRATEGIES:
+            self.strategies = [self._merge_strategy(data) for data in payload]
+            self.strategy_index = {strategy.id: strategy for strategy in self.strategies}
+            self.publish(STRATEGIES_CHANGED, self.strategies)
+        elif kind == wire.D_PROFIT:
+            timestamp, profit = payload
+            self.profit_history.append(timestamp, profit)
+            self.publish(PROFIT_APPENDED, self.profit_history.last())
+        elif kind == wire.D_PROFIT_HISTORY:
+            self.profit_history = wire.profit_from_wire(payload)
+            if len(self.profit_history):
+                self.publish(PROFIT_APPENDED, self.profit_history.last())
+        elif kind == wire.D_TRADE_OPENED:
+            DataManager.open_trade(self, wire.trade_from_wire(payload))
+        elif kind == wire.D_TRADE_CLOSED:
+            DataManager.close_trade(self, *payload)
+        elif kind == wire.D_BAR_CLOSED:
+            bar = wire.bar_from_wire(payload)
+            self.bars.record_closed(bar)
+            self.publish(BAR_CLOSED, bar)
+    
+    def _merge_strategy(self, data: dict) -> Strategy:
+        """Update a known strategy in place so screens holding it stay current."""
+        strategy = self.strategy_index.get(data['id'])
+        if strategy is None:
+            return wire.strategy_from_wire(data)
+        for field, value in data.items():
+            setattr(strategy, field, value)
+        return strategy
+    
+    # Mutators are forwarded to the engine
+    def reload_history(self):
+        self.client.call('reload_history')
+    
+    def update_account(self, **changes):
+        self.client.call('update_account', **changes)
+    
+    def append_profit(self, profit: float, timestamp=None):
+        self.client.call('append_profit', profit, timestamp)
+    
+    def add_strategies(self, strategies: List[Strategy]):
+        for strategy in strategies:
+            if strategy.id in self.strategy_index:
+                raise ValueError(f"Duplicate strategy id: {strategy.id}")
+        self.client.call('add_strategies', strategies)
+    
+    def set_strategies_status(self, strategy_ids: Iterable[str], status: str) -> List[Strategy]:
+        """Validate locally, send to the engine and return the strategies expected to change."""
+        ids = list(dict.fromkeys(strategy_ids))
+        missing = [strategy_id for strategy_id in ids if strategy_id not in self.strategy_index]
+        if missing:
+            raise ValueError(f"Unknown strategy ids: {', '.join(missing)}")
+        changed = [strategy for strategy in map(self.strategy_index.get, ids) if strategy.status != status]
+        if changed:
+            self.client.call('set_strategies_status', [strategy.id for strategy in changed], status)
+        return changed
+    
+    def update_strategy_status(self, strategy_id: str, status: str):
+        self.client.call('update_strategy_status', strategy_id, status)
+    
+    def open_trade(self, trade):
+        self.client.call('open_trade', trade)
+    
+    def close_trade(self, trade_id: str, price: float):
+        self.client.call('close_trade', trade_id, price)
\ No newline at end of file
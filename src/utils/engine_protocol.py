@@ -0,0 +1,157 @@
+"""Wire format shared by the engine daemon and its GUI clients.
+
+Every message is a msgpack-encoded list ``[kind, payload]`` preceded by a
+4-byte big-endian length. The engine sends one ``snapshot`` on connect,
+then ``deltas`` frames, each a list of ordered ``[kind, payload]`` changes.
+Clients send ``call`` messages naming a DataManager method and its
+encoded arguments.
+"""
+
+from dataclasses import asdict
+from datetime import datetime
+import struct
+from typing import Iterator, List
+import msgpack
+import numpy as np
+from src.models.time_series import ProfitSeries
+from src.models.trading_data import Account, Bar, Strategy, Trade, Tick
+from src.utils.strategy_analytics import FIELDS, StrategyAnalytics
+
+HEADER = struct.Struct('>I')
+MAX_FRAME = 256 * 1024 * 1024
+
+# Message kinds
+SNAPSHOT = 'snapshot'
+DELTAS = 'deltas'
+CALL = 'call'
+
+# Delta kinds, in the order the engine published them
+D_ACCOUNT = 'account'
+D_STRATEGY = 'strategy'
+D_STRATEGIES = 'strategies'
+D_PROFIT = 'profit'
+D_PROFIT_HISTORY = 'profit_history'  # whole series, after the engine reloaded it
+D_TICKS = 'ticks'
+D_TRADE_OPENED = 'trade_opened'
+D_TRADE_CLOSED = 'trade_closed'
+D_BAR_CLOSED = 'bar_closed'
+
+# DataManager methods a client may call on the engine
+COMMANDS = {'set_strategies_status', 'update_strategy_status', 'add_strategies',
+            'open_trade', 'close_trade', 'append_profit', 'update_account', 'reload_history'}
+
+def encode(kind: str, payload) -> bytes:
+    """Frame one message."""
+    body = msgpack.packb([kind, payload], use_bin_type=True)
+    return HEADER.pack(len(body)) + body
+
+class FrameDecoder:
+    """Splits a byte stream into decoded messages; feed it whatever recv() returned."""
+    
+    def __init__(self):
+        self.buffer = bytearray()
+    
+    def feed(self, data: bytes) -> Iterator[list]:
+        """Add received bytes and yield every complete message."""
+        self.buffer += data
+        while len(self.buffer) >= HEADER.size:
+            (length,) = HEADER.unpack_from(self.buffer)
+            if length > MAX_FRAME:
+                raise ValueError(f"Frame of {length} bytes exceeds the {MAX_FRAME} byte limit")
+            end = HEADER.size + length
+            if len(self.buffer) < end:
+                return
+            message = msgpack.unpackb(bytes(self.buffer[HEADER.size:end]), raw=False)
+            del self.buffer[:end]
+            yield message
+
+def strategy_to_wire(strategy: Strategy) -> dict:
+    return asdict(strategy)
+
+def strategy_from_wire(data: dict) -> Strategy:
+    return Strategy(**data)
+
+def trade_to_wire(trade: Trade) -> dict:
+    data = asdict(trade)
+    data['open_time'] = trade.open_time.timestamp()
+    data['close_time'] = trade.close_time and trade.close_time.timestamp()
+    return data
+
+def trade_from_wire(data: dict) -> Trade:
+    close_time = data.get('close_time')
+    return Trade(**{**data, 'open_time': datetime.fromtimestamp(data['open_time']),
+                    'close_time': None if close_time is None else datetime.fromtimestamp(close_time)})
+
+def tick_to_wire(tick: Tick) -> list:
+    return [tick.symbol, tick.bid, tick.ask, tick.time]
+
+def tick_from_wire(data: list) -> Tick:
+    return Tick(*data)
+
+def bar_to_wire(bar: Bar) -> list:
+    return [bar.symbol, bar.timeframe, bar.time, bar.open, bar.high, bar.low, bar.close, bar.volume]
+
+def bar_from_wire(data: list) -> Bar:
+    return Bar(*data)
+
+def profit_to_wire(series: ProfitSeries) -> dict:
+    """Encode the profit columns as raw float64 bytes."""
+    timestamps, profits = series.timestamps, series.profits
+    start = float(series.cumulative[0] - profits[0]) if len(profits) else 0.0
+    return {'timestamps': timestamps.tobytes(), 'profits': profits.tobytes(), 'start_cumulative': start}
+
+def profit_from_wire(data: dict) -> ProfitSeries:
+    series = ProfitSeries()
+    timestamps = np.frombuffer(data['timestamps'], dtype=np.float64)
+    if len(timestamps):
+        series.extend(timestamps, np.frombuffer(data['profits'], dtype=np.float64),
+                      start_cumulative=data['start_cumulative'])
+    return series
+
+def snapshot_to_wire(data_manager) -> dict:
+    """Capture everything a client needs to mirror the engine's data layer."""
+    book = data_manager.get_trade_book()
+    return {
+        'account': account_to_wire(data_manager.get_account_info()),
+        'strategies': [strategy_to_wire(strategy) for strategy in data_manager.get_strategies()],
+        'profit': profit_to_wire(data_manager.get_profit_history()),
+        'trades': [trade_to_wire(trade) for trade in book.open_trades()],
+        'quotes': [tick_to_wire(tick) for tick in data_manager.get_quotes().values()],
+        'analytics': analytics_to_wire(data_manager.get_analytics()),
+    }
+
+def account_to_wire(account: Account) -> dict:
+    return asdict(account)
+
+def analytics_to_wire(analytics: StrategyAnalytics) -> dict:
+    """Encode the per-strategy running totals as raw float64 bytes."""
+    ids = sorted(analytics.row_by_strategy, key=analytics.row_by_strategy.get)
+    return {'ids': ids, 'state': np.ascontiguousarray(analytics.state[:, :analytics.size]).tobytes()}
+
+def analytics_from_wire(data: dict) -> StrategyAnalytics:
+    analytics = StrategyAnalytics()
+    state = np.frombuffer(data['state'], dtype=np.float64).reshape(len(FIELDS), len(data['ids']))
+    analytics.restore(data['ids'], state)
+    return analytics
+
+def encode_args(method: str, args: List) -> List:
+    """Encode the positional arguments of a COMMANDS call."""
+    if method == 'add_strategies':
+        return [[strategy_to_wire(strategy) for strategy in args[0]]]
+    if method == 'open_trade':
+        return [trade_to_wire(args[0])]
+    if method == 'append_profit' and len(args) > 1 and args[1] is not None:
+        return [args[0], args[1].timestamp()]
+    if method == 'set_strategies_status':
+        return [list(args[0]), args[1]]
+    return list(args)
+
+def decode_args(method: str, args: List) -> List:
+    """Decode the arguments produced by encode_args."""
+    if method == 'add_strategies':
+        return [[strategy_from_wire(data) for data in args[0]]]
+    if method == 'open_trade':
+        return [trade_from_wire(args[0])]
+    if method == 'append_profit' and len(args) > 1 and args[1] is not None:
+        return [args[0], datetime.fromtimestamp(args[1])]
+    return args
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""Headless engine: runs the data layer and market feed, serving GUI clients over a Unix socket."""
+
+import logging
+import os
+import selectors
+import socket
+from typing import Dict, List
+import config
+from src.utils import engine_protocol as wire
+from src.utils.data_manager import (DataManager, ACCOUNT_CHANGED, STRATEGY_CHANGED, STRATEGIES_CHANGED,
+                                    PROFIT_APPENDED, QUOTE_CHANGED, TRADE_OPENED, TRADE_CLOSED, BAR_CLOSED)
+from src.utils.market_feed import MarketFeed
+
+log = logging.getLogger(__name__)
+
+class _Client:
+    """One connected GUI: its socket, partial input and unsent output."""
+    
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.decoder = wire.FrameDecoder()
+        self.out = bytearray()
+
+class EngineServer:
+    """Single-threaded select() loop around a DataManager and a MarketFeed.
+
+    Every loop pass reads client commands, applies the feed's coalesced
+    ticks, then sends the data-layer events of that pass to every client as
+    one ``deltas`` frame. New clients get a full snapshot first. Rendering
+    never happens here, so a slow GUI only fills its own output buffer; a
+    client that falls more than ENGINE_CLIENT_BUFFER bytes behind is dropped
+    and can reconnect for a fresh snapshot.
+    """
+    
+    def __init__(self, path: str, data_manager: DataManager, feed: MarketFeed = None):
+        self.path = path
+        self.data_manager = data_manager
+        self.feed = feed
+        self.selector = selectors.DefaultSelector()
+        self.clients: Dict[socket.socket, _Client] = {}
+        self.deltas: List[list] = []
+        self.profit_history = data_manager.get_profit_history()
+        self.running = False
+        self.listener = None
+        
+        data_manager.subscribe(ACCOUNT_CHANGED, self.on_account_changed)
+        data_manager.subscribe(STRATEGY_CHANGED, self.on_strategy_changed)
+        data_manager.subscribe(STRATEGIES_CHANGED, self.on_strategies_changed)
+        data_manager.subscribe(PROFIT_APPENDED, self.on_profit_appended)
+        data_manager.subscribe(QUOTE_CHANGED, self.on_quote_changed)
+        data_manager.subscribe(TRADE_OPENED, self.on_trade_opened)
+        data_manager.subscribe(TRADE_CLOSED, self.on_trade_closed)
+        data_manager.subscribe(BAR_CLOSED, self.on_bar_closed)
+    
+    def on_account_changed(self, account):
+        self.deltas.append([wire.D_ACCOUNT, wire.account_to_wire(account)])
+    
+    def on_strategy_changed(self, strategy):
+        self.deltas.append([wire.D_STRATEGY, wire.strategy_to_wire(strategy)])
+    
+    def on_strategies_changed(self, strategies):
+        self.deltas.append([wire.D_STRATEGIES, [wire.strategy_to_wire(s) for s in strategies]])
+    
+    def on_profit_appended(self, point):
+        history = self.data_manager.get_profit_history()
+        if history is not self.profit_history:
+            # reload_history() replaced the series rather than appending to it
+            self.profit_history = history
+            self.deltas.append([wire.D_PROFIT_HISTORY, wire.profit_to_wire(history)])
+        else:
+            self.deltas.append([wire.D_PROFIT, [point.timestamp.timestamp(), point.profit]])
+    
+    def on_quote_changed(self, tick):
+        # Merge into the previous delta when it is also ticks, keeping event order
+        if self.deltas and self.deltas[-1][0] == wire.D_TICKS:
+            self.deltas[-1][1][tick.symbol] = wire.tick_to_wire(tick)
+        else:
+            self.deltas.append([wire.D_TICKS, {tick.symbol: wire.tick_to_wire(tick)}])
+    
+    def on_trade_opened(self, trade):
+        self.deltas.append([wire.D_TRADE_OPENED, wire.trade_to_wire(trade)])
+    
+    def on_trade_closed(self, trade):
+        self.deltas.append([wire.D_TRADE_CLOSED, [trade.id, trade.current_price]])
+    
+    def on_bar_closed(self, bar):
+        self.deltas.append([wire.D_BAR_CLOSED, wire.bar_to_wire(bar)])
+    
+    def serve_forever(self):
+        """Run until stop() is called or the process is interrupted.
+
+        Raises RuntimeError if another engine is already serving the socket.
+        """
+        if os.path.exists(self.path):
+            if self._in_use():
+                raise RuntimeError(f"An engine is already listening on {self.path}")
+            os.unlink(self.path)  # left behind by an engine that did not shut down cleanly
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(self.path)
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        if self.feed:
+            self.feed.start()
+        log.info("Engine listening on %s", self.path)
+        
+        self.running = True
+        try:
+            while self.running:
+                for key, mask in self.selector.select(timeout=config.FEED_DRAIN_INTERVAL / 1000):
+                    if key.fileobj is self.listener:
+                        self._accept()
+                    elif mask & selectors.EVENT_READ:
+                        self._read(self.clients[key.fileobj])
+                    if mask & selectors.EVENT_WRITE and key.fileobj in self.clients:
+                        self._write(self.clients[key.fileobj])
+                if self.feed:
+                    ticks = self.feed.drain()
+                    if ticks:
+                        self.data_manager.apply_ticks(ticks)
+                self._flush_deltas()
+        finally:
+            self.close()
+    
+    def stop(self):
+        """Ask the loop to exit after the current pass."""
+        self.running = False
+    
+    def close(self):
+        """Disconnect clients, stop the feed and remove the socket file."""
+        for client in list(self.clients.values()):
+            self._drop(client)
+        if self.listener:
+            self.selector.unregister(self.listener)
+            self.listener.close()
+            self.listener = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+        if self.feed:
+            self.feed.stop()
+    
+    def _in_use(self) -> bool:
+        """Check whether something accepts connections on the socket path."""
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.path)
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+    
+    def _accept(self):
+        """Register a new client and queue its snapshot."""
+        sock, _ = self.listener.accept()
+        sock.setblocking(False)
+        client = _Client(sock)
+        self.clients[sock] = client
+        self.selector.register(sock, selectors.EVENT_READ)
+        self._send(client, wire.encode(wire.SNAPSHOT, wire.snapshot_to_wire(self.data_manager)))
+        log.info("Client connected (%d attached)", len(self.clients))
+    
+    def _read(self, client: _Client):
+        """Run the commands a client sent."""
+        try:
+            data = client.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b''
+        if not data:
+            self._drop(client)
+            return
+        try:
+            messages = list(client.decoder.feed(data))
+        except Exception as exc:
+            log.warning("Dropping a client that sent an undecodable frame: %s", exc)
+            self._drop(client)
+            return
+        for message in messages:
+            if not (isinstance(message, list) and len(message) == 2 and message[0] == wire.CALL
+                    and isinstance(message[1], dict) and isinstance(message[1].get('method'), str)):
+                log.warning("Dropping a client that sent a malformed message: %.200r", message)
+                self._drop(client)
+                return
+            self._call(message[1])
+    
+    def _call(self, payload: dict):
+        """Apply one client command to the data layer; its events become deltas."""
+        method = payload['method']
+        if method not in wire.COMMANDS:
+            log.warning("Rejected unknown command %r", method)
+            return
+        try:
+            getattr(self.data_manager, method)(*wire.decode_args(method, payload.get('args', [])),
+                                               **payload.get('kwargs', {}))
+        except Exception:
+            # A bad command must not stop the engine for every other client
+            log.exception("Command %s failed", method)
+    
+    def _flush_deltas(self):
+        """Send this pass's events to every client as one frame."""
+        if not self.deltas:
+            return
+        frame = wire.encode(wire.DELTAS, self.deltas)
+        self.deltas = []
+        for client in list(self.clients.values()):
+            self._send(client, frame)
+    
+    def _send(self, client: _Client, frame: bytes):
+        """Queue a frame, write what the socket accepts and watch for writability."""
+        if len(client.out) > config.ENGINE_CLIENT_BUFFER:
+            log.warning("Dropping a client that fell %d bytes behind", len(client.out))
+            self._drop(client)
+            return
+        client.out += frame
+        self._write(client)
+    
+    def _write(self, client: _Client):
+        """Write buffered output without blocking."""
+        try:
+            sent = client.sock.send(client.out)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self._drop(client)
+            return
+        del client.out[:sent]
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if client.out else 0)
+        self.selector.modify(client.sock, events)
+    
+    def _drop(self, client: _Client):
+        """Forget a client and close its socket."""
+        if self.clients.pop(client.sock, None) is None:
+            return
+        self.selector.unregister(client.sock)
+        client.sock.close()
+        log.info("Client disconnected (%d attached)", len(self.clients))
\ No newline at end of file
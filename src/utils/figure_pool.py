@@ -0,0 +1,140 @@
+"""Pool of pyplot-free matplotlib figures and Tk canvases shared by chart widgets."""
+
+import threading
+from typing import List, Tuple
+import config
+from src.utils.instrumentation import profiler
+
+class FigurePool:
+    """Hands out Figure/FigureCanvasTkAgg pairs and takes them back for reuse.
+
+    Figures are created with ``matplotlib.figure.Figure`` rather than
+    pyplot, so nothing is registered in pyplot's global figure manager and
+    a released figure is not kept alive by it. Canvases are children of the
+    toplevel window and are packed into the borrowing widget with
+    ``pack(in_=...)``, so the same Tk canvas and its Agg renderer serve
+    every chart built over the life of the window. Up to ``size`` released
+    pairs are kept; the rest are destroyed on release.
+
+    Off-thread renderers borrow Figure/FigureCanvasAgg pairs through
+    acquire_offscreen(), which never touch Tk and are kept in their own
+    idle list, so their figures are counted and reused like the others.
+    The pool's lists are guarded by ``lock`` for those worker threads.
+    """
+    
+    def __init__(self, size: int = config.FIGURE_POOL_SIZE):
+        self.size = size
+        self.lock = threading.Lock()
+        self.idle: List[Tuple] = []
+        self.idle_offscreen: List[Tuple] = []
+        self.in_use = {}  # id(figure) -> (figure, canvas)
+        self.created = 0
+        self.destroyed = 0
+    
+    def acquire(self, host, figsize=(6, 3)):
+        """Get a cleared figure with one Axes and its canvas packed into ``host``."""
+        toplevel = str(host.winfo_toplevel())
+        with self.lock:
+            for i, (figure, canvas) in enumerate(self.idle):
+                if str(canvas.get_tk_widget().winfo_toplevel()) == toplevel:
+                    del self.idle[i]
+                    break
+            else:
+                figure = None
+        if figure is not None:
+            figure.set_size_inches(figsize)
+        else:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            figure = Figure(figsize=figsize)
+            canvas = FigureCanvasTkAgg(figure, host.winfo_toplevel())
+            canvas.draw = profiler.wrap('chart.canvas_draw', canvas.draw)
+            with self.lock:
+                self.created += 1
+        
+        figure.add_subplot()
+        widget = canvas.get_tk_widget()
+        widget.pack(in_=host, fill='both', expand=True)
+        widget.lift()  # above the host, which may have been created after the canvas
+        with self.lock:
+            self.in_use[id(figure)] = (figure, canvas)
+        return figure, canvas
+    
+    def acquire_offscreen(self, dpi: int):
+        """Get a cleared figure with one Axes and an Agg canvas that is never shown in Tk.
+
+        Safe to call from a worker thread; the figure is then owned by that
+        thread until it is released.
+        """
+        with self.lock:
+            entry = self.idle_offscreen.pop() if self.idle_offscreen else None
+            if entry is None:
+                self.created += 1
+        if entry is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            figure = Figure(dpi=dpi)
+            entry = (figure, FigureCanvasAgg(figure))
+        figure, canvas = entry
+        figure.set_dpi(dpi)
+        figure.add_subplot()
+        with self.lock:
+            self.in_use[id(figure)] = entry
+        return entry
+    
+    def release(self, figure):
+        """Unpack a figure's canvas and clear the figure for the next borrower.
+
+        Callers must disconnect their own mpl_connect callbacks first; they
+        are stored on the figure and would otherwise follow it to the next
+        chart.
+        """
+        with self.lock:
+            entry = self.in_use.pop(id(figure), None)
+        if entry is None:
+            return
+        figure, canvas = entry
+        if not hasattr(canvas, 'get_tk_widget'):
+            figure.clear()
+            with self.lock:
+                if len(self.idle_offscreen) < self.size:
+                    self.idle_offscreen.append(entry)
+                else:
+                    self.destroyed += 1
+            return
+        widget = canvas.get_tk_widget()
+        widget.pack_forget()
+        figure.clear()
+        with self.lock:
+            keep = len(self.idle) < self.size and widget.winfo_exists()
+            if keep:
+                self.idle.append(entry)
+            else:
+                self.destroyed += 1
+        if not keep:
+            widget.destroy()
+    
+    def clear(self):
+        """Destroy every idle canvas, e.g. before the window closes."""
+        with self.lock:
+            idle, self.idle = self.idle, []
+            self.destroyed += len(idle) + len(self.idle_offscreen)
+            self.idle_offscreen.clear()
+        for _, canvas in idle:
+            canvas.get_tk_widget().destroy()
+    
+    def stats(self) -> dict:
+        """Count live figures (in use and idle) and the Agg renderers they hold."""
+        with self.lock:
+            entries = list(self.in_use.values()) + self.idle + self.idle_offscreen
+            in_use = len(self.in_use)
+        return {
+            'in_use': in_use,
+            'idle': len(entries) - in_use,
+            'figures': len(entries),
+            'renderers': sum(1 for _, canvas in entries if getattr(canvas, 'renderer', None) is not None),
+            'created': self.created,
+            'destroyed': self.destroyed,
+        }
+
+figure_pool = FigurePool()
\ No newline at end of file
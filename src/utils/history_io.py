@@ -0,0 +1,247 @@
+"""Streaming CSV/Parquet export and import of trading history."""
+
+import csv
+from dataclasses import dataclass
+import os
+import re
+import threading
+from typing import Iterator, List, Tuple
+import numpy as np
+import config
+from src.models.time_series import PriceBars
+from src.utils.sqlite_store import (connect, TRADE_COLUMNS, UPSERT_STRATEGY, UPSERT_TRADE,
+                                    INSERT_TICK, UPSERT_PROFIT)
+
+@dataclass(frozen=True)
+class Dataset:
+    """A database table that can be exported and imported column for column."""
+    table: str
+    columns: Tuple[Tuple[str, str], ...]  # (name, 'text' | 'real' | 'int')
+    statement: str  # insert statement taking the columns in order
+    order: str  # export order
+    
+    @property
+    def names(self) -> List[str]:
+        return [name for name, _ in self.columns]
+
+DATASETS = {
+    'strategies': Dataset('strategies', (
+        ('id', 'text'), ('name', 'text'), ('symbol', 'text'), ('timeframe', 'text'),
+        ('status', 'text'), ('profit', 'real'), ('trades_count', 'int'),
+    ), UPSERT_STRATEGY, 'rowid'),
+    'trades': Dataset('trades', tuple(
+        (name, 'text' if name in ('id', 'strategy_id', 'symbol', 'direction') else 'real')
+        for name in TRADE_COLUMNS.split(', ')
+    ), UPSERT_TRADE, 'open_time'),
+    'profit_history': Dataset('profit_history', (
+        ('timestamp', 'real'), ('profit', 'real'), ('cumulative_profit', 'real'),
+    ), UPSERT_PROFIT, 'timestamp'),
+    'ticks': Dataset('ticks', (
+        ('symbol', 'text'), ('time', 'real'), ('bid', 'real'), ('ask', 'real'),
+    ), INSERT_TICK, 'rowid'),
+}
+
+# MT5 "Export Bars" files are named like XAUUSD_M5_202301020000_202312292355.csv
+MT5_BARS_NAME = re.compile(r'^([A-Za-z0-9.#]+?)_(M1|M5|M15|M30|H1|H4|D1)[_.]')
+
+class HistoryJob:
+    """Runs an export or import function on a worker thread for the GUI to poll.
+
+    The function is called as ``target(job, *args)`` and reports through
+    ``job.progress`` (0..1) and ``job.rows``; it should stop early once
+    ``job.cancelled`` is set. Its return value is kept in ``job.result``.
+    """
+    
+    def __init__(self, target, *args):
+        self.target = target
+        self.args = args
+        self.progress = 0.0
+        self.rows = 0
+        self.result = None
+        self.error = None
+        self.cancelled = threading.Event()
+        self.finished = threading.Event()
+        self.thread = None
+    
+    def start(self):
+        """Start the job in a background thread."""
+        self.thread = threading.Thread(target=self._run, name='HistoryJob', daemon=True)
+        self.thread.start()
+    
+    def cancel(self):
+        """Ask the job to stop after the current chunk."""
+        self.cancelled.set()
+    
+    @property
+    def done(self) -> bool:
+        return self.finished.is_set()
+    
+    def _run(self):
+        try:
+            self.result = self.target(self, *self.args)
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self.finished.set()
+
+def export_dataset(job: HistoryJob, db_path: str, name: str, path: str,
+                   chunk_size: int = config.HISTORY_CHUNK_SIZE):
+    """Stream a table to CSV or Parquet (by extension) in chunks of ``chunk_size`` rows."""
+    dataset = DATASETS[name]
+    connection = connect(db_path)
+    try:
+        total = connection.execute(f"SELECT COUNT(*) FROM {dataset.table}").fetchone()[0]
+        cursor = connection.execute(f"SELECT {', '.join(dataset.names)} FROM {dataset.table} "
+                                    f"ORDER BY {dataset.order}")
+        sink = _ParquetSink(path, dataset) if _is_parquet(path) else _CsvSink(path, dataset)
+        try:
+            while not job.cancelled.is_set():
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                sink.write(rows)
+                job.rows += len(rows)
+                job.progress = job.rows / total if total else 1.0
+        finally:
+            sink.close()
+    finally:
+        connection.close()
+    if job.cancelled.is_set():
+        os.remove(path)
+
+def import_dataset(job: HistoryJob, db_path: str, name: str, path: str,
+                   chunk_size: int = config.HISTORY_CHUNK_SIZE):
+    """Load a CSV or Parquet file into a table, committing one transaction per chunk.
+
+    Chunks committed before a cancel or an error stay in the database.
+    """
+    dataset = DATASETS[name]
+    chunks = _parquet_chunks if _is_parquet(path) else _csv_chunks
+    connection = connect(db_path)
+    try:
+        for rows, progress in chunks(path, dataset, chunk_size):
+            if job.cancelled.is_set():
+                break
+            connection.execute("BEGIN")
+            connection.executemany(dataset.statement, rows)
+            connection.execute("COMMIT")
+            job.rows += len(rows)
+            job.progress = progress
+    finally:
+        connection.close()
+
+def import_mt5_bars(job: HistoryJob, store, path: str, chunk_size: int = config.HISTORY_CHUNK_SIZE):
+    """Append an MT5 "Export Bars" file to the history store.
+
+    The symbol and timeframe come from the MT5 file name. Bar times are
+    taken as UTC. Tick volume is stored as the volume. Chunks newer than the
+    stored history are appended as they are read; once a chunk overlaps or
+    precedes it, the rest of the file is merged in one rewrite at the end,
+    with imported bars replacing stored ones of the same time.
+    ``job.rows`` counts the bars the history grew by.
+    """
+    match = MT5_BARS_NAME.match(os.path.basename(path))
+    if not match:
+        raise ValueError(f"Cannot tell symbol and timeframe from {os.path.basename(path)!r}; "
+                         "expected a name like XAUUSD_M5_....csv")
+    symbol, timeframe = match.groups()
+    pd = _pandas()
+    size = os.path.getsize(path) or 1
+    history = store.open(symbol, timeframe, writable=True)
+    pending = []
+    with open(path, 'rb') as f:
+        for frame in pd.read_csv(f, sep='\t', chunksize=chunk_size, float_precision='round_trip'):
+            if job.cancelled.is_set():
+                break
+            frame.columns = [column.strip('<>').upper() for column in frame.columns]
+            if 'TIME' in frame:
+                stamps = pd.to_datetime(frame['DATE'] + ' ' + frame['TIME'], format='%Y.%m.%d %H:%M:%S')
+            else:
+                stamps = pd.to_datetime(frame['DATE'], format='%Y.%m.%d')
+            times = stamps.to_numpy('datetime64[s]').astype(np.float64)
+            bars = PriceBars(times, *(frame[column].to_numpy(np.float64)
+                                      for column in ('OPEN', 'HIGH', 'LOW', 'CLOSE', 'TICKVOL')))
+            count = len(history)
+            if pending or (count and len(bars) and bars.time[0] <= history.columns[0][count - 1]):
+                pending.append(bars)
+            else:
+                job.rows += history.append(bars)
+            job.progress = min(1.0, f.tell() / size)
+    if pending and not job.cancelled.is_set():
+        job.rows += history.merge(PriceBars(*(np.concatenate(columns)
+                                              for columns in zip(*(bars.columns for bars in pending)))))
+    history.flush()
+
+class _CsvSink:
+    """Writes row chunks to a CSV file with a header line."""
+    
+    def __init__(self, path: str, dataset: Dataset):
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(dataset.names)
+    
+    def write(self, rows: List[tuple]):
+        self.writer.writerows(rows)
+    
+    def close(self):
+        self.file.close()
+
+class _ParquetSink:
+    """Writes each row chunk as one Parquet row group."""
+    
+    def __init__(self, path: str, dataset: Dataset):
+        pa, pq = _pyarrow()
+        types = {'text': pa.string(), 'real': pa.float64(), 'int': pa.int64()}
+        self.pa = pa
+        self.schema = pa.schema([(name, types[kind]) for name, kind in dataset.columns])
+        self.writer = pq.ParquetWriter(path, self.schema)
+    
+    def write(self, rows: List[tuple]):
+        columns = [self.pa.array(values, type=field.type) for values, field in zip(zip(*rows), self.schema)]
+        self.writer.write_table(self.pa.Table.from_arrays(columns, schema=self.schema))
+    
+    def close(self):
+        self.writer.close()
+
+def _csv_chunks(path: str, dataset: Dataset, chunk_size: int) -> Iterator[Tuple[List[tuple], float]]:
+    """Parse a CSV file chunk by chunk with pandas' C parser."""
+    pd = _pandas()
+    dtypes = {'text': str, 'real': np.float64, 'int': np.int64}
+    size = os.path.getsize(path) or 1
+    with open(path, 'rb') as f:
+        # Empty numbers (e.g. close_time of an open trade) become NaN, which sqlite3 stores as NULL;
+        # columns missing from files exported by older versions are filled the same way
+        for frame in pd.read_csv(f, chunksize=chunk_size, usecols=lambda name: name in dataset.names,
+                                 dtype={name: dtypes[kind] for name, kind in dataset.columns},
+                                 keep_default_na=False, float_precision='round_trip',
+                                 na_values={name: [''] for name, kind in dataset.columns if kind == 'real'}):
+            frame = frame.reindex(columns=dataset.names)
+            # tolist() yields plain Python values that sqlite3 can bind
+            yield list(zip(*(frame[name].tolist() for name in dataset.names))), min(1.0, f.tell() / size)
+
+def _parquet_chunks(path: str, dataset: Dataset, chunk_size: int) -> Iterator[Tuple[List[tuple], float]]:
+    """Read a Parquet file one record batch at a time."""
+    _, pq = _pyarrow()
+    parquet = pq.ParquetFile(path)
+    total = parquet.metadata.num_rows or 1
+    done = 0
+    for batch in parquet.iter_batches(batch_size=chunk_size, columns=dataset.names):
+        done += batch.num_rows
+        yield list(zip(*(column.to_pylist() for column in batch.columns))), done / total
+
+def _is_parquet(path: str) -> bool:
+    return path.lower().endswith(('.parquet', '.pq'))
+
+def _pandas():
+    """Import pandas on first use; it is only needed for CSV parsing."""
+    import pandas
+    return pandas
+
+def _pyarrow():
+    """Import pyarrow on first use, with a clear error when it is not installed."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError("Parquet files need the optional pyarrow package (pip install pyarrow)") from None
+    return pyarrow, pyarrow.parquet
\ No newline at end of file
@@ -0,0 +1,257 @@
+"""Memory-mapped columnar price history, one file per symbol and timeframe."""
+
+import mmap
+import os
+import struct
+import threading
+from typing import Optional
+import numpy as np
+import config
+from src.models.time_series import PriceBars
+
+# File layout (little-endian):
+#   [0, 4096)  header: magic, version, timeframe seconds, count, capacity,
+#              index stride, then the time of every stride-th bar
+#   [4096, ..) six float64 columns of ``capacity`` values each:
+#              time, open, high, low, close, volume
+MAGIC = b'SENHIST\0'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQI')
+HEADER_SIZE = 4096
+INDEX_OFFSET = 64
+INDEX_ENTRIES = (HEADER_SIZE - INDEX_OFFSET) // 8
+COLUMNS = ('time', 'open', 'high', 'low', 'close', 'volume')
+COUNT_OFFSET = 16
+
+class HistoryFile:
+    """One mapped history file; columns are NumPy views straight onto the mapping.
+
+    Opening only maps the file, so nothing is read until a range is touched.
+    Readers get zero-copy views; views taken before an append that grows the
+    file keep referring to the old mapping. Writes are serialized by
+    ``write_lock``; readers on other threads never see the columns go away,
+    because a rewrite swaps in the new mapping and leaves the old one to be
+    released once nothing refers to it.
+    """
+    
+    def __init__(self, path: str, writable: bool = False):
+        self.path = path
+        self.writable = writable
+        self.write_lock = threading.Lock()
+        self.file = None
+        self.mm = None
+        self._map()
+    
+    @classmethod
+    def create(cls, path: str, timeframe_seconds: int, capacity: int) -> 'HistoryFile':
+        """Create an empty file with room for ``capacity`` bars."""
+        capacity = max(1, capacity)
+        stride = max(1, -(-capacity // INDEX_ENTRIES))
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, timeframe_seconds, 0, capacity, stride))
+            f.truncate(HEADER_SIZE + len(COLUMNS) * capacity * 8)
+        return cls(path, writable=True)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    @property
+    def count(self) -> int:
+        """Number of bars stored."""
+        return struct.unpack_from('<Q', self.mm, COUNT_OFFSET)[0]
+    
+    def bars(self) -> PriceBars:
+        """Get every stored bar as zero-copy views."""
+        count = self.count
+        return PriceBars(*(column[:count] for column in self.columns))
+    
+    def between(self, start: Optional[float] = None, end: Optional[float] = None) -> PriceBars:
+        """Get the bars opening in [start, end) as zero-copy views."""
+        count = self.count
+        first = 0 if start is None else self._search(start, count)
+        last = count if end is None else self._search(end, count)
+        return PriceBars(*(column[first:last] for column in self.columns))
+    
+    def append(self, bars: PriceBars) -> int:
+        """Append bars newer than the last stored one, growing the file if needed.
+
+        Older bars are skipped (use merge() to insert them); returns the
+        number of bars appended.
+        """
+        if not self.writable:
+            raise ValueError(f"{self.path} is open read-only")
+        with self.write_lock:
+            return self._append(bars)
+    
+    def _append(self, bars: PriceBars) -> int:
+        """Append bars newer than the last stored one; the caller holds write_lock."""
+        count = self.count
+        if count:
+            bars = bars[int(np.searchsorted(bars.time, self.columns[0][count - 1], side='right')):]
+        added = len(bars)
+        if added == 0:
+            return 0
+        if count + added > self.capacity:
+            self._grow(max(2 * self.capacity, count + added))
+        
+        for column, values in zip(self.columns, bars.columns):
+            column[count:count + added] = values
+        rows = np.arange(-(-count // self.stride) * self.stride, count + added, self.stride)
+        self.index[rows // self.stride] = self.columns[0][rows]
+        # Publish the new count last so readers never see unwritten rows
+        struct.pack_into('<Q', self.mm, COUNT_OFFSET, count + added)
+        return added
+    
+    def merge(self, bars: PriceBars) -> int:
+        """Insert bars anywhere in the history, rewriting the file if they are not all newer.
+
+        A bar replaces a stored one with the same time. Returns how many
+        bars the history grew by.
+        """
+        if not self.writable:
+            raise ValueError(f"{self.path} is open read-only")
+        if len(bars) == 0:
+            return 0
+        with self.write_lock:
+            return self._merge(bars)
+    
+    def _merge(self, bars: PriceBars) -> int:
+        """Merge bars into the history; the caller holds write_lock."""
+        count = self.count
+        if count == 0 or (bars.time[0] > self.columns[0][count - 1] and np.all(np.diff(bars.time) > 0)):
+            return self._append(bars)
+        
+        # Incoming bars first, so np.unique keeps them over stored bars with the same time
+        combined = [np.concatenate((new, stored)) for new, stored in zip(bars.columns, self.bars().columns)]
+        _, first = np.unique(combined[0], return_index=True)
+        merged = PriceBars(*(column[first] for column in combined))
+        self._rewrite(merged, max(self.capacity, len(merged)))
+        return len(merged) - count
+    
+    def flush(self):
+        """Write dirty pages back to disk."""
+        if self.writable:
+            self.mm.flush()
+    
+    def close(self):
+        """Unmap the file; the mapping stays alive while callers still hold views."""
+        if self.mm is None:
+            return
+        self.flush()
+        self.columns = self.index = None
+        try:
+            self.mm.close()
+        except BufferError:
+            pass
+        self.file.close()
+        self.mm = None
+    
+    def _map(self):
+        """Map the file and build column and index views over it."""
+        file = open(self.path, 'r+b' if self.writable else 'rb')
+        access = mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+        mm = mmap.mmap(file.fileno(), 0, access=access)
+        magic, version, timeframe_seconds, _, capacity, stride = HEADER.unpack_from(mm)
+        if magic != MAGIC or version != VERSION:
+            mm.close()
+            file.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} history file")
+        
+        # Columns before the mapping whose header holds the count, so a concurrent
+        # reader pairs a count with columns at least that long
+        self.timeframe_seconds, self.capacity, self.stride = timeframe_seconds, capacity, stride
+        self.index = np.frombuffer(mm, np.float64, INDEX_ENTRIES, INDEX_OFFSET)
+        self.columns = [np.frombuffer(mm, np.float64, capacity, HEADER_SIZE + i * capacity * 8)
+                        for i in range(len(COLUMNS))]
+        self.file, self.mm = file, mm
+    
+    def _search(self, timestamp: float, count: int) -> int:
+        """Find the first row at or after a time via the header index, then one stride block."""
+        if count == 0:
+            return 0
+        blocks = -(-count // self.stride)
+        block = max(0, int(np.searchsorted(self.index[:blocks], timestamp, side='right')) - 1)
+        first = block * self.stride
+        last = min(count, first + self.stride)
+        return first + int(np.searchsorted(self.columns[0][first:last], timestamp, side='left'))
+    
+    def _grow(self, capacity: int):
+        """Rewrite the file with a larger capacity and remap it."""
+        self._rewrite(self.bars(), capacity)
+    
+    def _rewrite(self, bars: PriceBars, capacity: int):
+        """Replace the file with one holding ``bars`` and remap it."""
+        rewritten = HistoryFile.create(self.path + '.tmp', self.timeframe_seconds, capacity)
+        rewritten.append(bars)
+        rewritten.close()
+        self.flush()
+        os.replace(self.path + '.tmp', self.path)
+        self._map()
+
+class HistoryStore:
+    """Directory of HistoryFiles named ``SYMBOL_TIMEFRAME.bin``.
+
+    Generated sample bars are kept apart in ``SYMBOL_TIMEFRAME.sample.bin``
+    (``sample=True``), so they are never mistaken for market data and an
+    imported history takes precedence over them.
+    """
+    
+    def __init__(self, root: str = config.HISTORY_DIR):
+        self.root = root
+        self.files = {}
+        self.lock = threading.Lock()  # the store is shared by the GUI, sweep and import threads
+    
+    def path(self, symbol: str, timeframe: str, sample: bool = False) -> str:
+        """Get the file path for a symbol and timeframe."""
+        suffix = '.sample' if sample else ''
+        return os.path.join(self.root, f"{symbol}_{timeframe}{suffix}.bin")
+    
+    def exists(self, symbol: str, timeframe: str, sample: bool = False) -> bool:
+        """Check whether a history file exists."""
+        return os.path.exists(self.path(symbol, timeframe, sample))
+    
+    def open(self, symbol: str, timeframe: str, writable: bool = False, sample: bool = False) -> HistoryFile:
+        """Open (and cache) the history file for a symbol and timeframe."""
+        key = (symbol, timeframe, sample)
+        with self.lock:
+            history = self.files.get(key)
+            if history is None or (writable and not history.writable):
+                # A read-only handle being replaced may still be in use on another
+                # thread, so it is not closed; it is unmapped once unreferenced
+                path = self.path(symbol, timeframe, sample)
+                if writable and not os.path.exists(path):
+                    history = HistoryFile.create(path, config.TIMEFRAMES[timeframe], config.HISTORY_CAPACITY)
+                else:
+                    history = HistoryFile(path, writable)
+                self.files[key] = history
+            return history
+    
+    def load(self, symbol: str, timeframe: str, start: Optional[float] = None,
+             end: Optional[float] = None) -> PriceBars:
+        """Get the bars opening in [start, end) as zero-copy views."""
+        return self.open(symbol, timeframe).between(start, end)
+    
+    def append(self, symbol: str, timeframe: str, bars: PriceBars, sample: bool = False) -> int:
+        """Append new bars to a symbol's history, creating the file if needed; returns the count added."""
+        return self.open(symbol, timeframe, writable=True, sample=sample).append(bars)
+    
+    def merge(self, symbol: str, timeframe: str, bars: PriceBars) -> int:
+        """Merge bars of any age into a symbol's history; returns how many bars it grew by."""
+        return self.open(symbol, timeframe, writable=True).merge(bars)
+    
+    def close(self):
+        """Flush and unmap every open file."""
+        with self.lock:
+            for history in self.files.values():
+                history.close()
+            self.files.clear()
+
+_default_store = None
+
+def default_store() -> HistoryStore:
+    """Get the shared store for HISTORY_DIR, so readers and importers see one mapping per file."""
+    global _default_store
+    if _default_store is None:
+        _default_store = HistoryStore(config.HISTORY_DIR)
+    return _default_store
\ No newline at end of file
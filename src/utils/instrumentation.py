@@ -0,0 +1,154 @@
+"""Opt-in hot-path instrumentation with rolling histograms and Chrome trace export."""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+import numpy as np
+import config
+
+_NULL_SECTION = nullcontext()
+
+class RollingHistogram:
+    """Duration statistics over the most recent samples of one section."""
+    
+    def __init__(self, size: int):
+        self.samples = np.zeros(size)
+        self.position = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def add(self, duration: float):
+        self.samples[self.position] = duration
+        self.position = (self.position + 1) % len(self.samples)
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+    
+    def summary(self) -> dict:
+        """Count, mean and max over all samples; percentiles over the rolling window (ms)."""
+        recent = self.samples[:min(self.count, len(self.samples))] * 1000
+        p50, p95 = np.percentile(recent, [50, 95]) if len(recent) else (0.0, 0.0)
+        return {
+            'count': self.count,
+            'total_ms': self.total * 1000,
+            'mean_ms': self.total * 1000 / self.count if self.count else 0.0,
+            'p50_ms': float(p50),
+            'p95_ms': float(p95),
+            'max_ms': self.max * 1000,
+        }
+
+class _Section:
+    """Context manager that times one execution of a named section."""
+    
+    __slots__ = ('profiler', 'name', 'start')
+    
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+class Profiler:
+    """Collects section timings; does nothing until enabled."""
+    
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.histograms = {}
+        self.events = deque(maxlen=config.PROFILE_TRACE_EVENTS)
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+    
+    def enable(self):
+        """Start collecting timings and wrap Tk's after() callbacks."""
+        self.enabled = True
+        instrument_tk()
+    
+    def section(self, name: str):
+        """Time a block: ``with profiler.section('chart.draw'): ...``."""
+        return _Section(self, name) if self.enabled else _NULL_SECTION
+    
+    def wrap(self, name: str, func):
+        """Return func wrapped so each call is recorded under name."""
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, start, time.perf_counter() - start)
+        return timed
+    
+    def record(self, name: str, start: float, duration: float):
+        """Add one timing to the section's histogram and the trace buffer."""
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = RollingHistogram(config.PROFILE_WINDOW)
+            histogram.add(duration)
+            self.events.append((name, start, duration, threading.get_ident()))
+    
+    def stats(self) -> dict:
+        """Summaries of every section, keyed by name."""
+        with self.lock:
+            return {name: histogram.summary() for name, histogram in self.histograms.items()}
+    
+    def reset(self):
+        """Discard all collected timings."""
+        with self.lock:
+            self.histograms.clear()
+            self.events.clear()
+    
+    def export_chrome_trace(self, path: str):
+        """Write the buffered events as Chrome trace JSON (chrome://tracing, Perfetto)."""
+        with self.lock:
+            events = list(self.events)
+        pid = os.getpid()
+        trace = [{
+            'name': name,
+            'cat': name.split('.', 1)[0].split(':', 1)[0],
+            'ph': 'X',
+            'ts': (start - self.origin) * 1e6,
+            'dur': duration * 1e6,
+            'pid': pid,
+            'tid': tid,
+        } for name, start, duration, tid in events]
+        with open(path, 'w') as handle:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, handle)
+
+profiler = Profiler(enabled=os.environ.get('SEN_PROFILE') == '1')
+
+_tk_instrumented = False
+
+def instrument_tk():
+    """Time every callback scheduled through tkinter's after() and after_idle()."""
+    global _tk_instrumented
+    if _tk_instrumented:
+        return
+    _tk_instrumented = True
+    import tkinter as tk
+    original_after = tk.Misc.after
+    
+    def after(widget, ms, func=None, *args):
+        if func is not None and profiler.enabled:
+            name = 'after:' + getattr(func, '__qualname__', type(func).__name__)
+            func = profiler.wrap(name, func)
+        return original_after(widget, ms, func, *args)
+    
+    tk.Misc.after = after
+
+if profiler.enabled:
+    instrument_tk()
\ No newline at end of file
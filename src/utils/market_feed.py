@@ -0,0 +1,145 @@
+"""Background market data feed with a bounded hand-off queue."""
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, List
+import numpy as np
+import config
+from src.models.trading_data import Tick
+
+# Starting mid prices and spreads for the simulated source
+SIM_PRICES = {
+    'XAUUSD': (2350.0, 0.30),
+    'BTCUSD': (65000.0, 15.0),
+    'EURUSD': (1.0850, 0.0001),
+    'GBPUSD': (1.2700, 0.0002),
+    'USDJPY': (155.00, 0.02),
+}
+
+class TickSource:
+    """Interface for market data sources read by MarketFeed."""
+    
+    def connect(self):
+        """Open the connection to the data source."""
+    
+    def poll(self) -> List[Tick]:
+        """Block briefly and return any new ticks (possibly none)."""
+        raise NotImplementedError
+    
+    def close(self):
+        """Release the connection to the data source."""
+
+class SimulatedMT5Source(TickSource):
+    """Local random-walk quote generator that mimics an MT5 tick stream."""
+    
+    def __init__(self, symbols=None, ticks_per_second=None, batch_interval=0.01, seed=None):
+        self.symbols = list(symbols or config.FEED_SYMBOLS)
+        self.ticks_per_second = ticks_per_second or config.SIM_TICKS_PER_SECOND
+        self.batch_interval = batch_interval
+        self.rng = np.random.default_rng(seed)
+        self.mids = np.array([SIM_PRICES.get(s, (100.0, 0.01))[0] for s in self.symbols])
+        self.spreads = np.array([SIM_PRICES.get(s, (100.0, 0.01))[1] for s in self.symbols])
+        self.carry = 0.0
+        self.last_poll = None
+    
+    def connect(self):
+        """Start the simulated clock."""
+        self.last_poll = time.time()
+    
+    def poll(self) -> List[Tick]:
+        """Generate the ticks due since the previous poll."""
+        time.sleep(self.batch_interval)
+        now = time.time()
+        self.carry += (now - self.last_poll) * self.ticks_per_second
+        self.last_poll = now
+        count = int(self.carry)
+        self.carry -= count
+        if count == 0:
+            return []
+        
+        # Random-walk every symbol with vectorized steps, then emit in tick order
+        symbol_index = self.rng.integers(0, len(self.symbols), count)
+        steps = self.rng.normal(0.0, 0.0002, count)
+        mids = np.empty(count)
+        for i in range(len(self.symbols)):
+            mask = symbol_index == i
+            if mask.any():
+                path = self.mids[i] * np.cumprod(1.0 + steps[mask])
+                mids[mask] = path
+                self.mids[i] = path[-1]
+        half_spreads = self.spreads[symbol_index] / 2
+        bids = (mids - half_spreads).tolist()
+        asks = (mids + half_spreads).tolist()
+        times = np.linspace(now - self.batch_interval, now, count).tolist()
+        
+        return [Tick(self.symbols[s], bid, ask, t)
+                for s, bid, ask, t in zip(symbol_index.tolist(), bids, asks, times)]
+
+class MarketFeed:
+    """Runs a TickSource on a worker thread and buffers its ticks for the GUI."""
+    
+    def __init__(self, source: TickSource, maxsize: int = None, on_batch: Callable = None):
+        self.source = source
+        self.on_batch = on_batch
+        self.queue = queue.Queue(maxsize or config.FEED_QUEUE_SIZE)
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.received = 0
+        self.dropped = 0
+    
+    def start(self):
+        """Start reading from the source in a background thread."""
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name='MarketFeed', daemon=True)
+        self.thread.start()
+    
+    def stop(self, timeout: float = 1.0):
+        """Stop the worker thread and close the source."""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout)
+            self.thread = None
+    
+    def drain(self, max_batches: int = None) -> Dict[str, Tick]:
+        """Take queued batches and coalesce them into the latest tick per symbol."""
+        latest = {}
+        remaining = max_batches or self.queue.maxsize
+        while remaining:
+            try:
+                batch = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            for tick in batch:
+                latest[tick.symbol] = tick
+            remaining -= 1
+        return latest
+    
+    def _run(self):
+        """Worker loop: poll the source and hand batches to the queue."""
+        self.source.connect()
+        try:
+            while not self.stop_event.is_set():
+                batch = self.source.poll()
+                if batch:
+                    self.received += len(batch)
+                    if self.on_batch:
+                        # Runs on the feed thread, e.g. to persist every raw tick
+                        self.on_batch(batch)
+                    self._put(batch)
+        finally:
+            self.source.close()
+    
+    def _put(self, batch: List[Tick]):
+        """Queue a batch, discarding the oldest one when the GUI falls behind."""
+        while True:
+            try:
+                self.queue.put_nowait(batch)
+                return
+            except queue.Full:
+                try:
+                    self.dropped += len(self.queue.get_nowait())
+                except queue.Empty:
+                    pass
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""Process-pool parameter sweeps over shared-memory price history."""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+import itertools
+import multiprocessing
+from multiprocessing import shared_memory
+import os
+import queue
+import threading
+from typing import Callable, Dict, List, Sequence, Tuple
+import numpy as np
+import config
+from src.models.time_series import PriceBars
+from src.utils.backtest import ChannelParams, history_bars, run_backtest
+
+COLUMNS = 6  # time, open, high, low, close, volume
+
+@dataclass
+class SweepResult:
+    """Backtest statistics for one parameter set on one symbol and timeframe."""
+    symbol: str
+    timeframe: str
+    params: ChannelParams
+    stats: Dict[str, float]
+
+class SharedBars:
+    """PriceBars copied once into a shared memory block that workers map by name."""
+    
+    def __init__(self, bars: PriceBars):
+        self.length = len(bars)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, COLUMNS * self.length * 8))
+        columns = np.ndarray((COLUMNS, self.length), dtype=np.float64, buffer=self.shm.buf)
+        for i, column in enumerate(bars.columns):
+            columns[i] = column
+        del columns  # the buffer cannot be closed while a view exports it
+    
+    @property
+    def handle(self) -> Tuple[str, int]:
+        """Picklable reference that workers pass to _attach."""
+        return self.shm.name, self.length
+    
+    def release(self):
+        """Close and unlink the block; workers keep their mappings until they exit."""
+        self.shm.close()
+        self.shm.unlink()
+
+# Shared memory blocks mapped by this worker process, by name
+_attached: Dict[str, Tuple[shared_memory.SharedMemory, PriceBars]] = {}
+
+def _attach(handle: Tuple[str, int]) -> PriceBars:
+    """Map a SharedBars block as zero-copy PriceBars columns."""
+    name, length = handle
+    if name not in _attached:
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # Python < 3.13 registers with the parent's resource tracker
+            shm = shared_memory.SharedMemory(name=name)
+        columns = np.ndarray((COLUMNS, length), dtype=np.float64, buffer=shm.buf)
+        _attached[name] = (shm, PriceBars(*columns))
+    return _attached[name][1]
+
+def _run_chunk(handle: Tuple[str, int], contract_size: float,
+               chunk: List[ChannelParams]) -> List[Tuple[ChannelParams, Dict[str, float]]]:
+    """Worker task: backtest a chunk of parameter sets on one shared history."""
+    bars = _attach(handle)
+    return [(params, run_backtest(bars, params, contract_size).stats) for params in chunk]
+
+class ParameterSweep:
+    """Fans a parameter grid out over a process pool and streams results back.
+
+    Each (symbol, timeframe) history is loaded once in this process and
+    placed in shared memory, so tasks only carry its name and a chunk of
+    parameter sets. Workers are spawned rather than forked so they never
+    inherit the Tk interpreter or the feed threads. Results are queued for
+    the GUI to drain from an after() callback; nothing here blocks the caller.
+    """
+    
+    def __init__(self, symbols: Sequence[str], timeframes: Sequence[str],
+                 entry_periods: Sequence[int], exit_periods: Sequence[int],
+                 stop_losses: Sequence[float], direction: int = 1, workers: int = None,
+                 chunk_size: int = config.SWEEP_CHUNK_SIZE,
+                 load_bars: Callable[[str, str], PriceBars] = history_bars):
+        self.datasets = list(itertools.product(symbols, timeframes))
+        self.grid = [ChannelParams(entry, exit_, stop, direction=direction)
+                     for entry, exit_, stop in itertools.product(entry_periods, exit_periods, stop_losses)]
+        self.workers = workers or config.SWEEP_WORKERS or os.cpu_count()
+        self.chunk_size = chunk_size
+        self.load_bars = load_bars
+        self.total = len(self.datasets) * len(self.grid)
+        self.completed = 0
+        self.error = None
+        self.results = queue.Queue()
+        self.cancelled = threading.Event()
+        self.finished = threading.Event()
+        self.executor = None
+        self.thread = None
+    
+    def start(self):
+        """Load histories and submit tasks from a background thread."""
+        self.thread = threading.Thread(target=self._run, name='ParameterSweep', daemon=True)
+        self.thread.start()
+    
+    def cancel(self):
+        """Drop queued tasks; tasks already running finish and are discarded."""
+        self.cancelled.set()
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+    
+    @property
+    def done(self) -> bool:
+        """True once every task has finished or been cancelled and all results were drained."""
+        return self.finished.is_set() and self.results.empty()
+    
+    def drain(self) -> List[SweepResult]:
+        """Take the results that arrived since the previous call."""
+        results = []
+        while True:
+            try:
+                results.append(self.results.get_nowait())
+            except queue.Empty:
+                break
+        self.completed += len(results)
+        return results
+    
+    def _run(self):
+        """Submitter thread: share each history, then queue its parameter chunks."""
+        shared = []
+        context = multiprocessing.get_context('spawn')
+        try:
+            with ProcessPoolExecutor(self.workers, mp_context=context) as executor:
+                self.executor = executor
+                for symbol, timeframe in self.datasets:
+                    if self.cancelled.is_set():
+                        break
+                    block = SharedBars(self.load_bars(symbol, timeframe))
+                    shared.append(block)
+                    contract_size = config.CONTRACT_SIZES.get(symbol, 1)
+                    for start in range(0, len(self.grid), self.chunk_size):
+                        chunk = self.grid[start:start + self.chunk_size]
+                        try:
+                            future = executor.submit(_run_chunk, block.handle, contract_size, chunk)
+                        except RuntimeError:  # cancel() shut the pool down
+                            break
+                        future.add_done_callback(partial(self._collect, symbol, timeframe))
+        except Exception as exc:
+            self.error = exc
+        finally:
+            for block in shared:
+                block.release()
+            self.finished.set()
+    
+    def _collect(self, symbol: str, timeframe: str, future):
+        """Queue the results of a finished task (runs on a pool thread)."""
+        if future.cancelled() or self.cancelled.is_set():
+            return
+        if future.exception() is not None:
+            self.error = future.exception()
+            return
+        for params, stats in future.result():
+            self.results.put(SweepResult(symbol, timeframe, params, stats))
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""Coalesced, rate-limited refresh passes for screen widgets."""
+
+import time
+from typing import Callable
+import config
+from src.utils.instrumentation import profiler
+
+class RefreshScheduler:
+    """Merges widget refresh requests into one idle-time render pass.
+
+    Widgets call request() when their data changes instead of polling on a
+    timer. Requests made before the next pass are merged. A pass runs as
+    soon as the rate cap allows: right away after a quiet spell, then at
+    most once per ``interval`` ms while data keeps arriving, and not at all
+    while nothing changes. An unfocused window refreshes
+    ``unfocused_factor`` times less often. A minimized window defers every
+    pass until it is restored. Callbacks that do not fit in the frame budget
+    carry over to the next idle slot so input is never starved.
+    """
+    
+    def __init__(self, root, interval: int = config.CHART_UPDATE_INTERVAL,
+                 budget: float = config.REFRESH_FRAME_BUDGET,
+                 unfocused_factor: float = config.REFRESH_UNFOCUSED_FACTOR):
+        self.root = root
+        self.interval = interval
+        self.budget = budget
+        self.unfocused_factor = unfocused_factor
+        self.pending = {}  # callback -> None, in request order
+        self.job = None
+        self.idle_job = None
+        self.last_pass = float('-inf')
+        self.passes = 0
+        self.deferred = 0
+        root.bind('<Map>', self._on_map, add='+')
+        root.bind('<FocusIn>', self._on_focus, add='+')
+    
+    def request(self, callback: Callable[[], None]):
+        """Run a callback in the next refresh pass; repeated requests are merged."""
+        self.pending[callback] = None
+        self._schedule()
+    
+    def cancel(self, callback: Callable[[], None]):
+        """Drop a pending callback, e.g. when its screen is hidden."""
+        self.pending.pop(callback, None)
+    
+    def set_interval(self, interval: int):
+        """Change the minimum time between passes; applies to the pass already waiting."""
+        self.interval = interval
+        self._reschedule()
+    
+    def _gap(self) -> float:
+        """Get the minimum seconds between passes for the current window state."""
+        gap = self.interval / 1000
+        if self.root.focus_displayof() is None:
+            gap *= self.unfocused_factor
+        return gap
+    
+    def _suspended(self) -> bool:
+        """True while the window is minimized or withdrawn."""
+        return self.root.state() in ('iconic', 'withdrawn')
+    
+    def _schedule(self):
+        """Arm the timer for the next pass if work is waiting and none is armed."""
+        if self.job or self.idle_job or not self.pending or self._suspended():
+            return
+        delay = self.last_pass + self._gap() - time.perf_counter()
+        self.job = self.root.after(int(max(0.0, delay) * 1000), self._on_due)
+    
+    def _reschedule(self):
+        """Re-arm a waiting timer after the interval or focus changed."""
+        if self.job:
+            self.root.after_cancel(self.job)
+            self.job = None
+        self._schedule()
+    
+    def _on_due(self):
+        """Timer expired: run the pass once Tk has no events left to handle."""
+        self.job = None
+        self.idle_job = self.root.after_idle(self._run_pass)
+    
+    def _run_pass(self, resumed: bool = False):
+        """Run the pending callbacks until they are done or the frame budget is spent."""
+        self.idle_job = None
+        if self._suspended():
+            return
+        started = time.perf_counter()
+        if not resumed:
+            self.last_pass = started
+            self.passes += 1
+        deadline = started + self.budget / 1000
+        
+        batch = list(self.pending)
+        self.pending.clear()
+        with profiler.section('refresh.pass'):
+            for i, callback in enumerate(batch):
+                callback()
+                if i + 1 < len(batch) and time.perf_counter() > deadline:
+                    # Over budget: finish in the next idle slot, after pending input
+                    self.pending = {**dict.fromkeys(batch[i + 1:]), **self.pending}
+                    self.deferred += 1
+                    self.idle_job = self.root.after_idle(self._run_pass, True)
+                    return
+        self._schedule()
+    
+    def _on_map(self, event):
+        """Resume deferred passes when the window is restored."""
+        if event.widget is self.root:
+            self._schedule()
+    
+    def _on_focus(self, event):
+        """Return to the focused rate as soon as the window regains focus."""
+        if self.job:
+            self._reschedule()
\ No newline at end of file
@@ -0,0 +1,303 @@
+"""SQLite persistence for strategies, trades, ticks and profit history."""
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+import config
+from src.models.trading_data import Strategy, Trade, ProfitData, Tick
+
+log = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS strategies (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    status TEXT NOT NULL,
+    profit REAL NOT NULL DEFAULT 0,
+    trades_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS trades (
+    id TEXT PRIMARY KEY,
+    strategy_id TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    volume REAL NOT NULL,
+    open_price REAL NOT NULL,
+    current_price REAL NOT NULL,
+    profit REAL NOT NULL,
+    open_time REAL NOT NULL,
+    close_time REAL  -- NULL while the trade is open
+);
+CREATE INDEX IF NOT EXISTS idx_trades_strategy_time ON trades (strategy_id, open_time);
+CREATE INDEX IF NOT EXISTS idx_trades_symbol_time ON trades (symbol, open_time);
+CREATE TABLE IF NOT EXISTS ticks (
+    symbol TEXT NOT NULL,
+    time REAL NOT NULL,
+    bid REAL NOT NULL,
+    ask REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ticks_symbol_time ON ticks (symbol, time);
+CREATE TABLE IF NOT EXISTS profit_history (
+    timestamp REAL PRIMARY KEY,
+    profit REAL NOT NULL,
+    cumulative_profit REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Parameterized statements; sqlite3 caches the prepared form per connection
+UPSERT_STRATEGY = ("INSERT OR REPLACE INTO strategies "
+                   "(id, name, symbol, timeframe, status, profit, trades_count) "
+                   "VALUES (?, ?, ?, ?, ?, ?, ?)")
+UPSERT_TRADE = ("INSERT OR REPLACE INTO trades "
+                "(id, strategy_id, symbol, direction, volume, open_price, current_price, profit, open_time, "
+                "close_time) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+INSERT_TICK = "INSERT INTO ticks (symbol, time, bid, ask) VALUES (?, ?, ?, ?)"
+UPSERT_PROFIT = ("INSERT OR REPLACE INTO profit_history (timestamp, profit, cumulative_profit) "
+                 "VALUES (?, ?, ?)")
+PRUNE_TICKS = "DELETE FROM ticks WHERE symbol = ? AND time < ?"
+
+TRADE_COLUMNS = ("id, strategy_id, symbol, direction, volume, open_price, current_price, profit, open_time, "
+                 "close_time")
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open a connection in WAL mode with the schema in place."""
+    connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False,
+                                 cached_statements=256)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    _add_column(connection, 'trades', 'close_time', 'REAL')
+    return connection
+
+def _add_column(connection: sqlite3.Connection, table: str, column: str, kind: str):
+    """Add a column that databases created by older versions lack."""
+    if any(row[1] == column for row in connection.execute(f"PRAGMA table_info({table})")):
+        return
+    try:
+        connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {kind}")
+    except sqlite3.OperationalError:
+        if not any(row[1] == column for row in connection.execute(f"PRAGMA table_info({table})")):
+            raise  # not a concurrent connection adding it first
+
+def strategy_row(strategy: Strategy) -> tuple:
+    return (strategy.id, strategy.name, strategy.symbol, strategy.timeframe,
+            strategy.status, strategy.profit, strategy.trades_count)
+
+def trade_row(trade: Trade) -> tuple:
+    return (trade.id, trade.strategy_id, trade.symbol, trade.direction, trade.volume,
+            trade.open_price, trade.current_price, trade.profit, trade.open_time.timestamp(),
+            trade.close_time and trade.close_time.timestamp())
+
+def trade_from_row(row: tuple) -> Trade:
+    """Build a Trade from a row selected with TRADE_COLUMNS."""
+    id_, strategy_id, symbol, direction, volume, open_price, current_price, profit, open_time, close_time = row
+    return Trade(id_, symbol, direction, volume, open_price, current_price, profit,
+                 datetime.fromtimestamp(open_time), strategy_id,
+                 None if close_time is None else datetime.fromtimestamp(close_time))
+
+def tick_row(tick: Tick) -> tuple:
+    return (tick.symbol, tick.time, tick.bid, tick.ask)
+
+def profit_row(point: ProfitData) -> tuple:
+    return (point.timestamp.timestamp(), point.profit, point.cumulative_profit)
+
+class SQLiteStore:
+    """Read side of the database; queries are served from the indexes."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = connect(path)
+    
+    def load_strategies(self) -> List[Strategy]:
+        """Load every stored strategy."""
+        rows = self.connection.execute(
+            "SELECT id, name, symbol, timeframe, status, profit, trades_count "
+            "FROM strategies ORDER BY rowid")
+        return [Strategy(*row) for row in rows]
+    
+    def load_profit_window(self, start: float, end: float = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Load the profit points between two POSIX timestamps as column arrays."""
+        rows = self.connection.execute(
+            "SELECT timestamp, profit, cumulative_profit FROM profit_history "
+            "WHERE timestamp >= ? AND timestamp <= ? ORDER BY timestamp",
+            (start, float('inf') if end is None else end)).fetchall()
+        if not rows:
+            return np.empty(0), np.empty(0), np.empty(0)
+        columns = np.array(rows, dtype=np.float64)
+        return columns[:, 0], columns[:, 1], columns[:, 2]
+    
+    def last_profit_point(self) -> Optional[tuple]:
+        """Get the newest (timestamp, profit, cumulative_profit) row, or None when there is none."""
+        return self.connection.execute(
+            "SELECT timestamp, profit, cumulative_profit FROM profit_history "
+            "ORDER BY timestamp DESC LIMIT 1").fetchone()
+    
+    def load_trades(self) -> List[Trade]:
+        """Load every stored trade, open and closed, in the order they were opened."""
+        rows = self.connection.execute(f"SELECT {TRADE_COLUMNS} FROM trades ORDER BY open_time, rowid")
+        return [trade_from_row(row) for row in rows]
+    
+    def trades_for_strategy(self, strategy_id: str, start: float = 0.0, end: float = None) -> List[tuple]:
+        """Get trade rows of one strategy opened in a time range."""
+        return self.connection.execute(
+            f"SELECT {TRADE_COLUMNS} FROM trades "
+            "WHERE strategy_id = ? AND open_time BETWEEN ? AND ? ORDER BY open_time",
+            (strategy_id, start, float('inf') if end is None else end)).fetchall()
+    
+    def trades_for_symbol(self, symbol: str, start: float = 0.0, end: float = None) -> List[tuple]:
+        """Get trade rows on one symbol opened in a time range."""
+        return self.connection.execute(
+            f"SELECT {TRADE_COLUMNS} FROM trades "
+            "WHERE symbol = ? AND open_time BETWEEN ? AND ? ORDER BY open_time",
+            (symbol, start, float('inf') if end is None else end)).fetchall()
+    
+    def ticks_for_symbol(self, symbol: str, start: float, end: float = None) -> np.ndarray:
+        """Get (time, bid, ask) rows for one symbol in a time range."""
+        rows = self.connection.execute(
+            "SELECT time, bid, ask FROM ticks "
+            "WHERE symbol = ? AND time BETWEEN ? AND ? ORDER BY time",
+            (symbol, start, float('inf') if end is None else end)).fetchall()
+        return np.array(rows, dtype=np.float64).reshape(-1, 3)
+    
+    def close(self):
+        """Close the read connection."""
+        self.connection.close()
+
+class SQLiteWriter:
+    """Background writer that batches inserts into single transactions.
+
+    The save_* methods only enqueue rows, so they are safe to call from the
+    GUI thread or the feed thread without waiting on disk I/O. The queue
+    holds at most ``queue_size`` calls; rows saved while it is full are
+    dropped and counted in ``dropped``. A batch that fails to commit is
+    rolled back, logged and counted in ``failed`` (the exception is kept
+    in ``error``), and the writer carries on with the next batch.
+
+    Ticks older than ``tick_retention`` seconds are deleted every
+    DB_TICK_PRUNE_INTERVAL seconds, one symbol at a time through the
+    (symbol, time) index; with ``tick_retention=None`` the table keeps
+    every tick and grows without limit.
+    """
+    
+    def __init__(self, path: str, batch_size: int = 5000, flush_interval: float = 0.25,
+                 queue_size: int = config.DB_WRITER_QUEUE_SIZE,
+                 tick_retention: Optional[float] = config.DB_TICK_RETENTION):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.written = 0
+        self.failed = 0
+        self.dropped = 0
+        self.error = None
+        self.overflowing = False
+        self.tick_retention = tick_retention
+        self.tick_symbols = None  # symbols with stored ticks, read from the table at the first prune
+        self.next_prune = 0.0
+        self.pruned = 0
+        self.thread = threading.Thread(target=self._run, name='SQLiteWriter', daemon=True)
+        self.thread.start()
+    
+    def save_strategies(self, strategies: Iterable[Strategy]):
+        self.save_rows(UPSERT_STRATEGY, [strategy_row(s) for s in strategies])
+    
+    def save_trades(self, trades: Iterable[Trade]):
+        self.save_rows(UPSERT_TRADE, [trade_row(t) for t in trades])
+    
+    def save_ticks(self, ticks: Iterable[Tick]):
+        self.save_rows(INSERT_TICK, [tick_row(t) for t in ticks])
+    
+    def save_profit_points(self, points: Iterable[ProfitData]):
+        self.save_rows(UPSERT_PROFIT, [profit_row(p) for p in points])
+    
+    def save_rows(self, statement: str, rows: List[tuple]):
+        """Queue pre-built rows for one of the module's statements, dropping them if the queue is full."""
+        try:
+            self.queue.put_nowait((statement, rows))
+        except queue.Full:
+            self.dropped += len(rows)
+            if not self.overflowing:
+                self.overflowing = True
+                log.warning("SQLite writer queue is full; dropping rows (%s)", self.path)
+            return
+        self.overflowing = False
+    
+    def close(self, timeout: float = 5.0):
+        """Flush pending rows and stop the writer thread."""
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            log.warning("SQLite writer did not drain its queue; %d rows unsaved", self.queue.qsize())
+            return
+        self.thread.join(timeout)
+    
+    def _run(self):
+        """Writer loop: gather queued rows and commit them in batches."""
+        connection = connect(self.path)
+        running = True
+        while running:
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            
+            # Collect everything already queued, up to the batch size
+            batches = {}
+            pending = 0
+            while item is not None:
+                statement, rows = item
+                batches.setdefault(statement, []).extend(rows)
+                pending += len(rows)
+                if pending >= self.batch_size:
+                    break
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            if item is None:
+                running = False
+            
+            if batches:
+                try:
+                    connection.execute("BEGIN")
+                    for statement, rows in batches.items():
+                        connection.executemany(statement, rows)
+                    connection.execute("COMMIT")
+                    self.written += pending
+                except Exception as exc:
+                    if connection.in_transaction:
+                        connection.rollback()
+                    self.failed += pending
+                    self.error = exc
+                    log.exception("SQLite writer dropped a batch of %d rows", pending)
+                
+                ticks = batches.get(INSERT_TICK)
+                if ticks and self.tick_symbols is not None:
+                    self.tick_symbols.update(row[0] for row in ticks)
+            
+            if self.tick_retention is not None and time.monotonic() >= self.next_prune:
+                self.next_prune = time.monotonic() + config.DB_TICK_PRUNE_INTERVAL
+                self._prune_ticks(connection)
+        connection.close()
+    
+    def _prune_ticks(self, connection: sqlite3.Connection):
+        """Delete ticks older than the retention window."""
+        try:
+            if self.tick_symbols is None:
+                self.tick_symbols = {row[0] for row in connection.execute("SELECT DISTINCT symbol FROM ticks")}
+            cutoff = time.time() - self.tick_retention
+            connection.execute("BEGIN")
+            for symbol in self.tick_symbols:
+                self.pruned += connection.execute(PRUNE_TICKS, (symbol, cutoff)).rowcount
+            connection.execute("COMMIT")
+        except Exception:
+            if connection.in_transaction:
+                connection.rollback()
+            log.exception("SQLite writer could not prune old ticks")
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""Cold-start timing report: import-time breakdown and time to first frame."""
+
+import os
+import subprocess
+import sys
+import time
+
+# Set in the child process that actually starts the GUI
+CHILD_ENV = 'SEN_STARTUP_PROBE'
+FIRST_FRAME_PREFIX = 'first-frame-ms='
+
+def startup_report(script_path, start_time, top=20):
+    """Run the startup report; returns a process exit code."""
+    if os.environ.get(CHILD_ENV):
+        return _run_probe(start_time)
+    
+    env = dict(os.environ, **{CHILD_ENV: '1'})
+    launched = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', script_path, '--startup-report'],
+                            env=env, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - launched) * 1000
+    
+    imports = parse_importtime(result.stderr)
+    first_frame = None
+    for line in result.stdout.splitlines():
+        if line.startswith(FIRST_FRAME_PREFIX):
+            first_frame = float(line[len(FIRST_FRAME_PREFIX):])
+    
+    print(format_report(imports, first_frame, wall_ms, top))
+    if result.returncode != 0:
+        print(result.stdout)
+        print("\n".join(line for line in result.stderr.splitlines()
+                        if not line.startswith('import time:')))
+    return result.returncode
+
+def parse_importtime(stderr):
+    """Parse `-X importtime` output into (module, self_us, cumulative_us, depth) rows."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(parts[0]), int(parts[1]), depth))
+    return rows
+
+def format_report(imports, first_frame_ms, wall_ms, top=20):
+    """Format the startup report as text."""
+    lines = ["SEN Trading System startup report", ""]
+    total_us = sum(row[1] for row in imports)
+    lines.append(f"Total import time:      {total_us / 1000:8.1f} ms ({len(imports)} modules)")
+    if first_frame_ms is not None:
+        lines.append(f"Time to first frame:    {first_frame_ms:8.1f} ms (from run.py start)")
+    lines.append(f"Process wall time:      {wall_ms:8.1f} ms (including interpreter start)")
+    
+    lines.extend(["", f"Top {top} imports (first two levels) by cumulative time:"])
+    top_level = sorted((row for row in imports if row[3] <= 1), key=lambda row: -row[2])
+    for name, _, cumulative, _ in top_level[:top]:
+        lines.append(f"  {cumulative / 1000:8.1f} ms  {name}")
+    
+    lines.extend(["", f"Top {top} modules by self time:"])
+    for name, self_us, _, _ in sorted(imports, key=lambda row: -row[1])[:top]:
+        lines.append(f"  {self_us / 1000:8.1f} ms  {name}")
+    return "\n".join(lines)
+
+def _run_probe(start_time):
+    """Start the GUI, report time to the first drawn frame and exit."""
+    from main import main
+    
+    def on_ready(root):
+        state = {'done': False}
+        
+        def first_frame():
+            print(f"{FIRST_FRAME_PREFIX}{(time.perf_counter() - start_time) * 1000:.1f}", flush=True)
+            root.quit()
+        
+        def on_map(event):
+            if not state['done']:
+                state['done'] = True
+                root.after_idle(first_frame)
+        
+        root.bind('<Map>', on_map, add='+')
+    
+    main(on_ready=on_ready)
+    return 0
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""Per-strategy performance analytics kept current as trades close."""
+
+from typing import Dict, Iterable, Optional
+import numpy as np
+from src.models.trade_book import TradeBook
+from src.models.trading_data import Trade
+
+# Running totals kept per strategy, one row of ``state`` each
+FIELDS = ('count', 'wins', 'gross_profit', 'gross_loss', 'sum_sq', 'downside_sq',
+          'equity', 'peak', 'max_drawdown')
+COUNT, WINS, GROSS_PROFIT, GROSS_LOSS, SUM_SQ, DOWNSIDE_SQ, EQUITY, PEAK, MAX_DRAWDOWN = range(len(FIELDS))
+
+# Metrics derived from the totals
+METRICS = ('sharpe', 'sortino', 'win_rate', 'profit_factor', 'max_drawdown', 'expectancy')
+
+class StrategyAnalytics:
+    """Sharpe, Sortino, win rate, profit factor, max drawdown and expectancy per strategy.
+
+    Each strategy has a row of running totals over its closed trades (count,
+    wins, gross profit and loss, sums of squares and its realized equity
+    curve's peak and drawdown). A closing trade updates its strategy's row
+    in O(1), and the metrics of every strategy are then derived from the
+    totals in one vectorized pass, cached until the next close.
+
+    Ratios are per trade: Sharpe is mean profit over its standard deviation
+    and Sortino uses the downside deviation of losing trades. Max drawdown
+    is in account currency, measured on the strategy's realized profit.
+    """
+    
+    def __init__(self, trade_book: TradeBook = None, capacity: int = 64):
+        self.row_by_strategy: Dict[str, int] = {}
+        self.state = np.zeros((len(FIELDS), capacity))
+        self.size = 0
+        self.version = 0
+        self.cached_version = -1
+        self.cached = {}  # metric -> list of values by row, None where undefined
+        if trade_book is not None:
+            self.load(trade_book)
+    
+    def load(self, trade_book: TradeBook):
+        """Rebuild every strategy's totals from a book's closed trades in one pass."""
+        self.state[:] = 0.0
+        size = trade_book.size
+        slots = np.flatnonzero(~trade_book.is_open[:size] & ~np.isnan(trade_book.close_time[:size]))
+        self.version += 1
+        if len(slots) == 0:
+            return
+        
+        rows = np.fromiter((self._row(trade_book.strategy_ids[slot]) for slot in slots.tolist()),
+                           dtype=np.intp, count=len(slots))
+        order = np.lexsort((trade_book.close_time[slots], rows))
+        rows = rows[order]
+        profit = trade_book.profit[slots][order]
+        state = self.state
+        
+        state[COUNT, :self.size] = np.bincount(rows, minlength=self.size)
+        state[WINS, :self.size] = np.bincount(rows, weights=profit > 0, minlength=self.size)
+        state[GROSS_PROFIT, :self.size] = np.bincount(rows, weights=np.maximum(profit, 0), minlength=self.size)
+        state[GROSS_LOSS, :self.size] = np.bincount(rows, weights=np.maximum(-profit, 0), minlength=self.size)
+        state[SUM_SQ, :self.size] = np.bincount(rows, weights=profit * profit, minlength=self.size)
+        losses = np.minimum(profit, 0)
+        state[DOWNSIDE_SQ, :self.size] = np.bincount(rows, weights=losses * losses, minlength=self.size)
+        
+        # Realized equity curve of each strategy: a running sum restarted at every group
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        ends = np.r_[starts[1:], len(rows)]
+        equity = np.cumsum(profit)
+        equity -= np.repeat(equity[starts] - profit[starts], ends - starts)
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            curve = equity[start:end]
+            peak = np.maximum.accumulate(np.maximum(curve, 0.0))
+            row = rows[start]
+            state[EQUITY, row] = curve[-1]
+            state[PEAK, row] = peak[-1]
+            state[MAX_DRAWDOWN, row] = (peak - curve).max()
+    
+    def on_trade_closed(self, trade: Trade):
+        """Fold one closed trade into its strategy's totals."""
+        row = self._row(trade.strategy_id)
+        totals = self.state[:, row]
+        profit = trade.profit
+        totals[COUNT] += 1
+        if profit > 0:
+            totals[WINS] += 1
+            totals[GROSS_PROFIT] += profit
+        else:
+            totals[GROSS_LOSS] -= profit
+            totals[DOWNSIDE_SQ] += profit * profit
+        totals[SUM_SQ] += profit * profit
+        totals[EQUITY] += profit
+        totals[PEAK] = max(totals[PEAK], totals[EQUITY])
+        totals[MAX_DRAWDOWN] = max(totals[MAX_DRAWDOWN], totals[PEAK] - totals[EQUITY])
+        self.version += 1
+    
+    def metrics(self) -> Dict[str, np.ndarray]:
+        """Compute every metric for every strategy row; NaN where a metric is undefined."""
+        state = self.state[:, :self.size]
+        count = state[COUNT]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = state[EQUITY] / count
+            variance = (state[SUM_SQ] - count * mean * mean) / (count - 1)
+            std = np.sqrt(np.maximum(variance, 0.0))
+            downside = np.sqrt(state[DOWNSIDE_SQ] / count)
+            return {
+                'sharpe': np.where((count > 1) & (std > 0), mean / std, np.nan),
+                'sortino': np.where(downside > 0, mean / downside, np.where(mean > 0, np.inf, np.nan)),
+                'win_rate': state[WINS] / count * 100,
+                'profit_factor': np.where(state[GROSS_LOSS] > 0, state[GROSS_PROFIT] / state[GROSS_LOSS],
+                                          np.where(count > 0, np.inf, np.nan)),
+                'max_drawdown': np.where(count > 0, state[MAX_DRAWDOWN], np.nan),
+                'expectancy': mean,
+            }
+    
+    def value(self, strategy_id: str, metric: str) -> Optional[float]:
+        """Get one metric of a strategy, or None without closed trades or when undefined."""
+        row = self.row_by_strategy.get(strategy_id)
+        if row is None:
+            return None
+        if self.cached_version != self.version:
+            self.cached = {name: np.where(np.isnan(values), None, values.astype(object)).tolist()
+                           for name, values in self.metrics().items()}
+            self.cached_version = self.version
+        return self.cached[metric][row]
+    
+    def get(self, strategy_id: str) -> Optional[Dict[str, Optional[float]]]:
+        """Get every metric of a strategy, or None if it has no closed trades."""
+        if strategy_id not in self.row_by_strategy:
+            return None
+        return {name: self.value(strategy_id, name) for name in METRICS}
+    
+    def restore(self, strategy_ids: Iterable[str], state: np.ndarray):
+        """Replace the totals with ones computed elsewhere, e.g. by the engine."""
+        self.row_by_strategy = {}
+        self.size = 0
+        self.state = np.zeros((len(FIELDS), max(64, state.shape[1])))
+        for strategy_id in strategy_ids:
+            self._row(strategy_id)
+        self.state[:, :self.size] = state
+        self.version += 1
+    
+    def _row(self, strategy_id: str) -> int:
+        """Get a strategy's row, adding an empty one the first time it is seen."""
+        row = self.row_by_strategy.get(strategy_id)
+        if row is None:
+            if self.size == self.state.shape[1]:
+                grown = np.zeros((len(FIELDS), 2 * self.size))
+                grown[:, :self.size] = self.state
+                self.state = grown
+            row = self.row_by_strategy[strategy_id] = self.size
+            self.size += 1
+        return row
\ No newline at end of file